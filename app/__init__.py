@@ -24,6 +24,12 @@ def create_app():
     app.config['ACCOUNTS_FILE'] = "config/accounts.json"
     app.config['DOWNLOADS_DIR'] = "downloads"
     app.config['LOCAL_LIBRARY_PATH'] = os.environ.get('LOCAL_LIBRARY_PATH', '')
+    # Origin allowed to open the progress stream cross-origin; same-origin needs none
+    app.config['SSE_ALLOWED_ORIGIN'] = os.environ.get('SSE_ALLOWED_ORIGIN', '')
+
+    # Use orjson for jsonify/get_json when it is installed
+    from utils.json_provider import init_json_provider
+    init_json_provider(app)
     
     # Initialize extensions
     csrf = CSRFProtect(app)
@@ -18,6 +18,18 @@ class DownloadState(Enum):
     ERROR = "error"
 
 
+# Raw state values grouped the way queue statistics count them
+QUEUED_DOWNLOAD_STATES = frozenset({DownloadState.PENDING.value, DownloadState.RETRYING.value})
+ACTIVE_DOWNLOAD_STATES = frozenset({
+    DownloadState.LICENSE_REQUESTED.value,
+    DownloadState.LICENSE_GRANTED.value,
+    DownloadState.DOWNLOADING.value,
+    DownloadState.DOWNLOAD_COMPLETE.value,
+    DownloadState.DECRYPTING.value,
+})
+FINISHED_DOWNLOAD_STATES = frozenset({DownloadState.CONVERTED.value, DownloadState.ERROR.value})
+
+
 class BookStatus(Enum):
     """
     High-level status of a book in the library.
@@ -8,16 +8,28 @@ Responsibilities:
 - Library scan: walk M4B files on disk, update statuses, mark missing files
 """
 
+import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.models import BookStatus, DownloadState
-from utils.db import get_db, transaction
-from utils.fuzzy_matching import normalize_for_matching, calculate_similarity
+from utils.db import get_db, get_db_path, transaction
+from utils.fuzzy_matching import (
+    DISJOINT_WORDS_MAX_SIMILARITY, calculate_similarity, normalize_for_matching, word_set,
+)
 from .metadata_enricher import MetadataEnricher
 
+# Duplicate indexes by (database, resolved library path), shared by every
+# LibraryManager. An entry is reused while the downloaded books are unchanged
+# and it is younger than the TTL, which bounds how long a file deleted behind
+# the app's back can still count as a duplicate.
+DUPLICATE_INDEX_TTL_SECONDS = 300
+_duplicate_indexes: Dict[Tuple, Tuple[Tuple, float, Dict]] = {}
+_duplicate_indexes_lock = threading.Lock()
+
 
 class LibraryManager:
     """
@@ -159,31 +171,33 @@ class LibraryManager:
     # Duplicate detection
     # ------------------------------------------------------------------
 
-    def check_fuzzy_duplicate(
-        self,
-        book_title: str,
-        book_authors: str,
-        target_library_path: str,
-        threshold: float = 0.85,
-    ) -> Optional[Tuple[str, str, float]]:
+    def build_duplicate_index(self, target_library_path: str) -> Dict:
         """
-        Check if a book with a similar title already exists in the same library.
+        Snapshot what duplicate checks need so a batch of files can be
+        checked without re-querying the database or re-statting every
+        library file per candidate.
 
-        Only compares books within the same library path to allow different
-        language versions to coexist in separate libraries.
+        Args:
+            target_library_path: Library directory fuzzy candidates must live in.
 
         Returns:
-            (asin, file_path, similarity_score) if a match is found, else None.
+            Dict with ``asins`` (ASIN → file path of every downloaded book),
+            ``titles`` (list of (asin, file_path, normalized_title) for
+            downloaded books present on disk inside the target library) and
+            ``title_words`` (title word → positions in ``titles``).
         """
-        normalized_title = normalize_for_matching(book_title)
         target_lib = str(Path(target_library_path).resolve())
+        asins: Dict[str, str] = {}
+        titles: List[Tuple[str, str, str]] = []
+        title_words: Dict[str, List[int]] = defaultdict(list)
 
         db = get_db()
         for row in db.execute(
-            "SELECT asin, title, file_path FROM books WHERE status=? AND file_path IS NOT NULL",
+            "SELECT asin, title, file_path FROM books WHERE status=?",
             (BookStatus.DOWNLOADED.value,),
         ):
             stored_path = row["file_path"]
+            asins[row["asin"]] = stored_path or ""
             if not stored_path or not Path(stored_path).exists():
                 continue
 
@@ -195,11 +209,84 @@ class LibraryManager:
             except Exception:
                 continue
 
-            title_similarity = calculate_similarity(
-                normalized_title, normalize_for_matching(row["title"])
-            )
+            normalized_title = normalize_for_matching(row["title"])
+            for word in word_set(normalized_title):
+                title_words[word].append(len(titles))
+            titles.append((row["asin"], stored_path, normalized_title))
+
+        return {"asins": asins, "titles": titles, "title_words": title_words}
+
+    def get_duplicate_index(self, target_library_path: str) -> Dict:
+        """
+        Return a shared build_duplicate_index() result for the library,
+        rebuilding it only when downloaded books changed or it has expired.
+
+        Any write to the books table changes the count or the updated_at
+        total of downloaded rows, so one aggregate query replaces the per-book
+        stat walk on repeat calls. The returned dict must not be modified.
+        """
+        key = (get_db_path(), str(Path(target_library_path).resolve()))
+        fingerprint = tuple(get_db().execute(
+            "SELECT COUNT(*), TOTAL(updated_at) FROM books WHERE status=?",
+            (BookStatus.DOWNLOADED.value,),
+        ).fetchone())
+        now = time.monotonic()
+
+        with _duplicate_indexes_lock:
+            cached = _duplicate_indexes.get(key)
+        if (
+            cached is not None
+            and cached[0] == fingerprint
+            and now - cached[1] < DUPLICATE_INDEX_TTL_SECONDS
+        ):
+            return cached[2]
+
+        index = self.build_duplicate_index(target_library_path)
+        with _duplicate_indexes_lock:
+            _duplicate_indexes[key] = (fingerprint, now, index)
+        return index
+
+    def check_fuzzy_duplicate(
+        self,
+        book_title: str,
+        book_authors: str,
+        target_library_path: str,
+        threshold: float = 0.85,
+        index: Optional[Dict] = None,
+    ) -> Optional[Tuple[str, str, float]]:
+        """
+        Check if a book with a similar title already exists in the same library.
+
+        Only compares books within the same library path to allow different
+        language versions to coexist in separate libraries.
+
+        Args:
+            index: Optional result of build_duplicate_index() for the same
+                   library path; the shared get_duplicate_index() when omitted.
+
+        Returns:
+            (asin, file_path, similarity_score) if a match is found, else None.
+        """
+        normalized_title = normalize_for_matching(book_title)
+        if index is None:
+            index = self.get_duplicate_index(target_library_path)
+
+        titles = index["titles"]
+        if threshold > DISJOINT_WORDS_MAX_SIMILARITY:
+            # Titles sharing no word with this one cannot reach the threshold;
+            # score only the union of its words' postings, in library order
+            title_words = index["title_words"]
+            positions = set()
+            for word in word_set(normalized_title):
+                positions.update(title_words.get(word, ()))
+            candidates = [titles[i] for i in sorted(positions)]
+        else:
+            candidates = titles
+
+        for asin, stored_path, stored_title in candidates:
+            title_similarity = calculate_similarity(normalized_title, stored_title)
             if title_similarity >= threshold:
-                return (row["asin"], stored_path, title_similarity)
+                return (asin, stored_path, title_similarity)
 
         return None
 
@@ -353,7 +440,12 @@ class LibraryManager:
     def _upsert_scan_cache(
         self, m4b_file: Path, library_name: str, asin: Optional[str], now: float
     ) -> None:
-        """Insert or replace a scan_cache row for the given file."""
+        """
+        Insert or replace a scan_cache row for the given file.
+
+        The row's mtime_ns is cleared so the library scanner re-reads the file
+        instead of reusing these raw tag values as its own.
+        """
         try:
             from mutagen.mp4 import MP4
             audio = MP4(str(m4b_file))
@@ -387,6 +479,7 @@ class LibraryManager:
                     language     = excluded.language,
                     file_size    = excluded.file_size,
                     duration_sec = excluded.duration_sec,
+                    mtime_ns     = NULL,
                     last_scanned = excluded.last_scanned
                 """,
                 (
@@ -8,6 +8,7 @@ This service is responsible for:
 - Exporting content metadata to JSON files
 """
 
+import asyncio
 import json
 import re
 from pathlib import Path
@@ -15,6 +16,8 @@ from typing import Optional, Dict
 from mutagen.mp4 import MP4
 import audible
 
+from utils.rate_limit import audible_api_limiter
+
 
 class MetadataEnricher:
     """
@@ -100,67 +103,74 @@ class MetadataEnricher:
             asin: Amazon Standard Identification Number
         """
         try:
-            book_details = await client.get(
-                f"catalog/products/{asin}",
-                params={"response_groups": "product_attrs,product_desc,contributors,media,series"}
-            )
+            async with audible_api_limiter:
+                book_details = await client.get(
+                    f"catalog/products/{asin}",
+                    params={"response_groups": "product_attrs,product_desc,contributors,media,series"}
+                )
             product = book_details.get('product', {})
-            audiobook = MP4(str(m4b_file))
-
-            # Title
-            if product.get('title'):
-                audiobook['©nam'] = [product['title']]
-                audiobook['©alb'] = [product['title']]
-
-            # Subtitle
-            if product.get('subtitle'):
-                audiobook['----:com.apple.iTunes:SUBTITLE'] = [product['subtitle'].encode('utf-8')]
-
-            # Authors
-            if product.get('authors'):
-                audiobook['©ART'] = [', '.join(a['name'] for a in product['authors'])]
-
-            # Narrators (use custom iTunes tag, NOT ©gen which is Genre)
-            if product.get('narrators'):
-                narrator_str = ', '.join(n['name'] for n in product['narrators'])
-                audiobook['----:com.apple.iTunes:NARRATOR'] = [narrator_str.encode('utf-8')]
-
-            # Publisher
-            if product.get('publisher_name'):
-                audiobook['©pub'] = [product['publisher_name']]
-
-            # Release date and year
-            if product.get('release_date'):
-                audiobook['©day'] = [product['release_date']]
-                # Extract year for publish year field
-                year = product['release_date'].split('-')[0]
-                audiobook['©yer'] = [year]
-
-            # Description
-            if product.get('publisher_summary'):
-                audiobook['desc'] = [product['publisher_summary'][:255]]
-
-            # Series
-            if product.get('series'):
-                series = product['series'][0]
-                audiobook['©grp'] = [f"{series['title']} #{series['sequence']}"]
-
-            # Language
-            if product.get('language'):
-                audiobook['----:com.apple.iTunes:LANGUAGE'] = [product['language'].encode('utf-8')]
-
-            # ISBN (if available)
-            if product.get('isbn'):
-                audiobook['----:com.apple.iTunes:ISBN'] = [product['isbn'].encode('utf-8')]
-
-            # ASIN
-            audiobook['©cmt'] = [f"ASIN: {asin}"]
-            audiobook['----:com.apple.iTunes:ASIN'] = [asin.encode('utf-8')]
-
-            # Media type (2 = Audiobook)
-            audiobook['stik'] = [2]
-
-            audiobook.save()
+            # Parsing and rewriting the file is blocking I/O; run it off the event loop
+            await asyncio.to_thread(MetadataEnricher._write_enhanced_tags, m4b_file, product, asin)
             print(f"✓ Metadata added successfully")
         except Exception as e:
             print(f"⚠️  Could not add enhanced metadata: {e}")
+
+    @staticmethod
+    def _write_enhanced_tags(m4b_file: Path, product: Dict, asin: str) -> None:
+        """Embed Audible product details into the M4B file's tags (blocking)."""
+        audiobook = MP4(str(m4b_file))
+
+        # Title
+        if product.get('title'):
+            audiobook['©nam'] = [product['title']]
+            audiobook['©alb'] = [product['title']]
+
+        # Subtitle
+        if product.get('subtitle'):
+            audiobook['----:com.apple.iTunes:SUBTITLE'] = [product['subtitle'].encode('utf-8')]
+
+        # Authors
+        if product.get('authors'):
+            audiobook['©ART'] = [', '.join(a['name'] for a in product['authors'])]
+
+        # Narrators (use custom iTunes tag, NOT ©gen which is Genre)
+        if product.get('narrators'):
+            narrator_str = ', '.join(n['name'] for n in product['narrators'])
+            audiobook['----:com.apple.iTunes:NARRATOR'] = [narrator_str.encode('utf-8')]
+
+        # Publisher
+        if product.get('publisher_name'):
+            audiobook['©pub'] = [product['publisher_name']]
+
+        # Release date and year
+        if product.get('release_date'):
+            audiobook['©day'] = [product['release_date']]
+            # Extract year for publish year field
+            year = product['release_date'].split('-')[0]
+            audiobook['©yer'] = [year]
+
+        # Description
+        if product.get('publisher_summary'):
+            audiobook['desc'] = [product['publisher_summary'][:255]]
+
+        # Series
+        if product.get('series'):
+            series = product['series'][0]
+            audiobook['©grp'] = [f"{series['title']} #{series['sequence']}"]
+
+        # Language
+        if product.get('language'):
+            audiobook['----:com.apple.iTunes:LANGUAGE'] = [product['language'].encode('utf-8')]
+
+        # ISBN (if available)
+        if product.get('isbn'):
+            audiobook['----:com.apple.iTunes:ISBN'] = [product['isbn'].encode('utf-8')]
+
+        # ASIN
+        audiobook['©cmt'] = [f"ASIN: {asin}"]
+        audiobook['----:com.apple.iTunes:ASIN'] = [asin.encode('utf-8')]
+
+        # Media type (2 = Audiobook)
+        audiobook['stik'] = [2]
+
+        audiobook.save()
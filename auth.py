@@ -2,6 +2,10 @@ import asyncio
 import audible
 from pathlib import Path
 import json
+from utils.account_manager import find_cached_authenticator
+from utils.async_runner import coalesce
+from utils.oauth_flow import locale_for_region
+from utils.rate_limit import audible_api_limiter
 
 class AudibleAuth:
     def __init__(self, account_name, region="us"):
@@ -9,19 +13,19 @@ class AudibleAuth:
         self.region = region
         # Store auth files in config/auth/{account_name}/ for better organization
         self.config_dir = Path("config") / "auth" / account_name
-        self.config_dir.mkdir(parents=True, exist_ok=True)
         self.auth_file = self.config_dir / "auth.json"
     
     async def authenticate(self):
         """Authenticate with Audible using device registration"""
         try:
             # Try to load existing auth
-            if self.auth_file.exists():
-                auth = audible.Authenticator.from_file(self.auth_file)
+            auth = find_cached_authenticator(self.auth_file)
+            if auth is not None:
                 # Test the authentication
                 async with audible.AsyncClient(auth=auth) as client:
                     # Try to make a simple API call to verify auth works
-                    library = await client.library(num_results=1)
+                    async with audible_api_limiter:
+                        library = await client.library(num_results=1)
                     return auth
             
             # If no existing auth or it failed, start new authentication
@@ -33,24 +37,8 @@ class AudibleAuth:
             print("4. After successful login, you'll see a success page")
             print("5. Return to this page - authentication will complete automatically")
             
-            # Map region codes to locale names
-            region_map = {
-                'us': 'united_states',
-                'uk': 'united_kingdom', 
-                'de': 'germany',
-                'fr': 'france',
-                'ca': 'canada',
-                'it': 'italy',
-                'au': 'australia',
-                'in': 'india',
-                'jp': 'japan',
-                'es': 'spain',
-                'br': 'brazil'
-            }
-            
-            locale_name = region_map.get(self.region.lower(), 'united_states')
-            locale_template = audible.localization.LOCALE_TEMPLATES[locale_name]
-            locale = audible.localization.Locale(**locale_template)
+            # Region codes are Audible country codes; unknown regions fall back to the US store
+            locale = locale_for_region(self.region.lower()) or locale_for_region('us')
             
             # Use the external browser authentication method
             auth = audible.Authenticator.from_login_external(
@@ -59,6 +47,7 @@ class AudibleAuth:
             )
             
             # Save the authentication
+            self.config_dir.mkdir(parents=True, exist_ok=True)
             auth.to_file(self.auth_file, encryption=False)
             
             return auth
@@ -74,13 +63,14 @@ class AudibleAuth:
                 print("📚 Fetching your Audible library...")
                 
                 # Fetch library with relevant response groups
-                library = await client.get(
-                    path="library", 
-                    params={
-                        "num_results": 1000,  # Get all books
-                        "response_groups": "product_desc,product_attrs,media,series,contributors"
-                    }
-                )
+                async with audible_api_limiter:
+                    library = await client.get(
+                        path="library", 
+                        params={
+                            "num_results": 1000,  # Get all books
+                            "response_groups": "product_desc,product_attrs,media,series,contributors"
+                        }
+                    )
                 
                 # Extract and format the book data
                 books = []
@@ -156,17 +146,23 @@ class AudibleAuth:
     
     def load_auth(self):
         """Load existing authentication"""
-        if self.auth_file.exists():
-            return audible.Authenticator.from_file(self.auth_file)
-        return None
+        return find_cached_authenticator(self.auth_file)
 
 async def authenticate_account(account_name, region):
     """Helper function to authenticate an account"""
+    # Repeated clicks share the login already in progress for this account
+    return await coalesce(('authenticate', account_name, region), lambda: _authenticate_account(account_name, region))
+
+async def _authenticate_account(account_name, region):
     auth_handler = AudibleAuth(account_name, region)
     return await auth_handler.authenticate()
 
 async def fetch_library(account_name, region):
     """Helper function to fetch library for an account"""
+    # Concurrent fetches for the same account share one Audible API call
+    return await coalesce(('fetch_library', account_name, region), lambda: _fetch_library(account_name, region))
+
+async def _fetch_library(account_name, region):
     auth_handler = AudibleAuth(account_name, region)
     auth = auth_handler.load_auth()
     
@@ -8,21 +8,24 @@ import json
 import shutil
 from enum import Enum
 from mutagen.mp4 import MP4
-import httpx
 import base64
 from Crypto.Cipher import AES
 from asyncio import Semaphore
 import time
 import hashlib
+import threading
 import unicodedata
 from typing import Optional, Dict, List, Tuple, Any
 from settings import get_naming_pattern
 from datetime import datetime
 from utils.fuzzy_matching import normalize_for_matching, calculate_similarity
 from utils.constants import CONFIG_DIR, DOWNLOAD_QUEUE_FILE, get_auth_file_path
-from app.models import DownloadState, BookStatus
+from app.models import DownloadState, BookStatus, QUEUED_DOWNLOAD_STATES, ACTIVE_DOWNLOAD_STATES
 from app.services import PathBuilder, AudioConverter, MetadataEnricher, LibraryManager
 from utils.queue_base import BaseQueueManager
+from utils.account_manager import find_cached_authenticator
+from utils.http_client import get_download_client
+from utils.rate_limit import audible_api_limiter
 
 
 class DownloadQueueManager(BaseQueueManager):
@@ -30,6 +33,9 @@ class DownloadQueueManager(BaseQueueManager):
     Singleton manager for download queue and progress tracking.
     Provides persistent state storage shared across all downloader instances.
     """
+
+    # (queue version, stats) from the last get_statistics() scan
+    _stats_cache = None
     
     def __init__(self):
         # Initialize base class with queue file path
@@ -65,7 +71,12 @@ class DownloadQueueManager(BaseQueueManager):
         self.add_to_queue(asin, title, DownloadState.PENDING.value, **metadata)
     
     def get_statistics(self) -> Dict:
-        """Get download statistics"""
+        """Get download statistics, rescanning the queue only after it changed"""
+        version = self.version
+        cached = self._stats_cache
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+
         batch_info = self.get_batch_info()
         current_batch_id = batch_info.get('current_batch_id')
         
@@ -92,9 +103,9 @@ class DownloadQueueManager(BaseQueueManager):
             stats['total_downloads'] += 1
             state = download.get('state', '')
             
-            if state in ['pending', 'retrying']:
+            if state in QUEUED_DOWNLOAD_STATES:
                 stats['queued'] += 1
-            elif state in ['license_requested', 'license_granted', 'downloading', 'download_complete', 'decrypting']:
+            elif state in ACTIVE_DOWNLOAD_STATES:
                 stats['active'] += 1
                 # Add up download speeds for active downloads
                 if 'speed' in download:
@@ -111,7 +122,8 @@ class DownloadQueueManager(BaseQueueManager):
                 self.mark_batch_complete()
                 stats['batch_complete'] = True
         
-        return stats
+        self._stats_cache = (version, stats)
+        return dict(stats)
     
     def clear_completed(self, older_than_hours: int = 24):
         """Remove completed downloads older than specified hours"""
@@ -148,15 +160,17 @@ class AudiobookDownloader:
         self.metadata_enricher = MetadataEnricher()
         self.library_manager = LibraryManager(self.library_path, self.account_name)
 
-        # Backward compatibility: dict view over SQLite books (via lazy library_state)
-        self.library_state = self.library_manager.library_state
-
         # Use shared queue manager for download progress tracking (persisted to disk)
         self.queue_manager = DownloadQueueManager()
 
         # Track download start times for elapsed time reporting
         self.download_start_times = {}
 
+    @property
+    def library_state(self) -> Dict:
+        """Backward compatibility: lazy dict view over the SQLite books table."""
+        return self.library_manager.library_state
+
     @staticmethod
     def _format_bytes(bytes_value: int) -> str:
         """Format bytes to human-readable format."""
@@ -190,10 +204,14 @@ class AudiobookDownloader:
 
     def _load_authenticator(self) -> Optional[audible.Authenticator]:
         """Loads the authenticator object from file."""
-        auth_file = get_auth_file_path(self.account_name)
-        if auth_file.exists():
-            return audible.Authenticator.from_file(auth_file)
-        return None
+        return find_cached_authenticator(get_auth_file_path(self.account_name))
+
+    def refresh_auth(self) -> None:
+        """Reload credentials if the account's auth file changed since they were loaded."""
+        auth = self._load_authenticator()
+        if auth is not self.auth:
+            self.auth = auth
+            self._auth_details = self._load_auth_details() if auth is not None else None
 
     def _load_auth_details(self) -> Optional[Dict]:
         """Loads the raw auth JSON file for details not exposed by the authenticator."""
@@ -243,8 +261,6 @@ class AudiobookDownloader:
     def add_to_library(self, asin: str, title: str, file_path: str, **metadata):
         """Add a book to the library state and persist to disk"""
         self.library_manager.add_to_library(asin, title, file_path, **metadata)
-        # Update the exposed library_state for backward compatibility
-        self.library_state = self.library_manager.library_state
     
     def set_download_state(self, asin: str, state: DownloadState, **metadata):
         # Check if this is a new download
@@ -283,9 +299,13 @@ class AudiobookDownloader:
 
         self.queue_manager.update_download(asin, progress_data)
 
-    def _check_fuzzy_duplicate(self, book_title: str, book_authors: str, target_library_path: str, threshold: float = 0.85) -> Optional[Tuple[str, str, float]]:
+    def _check_fuzzy_duplicate(self, book_title: str, book_authors: str, target_library_path: str, threshold: float = 0.85, index: Optional[Dict] = None) -> Optional[Tuple[str, str, float]]:
         """Delegate to LibraryManager for fuzzy duplicate checking"""
-        return self.library_manager.check_fuzzy_duplicate(book_title, book_authors, target_library_path, threshold)
+        return self.library_manager.check_fuzzy_duplicate(book_title, book_authors, target_library_path, threshold, index=index)
+
+    def build_duplicate_index(self, target_library_path: str) -> Dict:
+        """Delegate to LibraryManager for a reusable duplicate-check snapshot"""
+        return self.library_manager.get_duplicate_index(target_library_path)
 
     @staticmethod
     def extract_asin_from_m4b(file_path: Path) -> Optional[str]:
@@ -294,15 +314,11 @@ class AudiobookDownloader:
 
     def sync_library(self) -> Dict:
         """Delegate to LibraryManager for library syncing"""
-        stats = self.library_manager.sync_library()
-        # Update the exposed library_state for backward compatibility
-        self.library_state = self.library_manager.library_state
-        return stats
+        return self.library_manager.sync_library()
 
     def _invalidate_library_state(self) -> None:
         """Refresh the local library_state cache after an out-of-band DB update."""
         self.library_manager._invalidate_cache()
-        self.library_state = self.library_manager.library_state
 
     def _get_file_paths(self, book_title: str, asin: str, product: Dict = None) -> Dict[str, Path]:
         """Delegate to PathBuilder for file path construction"""
@@ -317,7 +333,8 @@ class AudiobookDownloader:
     async def _get_download_license(self, client, asin: str, quality: str):
         quality = self.audio_converter.validate_quality_setting(quality)
         license_request = {"drm_type": "Adrm", "consumption_type": "Download", "quality": quality}
-        response = await client.post(f"content/{asin}/licenserequest", body=license_request)
+        async with audible_api_limiter:
+            response = await client.post(f"content/{asin}/licenserequest", body=license_request)
 
         content_license = response.get("content_license", {})
         if content_license.get("status_code") != "Granted":
@@ -334,82 +351,82 @@ class AudiobookDownloader:
     async def _download_file(self, url: str, filename: Path, asin: str = None, title: str = None):
         headers = {"User-Agent": "Audible/671 CFNetwork/1240.0.4 Darwin/20.6.0"}
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                async with client.stream("GET", url, headers=headers) as response:
-                    response.raise_for_status()
-
-                    # Get total file size from headers
-                    total_bytes = None
-                    content_length = response.headers.get('content-length')
-                    if content_length:
-                        total_bytes = int(content_length)
-
-                    filename.parent.mkdir(parents=True, exist_ok=True)
-                    downloaded_bytes = 0
-                    download_start_time = time.time()
-                    last_log_time = download_start_time
-                    last_logged_percent = 0
-
-                    # Truncate title for display (max 40 chars)
-                    display_title = title[:37] + "..." if title and len(title) > 40 else title
-
-                    # Log initial download start
-                    if asin and total_bytes:
-                        if display_title:
-                            self._log(f"📥 [{display_title}] Downloading {self._format_bytes(total_bytes)}...", asin)
-                        else:
-                            self._log(f"📥 Downloading {self._format_bytes(total_bytes)}...", asin)
-
-                    with open(filename, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
-                            f.write(chunk)
-                            downloaded_bytes += len(chunk)
-
-                            # Update progress if we have an asin
-                            if asin:
-                                # Calculate download speed and ETA
-                                current_time = time.time()
-                                elapsed = current_time - download_start_time
-                                speed = downloaded_bytes / elapsed if elapsed > 0 else 0
-                                eta = (total_bytes - downloaded_bytes) / speed if speed > 0 and total_bytes else 0
-                                
-                                # Update progress with speed and ETA
-                                self.update_download_progress(
-                                    asin, 
-                                    downloaded_bytes, 
-                                    total_bytes,
-                                    speed=speed,
-                                    eta=eta,
-                                    elapsed=elapsed
-                                )
-
-                                # Log progress every 10% or every 5 seconds
-                                if total_bytes and total_bytes > 0:
-                                    percent = (downloaded_bytes / total_bytes) * 100
-                                    percent_milestone = int(percent / 10) * 10  # Round down to nearest 10%
-
-                                    if (percent_milestone > last_logged_percent and percent_milestone % 10 == 0) or \
-                                       (current_time - last_log_time > 5):
-                                        downloaded_str = self._format_bytes(downloaded_bytes)
-                                        total_str = self._format_bytes(total_bytes)
-                                        speed_str = self._format_bytes(speed)
-
-                                        if display_title:
-                                            self._log(f"   [{display_title}] {downloaded_str}/{total_str} ({percent:.1f}%) @ {speed_str}/s", asin)
-                                        else:
-                                            self._log(f"   Progress: {downloaded_str}/{total_str} ({percent:.1f}%) @ {speed_str}/s", asin)
-                                        last_log_time = current_time
-                                        last_logged_percent = percent_milestone
-
-                    # Log completion with average speed
-                    if asin:
-                        total_elapsed = time.time() - download_start_time
-                        avg_speed = downloaded_bytes / total_elapsed if total_elapsed > 0 else 0
-                        avg_speed_str = self._format_bytes(avg_speed)
-                        if display_title:
-                            self._log(f"✓ [{display_title}] Complete: {self._format_bytes(downloaded_bytes)} (avg {avg_speed_str}/s)", asin)
-                        else:
-                            self._log(f"✓ Download complete: {self._format_bytes(downloaded_bytes)} (avg {avg_speed_str}/s)", asin)
+            client = get_download_client()
+            async with client.stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+
+                # Get total file size from headers
+                total_bytes = None
+                content_length = response.headers.get('content-length')
+                if content_length:
+                    total_bytes = int(content_length)
+
+                filename.parent.mkdir(parents=True, exist_ok=True)
+                downloaded_bytes = 0
+                download_start_time = time.time()
+                last_log_time = download_start_time
+                last_logged_percent = 0
+
+                # Truncate title for display (max 40 chars)
+                display_title = title[:37] + "..." if title and len(title) > 40 else title
+
+                # Log initial download start
+                if asin and total_bytes:
+                    if display_title:
+                        self._log(f"📥 [{display_title}] Downloading {self._format_bytes(total_bytes)}...", asin)
+                    else:
+                        self._log(f"📥 Downloading {self._format_bytes(total_bytes)}...", asin)
+
+                with open(filename, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        f.write(chunk)
+                        downloaded_bytes += len(chunk)
+
+                        # Update progress if we have an asin
+                        if asin:
+                            # Calculate download speed and ETA
+                            current_time = time.time()
+                            elapsed = current_time - download_start_time
+                            speed = downloaded_bytes / elapsed if elapsed > 0 else 0
+                            eta = (total_bytes - downloaded_bytes) / speed if speed > 0 and total_bytes else 0
+                            
+                            # Update progress with speed and ETA
+                            self.update_download_progress(
+                                asin, 
+                                downloaded_bytes, 
+                                total_bytes,
+                                speed=speed,
+                                eta=eta,
+                                elapsed=elapsed
+                            )
+
+                            # Log progress every 10% or every 5 seconds
+                            if total_bytes and total_bytes > 0:
+                                percent = (downloaded_bytes / total_bytes) * 100
+                                percent_milestone = int(percent / 10) * 10  # Round down to nearest 10%
+
+                                if (percent_milestone > last_logged_percent and percent_milestone % 10 == 0) or \
+                                   (current_time - last_log_time > 5):
+                                    downloaded_str = self._format_bytes(downloaded_bytes)
+                                    total_str = self._format_bytes(total_bytes)
+                                    speed_str = self._format_bytes(speed)
+
+                                    if display_title:
+                                        self._log(f"   [{display_title}] {downloaded_str}/{total_str} ({percent:.1f}%) @ {speed_str}/s", asin)
+                                    else:
+                                        self._log(f"   Progress: {downloaded_str}/{total_str} ({percent:.1f}%) @ {speed_str}/s", asin)
+                                    last_log_time = current_time
+                                    last_logged_percent = percent_milestone
+
+                # Log completion with average speed
+                if asin:
+                    total_elapsed = time.time() - download_start_time
+                    avg_speed = downloaded_bytes / total_elapsed if total_elapsed > 0 else 0
+                    avg_speed_str = self._format_bytes(avg_speed)
+                    if display_title:
+                        self._log(f"✓ [{display_title}] Complete: {self._format_bytes(downloaded_bytes)} (avg {avg_speed_str}/s)", asin)
+                    else:
+                        self._log(f"✓ Download complete: {self._format_bytes(downloaded_bytes)} (avg {avg_speed_str}/s)", asin)
 
         except Exception as e:
             if filename.exists():
@@ -560,7 +577,8 @@ class AudiobookDownloader:
 
             # Move M4B from temp to final library location
             self._log(f"📁 Moving to library...", asin)
-            self._move_to_library(temp_m4b_file, final_m4b_file, title, asin)
+            # A move across filesystems is a full copy; keep it off the shared loop
+            await asyncio.to_thread(self._move_to_library, temp_m4b_file, final_m4b_file, title, asin)
 
             # Add to library state (persisted to SQLite books table for duplicate detection)
             self.add_to_library(asin, title, str(final_m4b_file))
@@ -657,6 +675,43 @@ def count_successful_batch_downloads(results: List[Any]) -> int:
     return sum(1 for r in results if r and not isinstance(r, BaseException))
 
 
+# One downloader per (account, region, library, downloads dir), reused across requests
+_DOWNLOADERS: Dict[Tuple[str, str, str, Optional[str]], AudiobookDownloader] = {}
+_DOWNLOADERS_LOCK = threading.Lock()
+
+
+def get_downloader(account_name, region, library_path, downloads_dir=None) -> AudiobookDownloader:
+    """
+    Return the shared AudiobookDownloader for an account and library.
+
+    Instances are created on first use and kept for the life of the process, so
+    concurrent batches for the same account and library share one set of
+    download/decrypt semaphores. Credentials are reloaded when the account's
+    auth file changes (e.g. after re-authenticating).
+
+    Args:
+        account_name: Audible account name
+        region: Audible region (e.g., 'us', 'uk')
+        library_path: Final library path where M4B files will be stored
+        downloads_dir: Temporary download directory (defaults to 'downloads/')
+
+    Returns:
+        The cached AudiobookDownloader
+    """
+    if not library_path:
+        raise ValueError("library_path is required. Please configure a library before downloading.")
+
+    key = (account_name, region, str(library_path), str(downloads_dir) if downloads_dir else None)
+    with _DOWNLOADERS_LOCK:
+        downloader = _DOWNLOADERS.get(key)
+        if downloader is None:
+            downloader = AudiobookDownloader(account_name, region, library_path=library_path, downloads_dir=downloads_dir)
+            _DOWNLOADERS[key] = downloader
+            return downloader
+    downloader.refresh_auth()
+    return downloader
+
+
 async def download_books(account_name, region, selected_books, quality="High", cleanup_aax=True, max_retries=3, library_path=None, downloads_dir=None):
     """
     Download multiple audiobooks.
@@ -674,12 +729,7 @@ async def download_books(account_name, region, selected_books, quality="High", c
     if not library_path:
         raise ValueError("library_path is required. Please configure a library before downloading.")
 
-    downloader = AudiobookDownloader(
-        account_name,
-        region,
-        library_path=library_path,
-        downloads_dir=downloads_dir
-    )
+    downloader = get_downloader(account_name, region, library_path, downloads_dir=downloads_dir)
 
     # Log batch summary
     timestamp = datetime.now().strftime("%H:%M:%S")
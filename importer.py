@@ -11,8 +11,13 @@ import json
 import shutil
 import time
 import logging
+import os
+import stat
 import unicodedata
 import re
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from mutagen.mp4 import MP4
@@ -20,10 +25,12 @@ from enum import Enum
 from utils.fuzzy_matching import normalize_for_matching, calculate_similarity
 from utils.audio_metadata import get_mp4_tag
 
-from downloader import AudiobookDownloader
+from downloader import get_downloader
 from library_scanner import LocalLibraryScanner
 from utils.queue_base import BaseQueueManager
-from utils.constants import CONFIG_DIR
+from utils.constants import CONFIG_DIR, CATALOG_SEARCH_CACHE_SIZE, CATALOG_SEARCH_CACHE_TTL_SECONDS
+from utils.account_manager import find_cached_authenticator
+from utils.rate_limit import audible_api_limiter
 from app.services import PathBuilder
 
 logger = logging.getLogger(__name__)
@@ -41,6 +48,42 @@ class ImportState(Enum):
     SKIPPED = "skipped"
 
 
+# Catalog search results by (region, normalized query, num_results), oldest
+# first; re-running a match on the same scan reuses them instead of the API
+_catalog_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[Dict]]]" = OrderedDict()
+_catalog_cache_lock = threading.Lock()
+_QUERY_WS_RE = re.compile(r'\s+')
+
+
+def _catalog_cache_key(region: str, query: str, num_results: int) -> Tuple[str, str, int]:
+    return (region, _QUERY_WS_RE.sub(' ', query.lower()).strip(), num_results)
+
+
+def _get_cached_search(key: Tuple[str, str, int]) -> Optional[List[Dict]]:
+    with _catalog_cache_lock:
+        entry = _catalog_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, products = entry
+        if time.monotonic() - stored_at > CATALOG_SEARCH_CACHE_TTL_SECONDS:
+            del _catalog_cache[key]
+            return None
+        _catalog_cache.move_to_end(key)
+        return list(products)
+
+
+def _store_cached_search(key: Tuple[str, str, int], products: List[Dict]) -> None:
+    with _catalog_cache_lock:
+        _catalog_cache[key] = (time.monotonic(), list(products))
+        _catalog_cache.move_to_end(key)
+        while len(_catalog_cache) > CATALOG_SEARCH_CACHE_SIZE:
+            _catalog_cache.popitem(last=False)
+
+
+QUEUED_IMPORT_STATES = frozenset({ImportState.PENDING.value, ImportState.SCANNING.value})
+ACTIVE_IMPORT_STATES = frozenset({ImportState.MATCHING.value, ImportState.MATCHED.value, ImportState.IMPORTING.value})
+
+
 class ImportQueueManager(BaseQueueManager):
     """
     Singleton manager for import queue and progress tracking.
@@ -128,9 +171,9 @@ class ImportQueueManager(BaseQueueManager):
             stats['total_imports'] += 1
             state = import_data.get('state', '')
             
-            if state in ['pending', 'scanning']:
+            if state in QUEUED_IMPORT_STATES:
                 stats['queued'] += 1
-            elif state in ['matching', 'matched', 'importing']:
+            elif state in ACTIVE_IMPORT_STATES:
                 stats['active'] += 1
             elif state == 'complete':
                 stats['completed'] += 1
@@ -183,41 +226,80 @@ class AudiobookImporter:
             raise ValueError(f"No authentication found for account '{account_name}'")
         
         # Initialize downloader for reusing methods
-        self.downloader = AudiobookDownloader(
-            account_name=account_name,
-            region=region,
-            library_path=str(library_path),
-            downloads_dir="downloads"
-        )
+        self.downloader = get_downloader(account_name, region, str(library_path), downloads_dir="downloads")
         
         # Initialize queue manager
         self.queue_manager = ImportQueueManager()
         
+        # Audible API clients by event loop, reused across catalog calls
+        self._clients = weakref.WeakKeyDictionary()
+        
         logger.info(f"AudiobookImporter initialized for account '{account_name}' in region '{region}'")
     
     def _load_authenticator(self) -> Optional[audible.Authenticator]:
         """Load Audible authenticator from file."""
-        auth_file = Path("config") / "auth" / self.account_name / "auth.json"
-        if auth_file.exists():
-            return audible.Authenticator.from_file(auth_file)
-        return None
+        return find_cached_authenticator(Path("config") / "auth" / self.account_name / "auth.json")
     
-    def scan_directory(self, source_path: str) -> List[Dict]:
+    def refresh_auth(self) -> None:
+        """
+        Reload credentials if the account's auth file changed since they were loaded.
+        
+        Raises:
+            ValueError: If the account no longer has an auth file
+        """
+        auth = self._load_authenticator()
+        if auth is None:
+            raise ValueError(f"No authentication found for account '{self.account_name}'")
+        if auth is not self.auth:
+            self.auth = auth
+            # Clients hold the old credentials; the next call opens fresh ones
+            old_clients, self._clients = self._clients, weakref.WeakKeyDictionary()
+            self._close_clients(old_clients)
+        self.downloader.refresh_auth()
+
+    @staticmethod
+    def _close_clients(clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, audible.AsyncClient]") -> None:
+        """Close replaced clients on the loops that own their connection pools."""
+        for loop, client in list(clients.items()):
+            # A stopped loop cannot run the close; its pool goes with the loop
+            if loop.is_running() and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.close(), loop)
+    
+    def _get_client(self) -> audible.AsyncClient:
+        """
+        Return this importer's Audible client for the running event loop.
+        
+        Must be called from a coroutine. The client is kept open so matching a
+        batch of files reuses one connection pool; callers must not close it.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = audible.AsyncClient(auth=self.auth)
+            self._clients[loop] = client
+        return client
+    
+    def scan_directory(self, source_path: str, source_stat: Optional[os.stat_result] = None) -> List[Dict]:
         """
         Recursively scan directory for M4B files.
         
         Args:
             source_path: Source directory to scan
+            source_stat: Optional os.stat() result for source_path the caller
+                already has, saving another stat
             
         Returns:
             List of file info dictionaries
         """
         source_path = Path(source_path)
         
-        if not source_path.exists():
-            raise ValueError(f"Source path does not exist: {source_path}")
+        if source_stat is None:
+            try:
+                source_stat = source_path.stat()
+            except FileNotFoundError:
+                raise ValueError(f"Source path does not exist: {source_path}")
         
-        if not source_path.is_dir():
+        if not stat.S_ISDIR(source_stat.st_mode):
             raise ValueError(f"Source path is not a directory: {source_path}")
         
         files = []
@@ -304,26 +386,35 @@ class AudiobookImporter:
         Returns:
             List of Audible product dictionaries
         """
+        # Build search query
+        search_query = title
+        if author:
+            search_query = f"{title} {author}"
+        
+        cache_key = _catalog_cache_key(self.region, search_query, num_results)
+        cached = _get_cached_search(cache_key)
+        if cached is not None:
+            logger.debug(f"Catalog cache hit for '{search_query}'")
+            return cached
+        
         try:
-            async with audible.AsyncClient(auth=self.auth) as client:
-                # Build search query
-                search_query = title
-                if author:
-                    search_query = f"{title} {author}"
-                
-                params = {
-                    "keywords": search_query,
-                    "num_results": num_results,
-                    "products_sort_by": "Relevance",
-                    "response_groups": "product_attrs,contributors,media,series,product_desc"
-                }
-                
+            client = self._get_client()
+            
+            params = {
+                "keywords": search_query,
+                "num_results": num_results,
+                "products_sort_by": "Relevance",
+                "response_groups": "product_attrs,contributors,media,series,product_desc"
+            }
+            
+            async with audible_api_limiter:
                 response = await client.get("1.0/catalog/products", params=params)
-                products = response.get("products", [])
-                
-                logger.info(f"Found {len(products)} results for '{search_query}'")
-                return products
-                
+            products = response.get("products", [])
+            
+            logger.info(f"Found {len(products)} results for '{search_query}'")
+            _store_cached_search(cache_key, products)
+            return products
+            
         except Exception as e:
             logger.error(f"Error searching Audible catalog: {e}")
             return []
@@ -436,13 +527,26 @@ class AudiobookImporter:
         
         return confidence
     
-    def check_duplicate(self, file_info: Dict, audible_match: Optional[Dict] = None) -> Optional[Dict]:
+    def build_library_index(self) -> Dict:
+        """
+        Snapshot the target library for checking many files in one pass.
+        
+        The snapshot is shared across requests until the library changes.
+        
+        Returns:
+            Index to pass to check_duplicate(index=...)
+        """
+        return self.downloader.build_duplicate_index(str(self.library_path))
+    
+    def check_duplicate(self, file_info: Dict, audible_match: Optional[Dict] = None,
+                        index: Optional[Dict] = None) -> Optional[Dict]:
         """
         Check for duplicates in target library.
         
         Args:
             file_info: File metadata dictionary
             audible_match: Optional Audible product match
+            index: Optional build_library_index() result reused across files
             
         Returns:
             None if no duplicate, or dictionary with duplicate info
@@ -458,9 +562,14 @@ class AudiobookImporter:
             asin = audible_match['asin']
         
         if asin:
-            library_entry = self.downloader.get_library_entry(asin)
-            if library_entry and library_entry.get('state') == 'converted':
-                stored_path = library_entry.get('file_path', '')
+            if index is not None:
+                stored_path = index['asins'].get(asin)
+            else:
+                library_entry = self.downloader.get_library_entry(asin)
+                stored_path = (library_entry.get('file_path') or ''
+                               if library_entry and library_entry.get('state') == 'converted'
+                               else None)
+            if stored_path is not None:
                 return {
                     'type': 'exact_asin',
                     'reason': f"Book with ASIN {asin} already in library",
@@ -480,7 +589,7 @@ class AudiobookImporter:
         
         if title and author:
             fuzzy_match = self.downloader._check_fuzzy_duplicate(
-                title, author, str(self.library_path), threshold=0.85
+                title, author, str(self.library_path), threshold=0.85, index=index
             )
             
             if fuzzy_match:
@@ -534,15 +643,15 @@ class AudiobookImporter:
         # Create parent directory
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Move file to target location
+        # Move file to target location; across filesystems this is a full copy,
+        # so keep it off the shared event loop that also drives downloads
         logger.info(f"Moving file from {file_path} to {target_path}")
-        shutil.move(str(file_path), str(target_path))
+        await asyncio.to_thread(shutil.move, str(file_path), str(target_path))
         
         # Enrich metadata using Audible data
         try:
-            async with audible.AsyncClient(auth=self.auth) as client:
-                await self.downloader._add_enhanced_metadata(client, target_path, asin)
-                logger.info(f"Metadata enriched for '{title}'")
+            await self.downloader._add_enhanced_metadata(self._get_client(), target_path, asin)
+            logger.info(f"Metadata enriched for '{title}'")
         except Exception as e:
             logger.warning(f"Could not enrich metadata: {e}")
         
@@ -619,3 +728,37 @@ class AudiobookImporter:
         
         return results
 
+
+# One importer per (account, region, library), reused across requests
+_IMPORTERS: Dict[Tuple[str, str, str], AudiobookImporter] = {}
+_IMPORTERS_LOCK = threading.Lock()
+
+
+def get_importer(account_name: str, region: str, library_path: str) -> AudiobookImporter:
+    """
+    Return the shared AudiobookImporter for an account and library.
+    
+    Instances are created on first use and kept for the life of the process,
+    so back-to-back requests reuse the loaded credentials and open Audible
+    clients. Credentials are reloaded when the account's auth file changes.
+    
+    Args:
+        account_name: Audible account name for authentication
+        region: Audible region (e.g., 'us', 'uk', 'de')
+        library_path: Target library path for imported files
+        
+    Returns:
+        The cached AudiobookImporter
+        
+    Raises:
+        ValueError: If the account has no authentication
+    """
+    key = (account_name, region, str(library_path))
+    with _IMPORTERS_LOCK:
+        importer = _IMPORTERS.get(key)
+        if importer is None:
+            importer = AudiobookImporter(account_name, region, library_path)
+            _IMPORTERS[key] = importer
+            return importer
+    importer.refresh_auth()
+    return importer
@@ -7,25 +7,52 @@ comparison functionality with Audible library to identify missing books.
 
 import os
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-import unicodedata
 from mutagen.mp4 import MP4
 from mutagen.id3 import ID3NoHeaderError
 import logging
 from library_storage import LibraryStorage
-from utils.fuzzy_matching import normalize_for_matching, calculate_similarity
+from utils.fuzzy_matching import (
+    NORMALIZE_CACHE_SIZE, calculate_similarity, normalize_for_matching, strip_diacritics, word_set,
+)
 from utils.audio_metadata import get_mp4_tag
 
 logger = logging.getLogger(__name__)
 
+# Patterns used per file / per comparison, compiled once
+_NARRATOR_RE = re.compile(r'\{([^}]+)\}\s*$')
+_YEAR_RE = re.compile(r'^\(?(\d{4})\)?$')
+_SEQ_KW_RE = re.compile(r'^(?:Vol\.?|Book|Volume)\s+(\d+(?:\.\d+)?)', re.IGNORECASE)
+_SEQ_NUM_RE = re.compile(r'^\d{1,3}(?:\.\d+)?\.?$')
+_FILENAME_PREFIX_RE = re.compile(r'^(Book\s+\d+\s*-\s*|Buch\s+\d+\s*-\s*|\d+\s*-\s*)', re.IGNORECASE)
+_TRAIL_PAREN_RE = re.compile(r'\s*\([^)]*\)$')
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+# Language hints in file paths, checked in priority order
+_LANG_PATTERNS = (
+    ('de', re.compile(r'deutsch|german|_de| de ')),
+    ('en', re.compile(r'english|_en| en |eng')),
+    ('fr', re.compile(r'français|french|_fr| fr ')),
+    ('es', re.compile(r'español|spanish|_es| es ')),
+)
+
+# mutagen tag parsing is dominated by disk seeks, so oversubscribe the CPUs
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 class LocalLibraryScanner:
     """Scans and manages local audiobook library."""
     
     def __init__(self, library_path: str, storage: Optional[LibraryStorage] = None):
         """Initialize scanner with library path."""
         self.library_path = Path(library_path)
-        self.supported_extensions = {'.m4b', '.m4a', '.mp3', '.aax'}
+        self.supported_extensions = frozenset({'.m4b', '.m4a', '.mp3', '.aax'})
+        # Only MP4 containers carry tags we can read; other formats skip mutagen entirely
+        self._mp4_exts = frozenset({'.m4b', '.m4a'})
         self.storage = storage or LibraryStorage()
         
     def scan_library(self) -> List[Dict]:
@@ -36,21 +63,62 @@ class LocalLibraryScanner:
         Returns:
             List of book dictionaries with metadata
         """
+        return self._scan_library_delta()[0]
+
+    def _scan_library_delta(self) -> Tuple[List[Dict], Optional[List[Dict]], int]:
+        """
+        Scan the library, reusing cached results for unchanged files.
+
+        Returns:
+            Tuple of (all books, books whose tags were re-read, top-level
+            directories seen). The second item is None when there was no
+            previous scan to diff against.
+        """
         books = []
         
         if not self.library_path.exists():
             logger.warning(f"Library path does not exist: {self.library_path}")
-            return books
-            
-        # Scan author directories
-        for author_dir in self.library_path.iterdir():
-            if not author_dir.is_dir() or author_dir.name.startswith('.'):
-                continue
-                
-            books.extend(self._scan_author_directory(author_dir))
+            return books, None, 0
             
-        logger.info(f"Scanned {len(books)} books from local library")
-        return books
+        # Collect candidate files from author directories (no metadata yet)
+        records = []
+        dirs_scanned = 0
+        with os.scandir(self.library_path) as entries:
+            for author_entry in entries:
+                if not author_entry.is_dir():
+                    continue
+                dirs_scanned += 1
+                if author_entry.name.startswith('.'):
+                    continue
+
+                records.extend(self._scan_author_directory(author_entry))
+
+        # Reuse previous results for files whose size and mtime are unchanged
+        cache_index = self._load_cache_index()
+        results: List[Optional[Dict]] = [None] * len(records)
+        to_parse = []
+        for i, rec in enumerate(records):
+            cached = cache_index.get(rec[0])
+            if cached and cached[0] == rec[4] and cached[1] == rec[5]:
+                results[i] = cached[2]
+            else:
+                to_parse.append(i)
+
+        # Read tags in parallel for the rest; results keep the directory walk order
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(to_parse))) as executor:
+                parsed = executor.map(self._extract_book_metadata, [records[i] for i in to_parse])
+                for i, book_data in zip(to_parse, parsed):
+                    results[i] = book_data
+
+        books = [b for b in results if b]
+        logger.info(
+            f"Scanned {len(books)} books from local library "
+            f"({len(records) - len(to_parse)} unchanged, {len(to_parse)} parsed)"
+        )
+        if not cache_index:
+            return books, None, dirs_scanned
+        return books, [results[i] for i in to_parse if results[i]], dirs_scanned
     
     def scan_and_save_library(self) -> tuple[str, List[Dict]]:
         """
@@ -59,12 +127,12 @@ class LocalLibraryScanner:
         Returns:
             Tuple of (library_id, books_list)
         """
-        books = self.scan_library()
+        books, changed_books, dirs_scanned = self._scan_library_delta()
         
         # Calculate scan statistics
         scan_stats = {
             'scan_duration_seconds': 0,  # Could add timing if needed
-            'directories_scanned': len([d for d in self.library_path.iterdir() if d.is_dir()]),
+            'directories_scanned': dirs_scanned,
             'files_processed': len(books),
             'errors_encountered': 0  # Could track errors during scanning
         }
@@ -73,7 +141,8 @@ class LocalLibraryScanner:
         library_id = self.storage.save_library(
             str(self.library_path), 
             books, 
-            scan_stats
+            scan_stats,
+            changed_books=changed_books
         )
         
         return library_id, books
@@ -82,40 +151,110 @@ class LocalLibraryScanner:
         """Load previously cached library data if available."""
         return self.storage.load_library_by_path(str(self.library_path))
     
-    def _scan_author_directory(self, author_dir: Path) -> List[Dict]:
-        """Scan an author's directory for books and series."""
-        books = []
-        author_name = author_dir.name
+    def _load_cache_index(self) -> Dict[str, Tuple[int, int, Dict]]:
+        """
+        Index the previous scan by file path.
+
+        Returns:
+            {file_path: (file_size, mtime_ns, book_dict)} for rows that recorded an mtime
+        """
+        cached_library = self.load_cached_library()
+        if not cached_library:
+            return {}
+
+        index = {}
+        for row in cached_library.get('books', []):
+            if row.get('mtime_ns') is None or not row.get('file_path'):
+                continue
+            index[row['file_path']] = (row.get('file_size'), row['mtime_ns'], self._book_from_cache_row(row))
+        return index
+
+    def _book_from_cache_row(self, row: Dict) -> Dict:
+        """Rebuild the scanner's book dict from a persisted scan_cache row."""
+        return {
+            'title': row.get('title'),
+            'authors': row.get('authors'),
+            'series': row.get('series'),
+            'narrator': row.get('narrator'),
+            'year': row.get('year'),
+            'sequence': row.get('sequence'),
+            'file_path': row['file_path'],
+            'file_size': row.get('file_size'),
+            'mtime_ns': row['mtime_ns'],
+            'language': row.get('language'),
+            'duration_seconds': row.get('duration_sec') or 0,
+            'isbn': row.get('isbn'),
+            'asin': row.get('asin')
+        }
+
+    def _scan_author_directory(self, author_entry: os.DirEntry) -> List[Tuple]:
+        """Collect file records for books and series in an author's directory."""
+        records = []
+        author_name = author_entry.name
         
-        for item in author_dir.iterdir():
-            if item.is_file() and item.suffix.lower() in self.supported_extensions:
-                # Book directly in author directory
-                book_data = self._extract_book_metadata(item, author_name, None)
-                if book_data:
-                    books.append(book_data)
-                    
-            elif item.is_dir() and not item.name.startswith('.'):
-                # Series or sub-directory
-                series_name = item.name
-                for book_file in item.iterdir():
-                    if book_file.is_file() and book_file.suffix.lower() in self.supported_extensions:
-                        book_data = self._extract_book_metadata(book_file, author_name, series_name)
-                        if book_data:
-                            books.append(book_data)
+        with os.scandir(author_entry.path) as entries:
+            for entry in entries:
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in self.supported_extensions and entry.is_file():
+                    # Book directly in author directory
+                    record = self._make_file_record(entry, suffix, author_name, None)
+                    if record is not None:
+                        records.append(record)
+
+                elif entry.is_dir() and not entry.name.startswith('.'):
+                    # Series or sub-directory
+                    series_name = entry.name
+                    with os.scandir(entry.path) as series_entries:
+                        for book_entry in series_entries:
+                            book_suffix = os.path.splitext(book_entry.name)[1].lower()
+                            if book_suffix in self.supported_extensions and book_entry.is_file():
+                                record = self._make_file_record(book_entry, book_suffix, author_name, series_name)
+                                if record is not None:
+                                    records.append(record)
         
-        return books
+        return records
+
+    @staticmethod
+    def _make_file_record(entry: os.DirEntry, suffix: str, author_name: str,
+                          series_name: Optional[str]) -> Optional[Tuple]:
+        """
+        Flatten a directory entry into the tuple consumed by ``_extract_book_metadata``.
+
+        Uses the stat result cached on the ``DirEntry`` rather than re-stat'ing the path.
+
+        Returns:
+            (path, name, stem, suffix, size, mtime_ns, author_name, series_name),
+            or None if the file vanished or cannot be stat'ed
+        """
+        name = entry.name
+        try:
+            st = entry.stat()
+        except OSError as e:
+            logger.warning(f"Skipping unreadable file {entry.path}: {e}")
+            return None
+        return (
+            entry.path,
+            name,
+            name[:len(name) - len(suffix)],
+            suffix,
+            st.st_size,
+            st.st_mtime_ns,
+            author_name,
+            series_name,
+        )
     
-    def _extract_book_metadata(self, file_path: Path, author_name: str, series_name: Optional[str]) -> Optional[Dict]:
-        """Extract metadata from audiobook file."""
+    def _extract_book_metadata(self, rec: Tuple) -> Optional[Dict]:
+        """Extract metadata from an audiobook file record (see ``_make_file_record``)."""
+        path, name, stem, suffix, file_size, mtime_ns, author_name, series_name = rec
         try:
             # Try to get metadata from file
-            metadata = self._get_file_metadata(file_path)
+            metadata = self._get_file_metadata(path, suffix)
 
             # Extract title from filename if not in metadata
-            title = metadata.get('title') or self._extract_title_from_filename(file_path.stem)
+            title = metadata.get('title') or self._extract_title_from_filename(stem)
 
             # Try to parse AudioBookshelf folder structure
-            abs_metadata = self._parse_audiobookshelf_title(file_path.parent.name)
+            abs_metadata = self._parse_audiobookshelf_title(os.path.basename(os.path.dirname(path)))
             if abs_metadata:
                 # Override with AudioBookshelf metadata if available
                 if abs_metadata.get('title'):
@@ -128,7 +267,7 @@ class LocalLibraryScanner:
                     metadata['sequence'] = abs_metadata['sequence']
 
             # Detect language from filename or path
-            language = self._detect_language(file_path)
+            language = self._detect_language(path)
 
             book_data = {
                 'title': title,
@@ -137,20 +276,19 @@ class LocalLibraryScanner:
                 'narrator': metadata.get('narrator'),
                 'year': metadata.get('year'),
                 'sequence': metadata.get('sequence'),
-                'file_path': str(file_path),
-                'file_size': file_path.stat().st_size,
+                'file_path': path,
+                'file_size': file_size,
+                'mtime_ns': mtime_ns,
                 'language': language,
                 'duration_seconds': metadata.get('duration', 0),
                 'isbn': metadata.get('isbn'),
-                'asin': metadata.get('asin'),
-                'normalized_title': self._normalize_title(title),
-                'normalized_author': self._normalize_title(metadata.get('author') or author_name)
+                'asin': metadata.get('asin')
             }
 
             return book_data
 
         except Exception as e:
-            logger.warning(f"Failed to extract metadata from {file_path}: {e}")
+            logger.warning(f"Failed to extract metadata from {path}: {e}")
             return None
     
     def _parse_audiobookshelf_title(self, folder_name: str) -> Optional[Dict]:
@@ -172,7 +310,7 @@ class LocalLibraryScanner:
         result = {}
 
         # Extract narrator (always in curly braces at the end)
-        narrator_match = re.search(r'\{([^}]+)\}\s*$', folder_name)
+        narrator_match = _NARRATOR_RE.search(folder_name)
         if narrator_match:
             result['narrator'] = narrator_match.group(1).strip()
             folder_name = folder_name[:narrator_match.start()].strip()
@@ -188,19 +326,19 @@ class LocalLibraryScanner:
 
         for part in parts:
             # Check for year (4 digits, optionally in parentheses) - check this first
-            year_match = re.match(r'^\(?(\d{4})\)?$', part)
+            year_match = _YEAR_RE.match(part)
             if year_match and 'year' not in result:
                 result['year'] = year_match.group(1)
                 continue
 
             # Check for sequence pattern with keywords
-            sequence_match = re.match(r'^(?:Vol\.?|Book|Volume)\s+(\d+(?:\.\d+)?)', part, re.IGNORECASE)
+            sequence_match = _SEQ_KW_RE.match(part)
             if sequence_match and 'sequence' not in result:
                 result['sequence'] = sequence_match.group(1)
                 continue
 
             # Check for standalone number as sequence (but not 4-digit years)
-            if re.match(r'^\d{1,3}(?:\.\d+)?\.?$', part) and 'sequence' not in result:
+            if _SEQ_NUM_RE.match(part) and 'sequence' not in result:
                 result['sequence'] = part.rstrip('.')
                 continue
 
@@ -213,22 +351,24 @@ class LocalLibraryScanner:
 
         return result if result else None
 
-    def _get_file_metadata(self, file_path: Path) -> Dict:
+    def _get_file_metadata(self, file_path: str, suffix: str) -> Dict:
         """Extract metadata from audio file using mutagen."""
+        # Add MP3 support if needed
+        if suffix not in self._mp4_exts:
+            return {}
+
         metadata = {}
         
         try:
-            if file_path.suffix.lower() in {'.m4b', '.m4a'}:
-                audio_file = MP4(str(file_path))
-                metadata = {
-                    'title': get_mp4_tag(audio_file, '©nam'),
-                    'author': get_mp4_tag(audio_file, '©ART') or get_mp4_tag(audio_file, 'aART'),
-                    'album': get_mp4_tag(audio_file, '©alb'),
-                    'duration': getattr(audio_file.info, 'length', 0),
-                    'isbn': get_mp4_tag(audio_file, '----:com.apple.iTunes:ISBN'),
-                    'asin': get_mp4_tag(audio_file, '----:com.apple.iTunes:ASIN')
-                }
-            # Add MP3 support if needed
+            audio_file = MP4(file_path)
+            metadata = {
+                'title': get_mp4_tag(audio_file, '©nam'),
+                'author': get_mp4_tag(audio_file, '©ART') or get_mp4_tag(audio_file, 'aART'),
+                'album': get_mp4_tag(audio_file, '©alb'),
+                'duration': getattr(audio_file.info, 'length', 0),
+                'isbn': get_mp4_tag(audio_file, '----:com.apple.iTunes:ISBN'),
+                'asin': get_mp4_tag(audio_file, '----:com.apple.iTunes:ASIN')
+            }
             
         except Exception as e:
             logger.debug(f"Could not read metadata from {file_path}: {e}")
@@ -238,45 +378,24 @@ class LocalLibraryScanner:
     def _extract_title_from_filename(self, filename: str) -> str:
         """Extract clean title from filename."""
         # Remove common patterns like "Book 1 - ", "01 - ", etc.
-        title = re.sub(r'^(Book\s+\d+\s*-\s*|Buch\s+\d+\s*-\s*|\d+\s*-\s*)', '', filename, flags=re.IGNORECASE)
+        title = _FILENAME_PREFIX_RE.sub('', filename)
         
         # Remove file extension artifacts
-        title = re.sub(r'\s*\([^)]*\)$', '', title)  # Remove trailing parentheses
+        title = _TRAIL_PAREN_RE.sub('', title)  # Remove trailing parentheses
         
         return title.strip()
     
-    def _detect_language(self, file_path: Path) -> str:
+    def _detect_language(self, file_path: str) -> str:
         """Detect language from file path or name."""
-        path_str = str(file_path).lower()
+        path_str = file_path.lower()
         
         # Language indicators in path
-        if any(x in path_str for x in ['deutsch', 'german', '_de', ' de ', 'german']):
-            return 'de'
-        elif any(x in path_str for x in ['english', '_en', ' en ', 'eng']):
-            return 'en'
-        elif any(x in path_str for x in ['français', 'french', '_fr', ' fr ']):
-            return 'fr'
-        elif any(x in path_str for x in ['español', 'spanish', '_es', ' es ']):
-            return 'es'
+        for language, pattern in _LANG_PATTERNS:
+            if pattern.search(path_str):
+                return language
             
         # Default to unknown
         return 'unknown'
-    
-    def _normalize_title(self, title: str) -> str:
-        """Normalize title for comparison."""
-        if not title:
-            return ""
-            
-        # Remove diacritics and convert to lowercase
-        normalized = unicodedata.normalize('NFD', title.lower())
-        normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-        
-        # Remove common words and punctuation
-        normalized = re.sub(r'\b(the|a|an|der|die|das|le|la|el|un|une)\b', '', normalized)
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        return normalized
 
 class LibraryComparator:
     """Compares Audible and local libraries to find missing books."""
@@ -297,22 +416,47 @@ class LibraryComparator:
         """
         # Create lookup sets for fast matching
         local_lookup = self._create_lookup_set(local_books)
+        local_index = self._build_match_index(local_books)
+        titles = local_index[0]
+        
+        # Local books keyed the way a local -> Audible lookup would key them, so
+        # matches in that direction are found in the same pass
+        local_by_lookup_key = defaultdict(list)
+        for i, book in enumerate(local_books):
+            key = (self._normalize_for_lookup(book.get('title', '')), self._normalize_for_lookup(book.get('authors', '')))
+            local_by_lookup_key[key].append(i)
         
         missing_books = []
         available_books = []
+        matched_local = set()
         
         for audible_book in audible_books:
-            if self._is_book_available_locally(audible_book, local_lookup, local_books):
+            audible_title = self._normalize_for_lookup(audible_book.get('title', ''))
+            audible_author = self._normalize_for_lookup(audible_book.get('authors', ''))
+            is_available = (audible_title, audible_author) in local_lookup
+            
+            reverse_key = (audible_book.get('normalized_title') or audible_title,
+                           audible_book.get('normalized_author') or audible_author)
+            matched_local.update(local_by_lookup_key.get(reverse_key, ()))
+            
+            # Fuzzy similarity is symmetric, so every pair scored here also settles
+            # the local book's side; only skip pairs neither side still needs
+            match_title = normalize_for_matching(audible_book.get('title', ''))
+            match_author = normalize_for_matching(audible_book.get('authors', ''))
+            for i, author_similarity in self._author_candidates(match_author, local_index):
+                if is_available and i in matched_local:
+                    continue
+                if calculate_similarity(match_title, titles[i]) >= self.match_threshold:
+                    is_available = True
+                    matched_local.add(i)
+            
+            if is_available:
                 available_books.append(audible_book)
             else:
                 missing_books.append(audible_book)
         
-        # Find local books not in Audible (extras)
-        audible_lookup = self._create_lookup_set(audible_books)
-        local_only = [
-            book for book in local_books 
-            if not self._is_book_available_locally(book, audible_lookup, audible_books)
-        ]
+        # Local books not matched by any Audible book (extras)
+        local_only = [book for i, book in enumerate(local_books) if i not in matched_local]
         
         return {
             'total_audible': len(audible_books),
@@ -325,77 +469,126 @@ class LibraryComparator:
             'local_only_count': len(local_only)
         }
     
-    def _create_lookup_set(self, books: List[Dict]) -> Set[str]:
-        """Create normalized title+author lookup set."""
+    def _create_lookup_set(self, books: List[Dict]) -> Set[Tuple[str, str]]:
+        """Create normalized (title, author) lookup set."""
         lookup = set()
         for book in books:
             normalized_title = book.get('normalized_title') or self._normalize_for_lookup(book.get('title', ''))
             normalized_author = book.get('normalized_author') or self._normalize_for_lookup(book.get('authors', ''))
-            lookup.add(f"{normalized_title}|{normalized_author}")
+            lookup.add((sys.intern(normalized_title), sys.intern(normalized_author)))
         return lookup
     
-    def _is_book_available_locally(self, audible_book: Dict, local_lookup: Set[str], local_books: List[Dict]) -> bool:
-        """Check if an Audible book is available in local library."""
-        audible_title = self._normalize_for_lookup(audible_book.get('title', ''))
-        audible_author = self._normalize_for_lookup(audible_book.get('authors', ''))
-        
-        # Direct lookup first
-        lookup_key = f"{audible_title}|{audible_author}"
-        if lookup_key in local_lookup:
-            return True
-        
-        # Fuzzy matching for different editions/formats
-        return self._fuzzy_match_book(audible_book, local_books)
+    def _build_match_index(self, books: List[Dict]) -> Tuple[List[str], List[int], Dict[str, List[int]]]:
+        """
+        Normalize books once for fuzzy matching and index them by author word.
+
+        The result is kept as parallel per-book arrays. A fuzzy match needs the
+        author word overlap to reach 0.7, so only books sharing at least one
+        author word can ever match; counting how many posting lists a book
+        appears in gives that overlap directly.
+
+        Returns:
+            Tuple of (normalized titles, author word counts, author word -> book indices)
+        """
+        titles = []
+        author_sizes = []
+        author_index = defaultdict(list)
+        for i, book in enumerate(books):
+            words = word_set(normalize_for_matching(book.get('authors', '')))
+            titles.append(normalize_for_matching(book.get('title', '')))
+            author_sizes.append(len(words))
+            for word in words:
+                author_index[word].append(i)
+        return titles, author_sizes, author_index
     
-    def _fuzzy_match_book(self, audible_book: Dict, local_books: List[Dict]) -> bool:
+    def warm_caches(self, books: List[Dict]) -> None:
+        """
+        Fill the normalization caches compare_libraries() consults for local
+        ``books``, so a comparison that follows skips that work.
+        """
+        for book in books:
+            title = book.get('title', '')
+            authors = book.get('authors', '')
+            self._normalize_for_lookup(title)
+            self._normalize_for_lookup(authors)
+            normalize_for_matching(title)
+            word_set(normalize_for_matching(authors))
+    
+    def _fuzzy_match_book(self, audible_book: Dict, local_books: List[Dict],
+                          local_index: Optional[Tuple] = None) -> bool:
         """Perform fuzzy matching to find similar books."""
         audible_title = normalize_for_matching(audible_book.get('title', ''))
         audible_author = normalize_for_matching(audible_book.get('authors', ''))
 
-        for local_book in local_books:
-            local_title = normalize_for_matching(local_book.get('title', ''))
-            local_author = normalize_for_matching(local_book.get('authors', ''))
-
-            # First check if authors match (more reliable)
-            author_similarity = self._calculate_word_similarity(audible_author, local_author)
+        local_index = local_index or self._build_match_index(local_books)
+        titles = local_index[0]
 
-            if author_similarity >= 0.7:  # Authors should match well
-                # More flexible title matching
-                title_similarity = calculate_similarity(audible_title, local_title)
-                
-                if title_similarity >= self.match_threshold:
-                    logger.debug(f"Match found: '{audible_book.get('title')}' -> '{local_book.get('title')}' "
-                               f"(title: {title_similarity:.2f}, author: {author_similarity:.2f})")
-                    return True
+        # First check if authors match (more reliable)
+        for i, author_similarity in self._author_candidates(audible_author, local_index):
+            # More flexible title matching
+            title_similarity = calculate_similarity(audible_title, titles[i])
+            
+            if title_similarity >= self.match_threshold:
+                logger.debug(f"Match found: '{audible_book.get('title')}' -> '{local_books[i].get('title')}' "
+                           f"(title: {title_similarity:.2f}, author: {author_similarity:.2f})")
+                return True
                 
         return False
     
+    def _author_candidates(self, author: str, local_index: Tuple) -> List[Tuple[int, float]]:
+        """
+        Find indexed books whose authors match well enough for a fuzzy title check.
+
+        Args:
+            author: Author string normalized with normalize_for_matching
+            local_index: Index from _build_match_index
+
+        Returns:
+            (book index, author similarity) pairs in book order
+        """
+        _, author_sizes, author_index = local_index
+        words = word_set(author)
+        shared_words = defaultdict(int)
+        for word in words:
+            for i in author_index.get(word, ()):
+                shared_words[i] += 1
+
+        candidates = []
+        for i in sorted(shared_words):
+            # Jaccard over author words; authors should match well
+            shared = shared_words[i]
+            similarity = shared / (len(words) + author_sizes[i] - shared)
+            if similarity >= 0.7:
+                candidates.append((i, similarity))
+        return candidates
+    
     def _calculate_word_similarity(self, text1: str, text2: str) -> float:
         """Calculate word-based similarity between two texts."""
         if not text1 or not text2:
             return 0.0
             
-        words1 = set(text1.split())
-        words2 = set(text2.split())
+        words1 = word_set(text1)
+        words2 = word_set(text2)
         
         if not words1 or not words2:
             return 0.0
             
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
-    def _normalize_for_lookup(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def _normalize_for_lookup(text: str) -> str:
         """Normalize text for lookup comparison."""
         if not text:
             return ""
             
         # Simple normalization
-        normalized = unicodedata.normalize('NFD', text.lower())
-        normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = strip_diacritics(text.lower())
+        normalized = _NONWORD_RE.sub('', normalized)
+        normalized = _WS_RE.sub(' ', normalized).strip()
         
         return normalized
     
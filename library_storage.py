@@ -11,15 +11,25 @@ one-time migration.
 
 import hashlib
 import logging
+import threading
 import time
+from collections import Counter, OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from utils.db import get_db, transaction
+from utils.db import get_db, get_db_path, transaction
 
 logger = logging.getLogger(__name__)
 
+# Built library dicts, shared by every LibraryStorage and most recently used
+# last. Each entry records the library's scan_cache row count and newest
+# last_scanned; every scan_cache write changes one of them (including writes
+# from LibraryManager), so a matching fingerprint means the entry is current.
+LIBRARY_CACHE_SIZE = 16
+_library_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_library_cache_lock = threading.Lock()
+
 
 class LibraryStorage:
     """Persistent storage for local library scan data, backed by SQLite."""
@@ -63,60 +73,94 @@ class LibraryStorage:
         library_path: str,
         books: List[Dict],
         scan_stats: Optional[Dict] = None,
+        changed_books: Optional[List[Dict]] = None,
     ) -> str:
         """
         Persist scan results for ``library_path`` into ``scan_cache``.
 
+        When ``changed_books`` is given, ``books`` is still the full scan but
+        only the changed rows are rewritten; rows for files no longer in
+        ``books`` are deleted and the rest only get their timestamp bumped.
+
         Returns the library ID (stable hash of the path, for backward compat).
         """
         library_name = self._path_to_library_name(library_path)
         now = time.time()
 
         if library_name:
-            # Replace all scan_cache rows for this library
-            file_paths = {b["file_path"] for b in books if b.get("file_path")}
             with transaction() as conn:
-                # Remove stale entries
-                conn.execute(
-                    "DELETE FROM scan_cache WHERE library_name=?", (library_name,)
-                )
-                for book in books:
-                    fp = book.get("file_path")
-                    if not fp:
-                        continue
+                if changed_books is None:
+                    # Replace all scan_cache rows for this library
                     conn.execute(
-                        """
-                        INSERT OR REPLACE INTO scan_cache
-                            (library_name, file_path, asin, title, authors,
-                             series, narrator, year, language,
-                             file_size, duration_sec, last_scanned)
-                        VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-                        """,
-                        (
-                            library_name,
-                            fp,
-                            book.get("asin"),
-                            book.get("title"),
-                            book.get("authors"),
-                            book.get("series"),
-                            book.get("narrator"),
-                            book.get("year"),
-                            book.get("language"),
-                            book.get("file_size"),
-                            book.get("duration_seconds"),
-                            now,
-                        ),
+                        "DELETE FROM scan_cache WHERE library_name=?", (library_name,)
                     )
+                    to_write = books
+                else:
+                    file_paths = {b["file_path"] for b in books if b.get("file_path")}
+                    stale = [
+                        (library_name, row["file_path"])
+                        for row in conn.execute(
+                            "SELECT file_path FROM scan_cache WHERE library_name=?",
+                            (library_name,),
+                        )
+                        if row["file_path"] not in file_paths
+                    ]
+                    conn.executemany(
+                        "DELETE FROM scan_cache WHERE library_name=? AND file_path=?",
+                        stale,
+                    )
+                    conn.execute(
+                        "UPDATE scan_cache SET last_scanned=? WHERE library_name=?",
+                        (now, library_name),
+                    )
+                    to_write = changed_books
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO scan_cache
+                        (library_name, file_path, asin, title, authors,
+                         series, narrator, year, language,
+                         file_size, duration_sec, mtime_ns,
+                         sequence, isbn, last_scanned)
+                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                    """,
+                    [
+                        self._scan_cache_row(library_name, book, now)
+                        for book in to_write
+                        if book.get("file_path")
+                    ],
+                )
 
         library_id = self._generate_library_id(library_path)
         logger.info(
-            "Saved %d scan cache entries for library %s (id=%s)",
+            "Saved %d scan cache entries for library %s (id=%s, %s rewritten)",
             len(books),
             library_path,
             library_id,
+            len(books) if changed_books is None else len(changed_books),
         )
         return library_id
 
+    @staticmethod
+    def _scan_cache_row(library_name: str, book: Dict, now: float) -> tuple:
+        """Build the ``scan_cache`` parameter tuple for one scanned book."""
+        return (
+            library_name,
+            book["file_path"],
+            book.get("asin"),
+            book.get("title"),
+            book.get("authors"),
+            book.get("series"),
+            book.get("narrator"),
+            book.get("year"),
+            book.get("language"),
+            book.get("file_size"),
+            book.get("duration_seconds"),
+            book.get("mtime_ns"),
+            book.get("sequence"),
+            book.get("isbn"),
+            now,
+        )
+
     def load_library(self, library_id: str) -> Optional[Dict]:
         """
         Load library data by the legacy ``library_id`` hash.
@@ -281,12 +325,61 @@ class LibraryStorage:
             "libraries": libraries_info,
         }
 
+    @staticmethod
+    def build_facets(books: List[Dict]) -> Dict[str, List[str]]:
+        """
+        Collect the sorted distinct authors, series and languages of ``books``
+        for the library filter dropdowns.
+        """
+        authors = set()
+        series = set()
+        languages = set()
+        for book in books:
+            if book.get("authors"):
+                authors.add(book["authors"])
+            if book.get("series"):
+                series.add(book["series"])
+            languages.add(book.get("language") or "unknown")
+        return {
+            "authors": sorted(authors),
+            "series": sorted(series),
+            "languages": sorted(languages),
+        }
+
     # ------------------------------------------------------------------
     # Private builder
     # ------------------------------------------------------------------
 
     def _build_library_dict(
         self, library_name: str, library_path: str, created_at: float
+    ) -> Dict:
+        """
+        Return the old-style library dict, reusing the cached copy while the
+        library's scan_cache rows are unchanged. The dict is shared and must
+        not be modified.
+        """
+        key = (get_db_path(), library_name, library_path, created_at)
+        fingerprint = tuple(get_db().execute(
+            "SELECT COUNT(*), MAX(last_scanned) FROM scan_cache WHERE library_name=?",
+            (library_name,),
+        ).fetchone())
+
+        with _library_cache_lock:
+            cached = _library_cache.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                _library_cache.move_to_end(key)
+                return cached[1]
+
+        library = self._load_library_dict(library_name, library_path, created_at)
+        with _library_cache_lock:
+            _library_cache[key] = (fingerprint, library)
+            _library_cache.move_to_end(key)
+            while len(_library_cache) > LIBRARY_CACHE_SIZE:
+                _library_cache.popitem(last=False)
+        return library
+
+    def _load_library_dict(
+        self, library_name: str, library_path: str, created_at: float
     ) -> Dict:
         """Build the old-style library dict from scan_cache rows."""
         db = get_db()
@@ -303,6 +396,7 @@ class LibraryStorage:
         )
         total_size = sum(b.get("file_size") or 0 for b in books)
         total_duration = sum(b.get("duration_sec") or 0 for b in books)
+        language_counts = Counter(b.get("language") or "unknown" for b in books)
 
         library_id = self._generate_library_id(library_path)
         return {
@@ -323,5 +417,7 @@ class LibraryStorage:
                 "avg_duration_hours": (
                     (total_duration / len(books) / 3600) if books else 0
                 ),
+                "language_counts": dict(language_counts),
             },
+            "facets": self.build_facets(books),
         }
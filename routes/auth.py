@@ -1,17 +1,15 @@
 from flask import Blueprint, request, jsonify, session, current_app, render_template, redirect, url_for
 import asyncio
-import json
 import os
 from pathlib import Path
-import audible
 from auth import authenticate_account, fetch_library, AudibleAuth
-from audible.localization import Locale, search_template
 from utils.config_manager import get_config_manager, ConfigurationError
 from utils.constants import get_account_auth_dir, get_auth_file_path
-from utils.oauth_flow import start_oauth_login, handle_oauth_callback, check_oauth_status
-from utils.errors import AccountNotFoundError, ValidationError, AuthenticationError, success_response, error_response
-from utils.account_manager import get_account_or_404
+from utils.oauth_flow import start_oauth_login, handle_oauth_callback, check_oauth_status, locale_for_region, LoginSessionStore
+from utils.errors import AccountNotFoundError, ValidationError, AuthenticationError, success_response, error_response, streamed_success_response
+from utils.account_manager import get_account_or_404, find_cached_authenticator
 from utils.library_cache import get_cached_library, write_library_cache
+from utils.async_runner import run_async
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -32,7 +30,7 @@ def authenticate():
         accounts = config_manager.get_accounts()
         
         # Run authentication asynchronously
-        auth = asyncio.run(authenticate_account(account_name, region))
+        auth = run_async(authenticate_account(account_name, region))
         
         if auth:
             accounts[account_name]['authenticated'] = True
@@ -66,15 +64,12 @@ def check_auth():
     # Check if we have a valid auth file
     auth_file = get_auth_file_path(account_name)
     
-    is_authenticated = False
-    if auth_file.exists():
-        try:
-            # Try to load the authenticator - if it works, we're authenticated
-            auth = audible.Authenticator.from_file(auth_file)
-            is_authenticated = True
-        except Exception:
-            # If loading fails, we're not authenticated
-            is_authenticated = False
+    try:
+        # Try to load the authenticator - if it works, we're authenticated
+        is_authenticated = find_cached_authenticator(auth_file) is not None
+    except Exception:
+        # If loading fails, we're not authenticated
+        is_authenticated = False
     
     # Update account data if status changed
     if accounts[account_name].get('authenticated') != is_authenticated:
@@ -84,7 +79,7 @@ def check_auth():
     return jsonify({'authenticated': is_authenticated})
 
 # Store for active login sessions
-login_sessions = {}
+login_sessions = LoginSessionStore()
 
 @auth_bp.route('/auth/login/<account_name>')
 def start_login(account_name):
@@ -93,10 +88,9 @@ def start_login(account_name):
         account_data, region = get_account_or_404(account_name)
 
         # Get localization data
-        template = search_template('country_code', region)
-        if not template:
+        loc = locale_for_region(region)
+        if loc is None:
             raise ValidationError(f'Unsupported region: {region}')
-        loc = Locale(**template)
 
         # Start OAuth login using shared utility
         session_id = start_oauth_login(
@@ -150,7 +144,8 @@ def login_status(session_id):
     response, code = check_oauth_status(
         session_id=session_id,
         sessions_storage=login_sessions,
-        success_redirect=url_for('main.index')
+        success_redirect=url_for('main.index'),
+        wait=request.args.get('wait', 0, type=float)
     )
 
     return jsonify(response), code
@@ -182,7 +177,7 @@ def fetch_all_libraries():
         live = await asyncio.gather(*tasks, return_exceptions=True) if tasks else []
         return cached_results, to_fetch, live
 
-    cached_results, to_fetch, live_results = asyncio.run(_fetch_all())
+    cached_results, to_fetch, live_results = run_async(_fetch_all())
 
     combined = []
     for name, books in cached_results:
@@ -206,7 +201,7 @@ def fetch_all_libraries():
             seen.add(book['asin'])
             deduped.append(book)
 
-    return success_response({'library': deduped})
+    return streamed_success_response('library', deduped)
 
 
 @auth_bp.route('/api/library/fetch', methods=['POST'])
@@ -222,37 +217,34 @@ def fetch_library_route():
         account_data, region = get_account_or_404(account_name)
         
         # Check if authenticated by trying to load the auth file
-        auth_file = get_auth_file_path(account_name)
-        
-        if not auth_file.exists():
-            raise AuthenticationError('Account not authenticated')
-        
         try:
             # Try to load the authenticator - if it fails, we're not authenticated
-            auth = audible.Authenticator.from_file(auth_file)
+            auth = find_cached_authenticator(get_auth_file_path(account_name))
         except Exception:
+            auth = None
+        if auth is None:
             raise AuthenticationError('Account not authenticated')
         
         force = request.args.get('force', '').lower() in ('1', 'true', 'yes')
         if not force:
             cached = get_cached_library(account_name)
             if cached is not None:
-                return success_response({
-                    'message': f'Loaded {len(cached)} books (cached)',
-                    'library': cached,
-                    'from_cache': True
-                })
+                return streamed_success_response(
+                    'library', cached,
+                    {'from_cache': True},
+                    message=f'Loaded {len(cached)} books (cached)'
+                )
 
-        library = asyncio.run(fetch_library(account_name, region))
+        library = run_async(fetch_library(account_name, region))
 
         if library:
             for book in library:
                 book['account_name'] = account_name
             write_library_cache(account_name, library)
-            return success_response({
-                'message': f'Loaded {len(library)} books',
-                'library': library
-            })
+            return streamed_success_response(
+                'library', library,
+                message=f'Loaded {len(library)} books'
+            )
         else:
             raise ValidationError('Failed to load library')
             
@@ -8,7 +8,6 @@ Provides a simple Sonarr-inspired view of the library:
   - Re-queue a missing book for download
 """
 
-import asyncio
 import logging
 from pathlib import Path
 
@@ -17,6 +16,9 @@ from flask import Blueprint, request, jsonify, session
 from app.models import BookStatus
 from utils.db import get_db, transaction
 from utils.config_manager import get_config_manager
+from utils.async_runner import run_async
+from utils.errors import streamed_success_response
+from utils.library_cache import get_cached_library, write_library_cache
 
 books_bp = Blueprint("books", __name__)
 logger = logging.getLogger(__name__)
@@ -71,7 +73,7 @@ def list_books():
     for row in db.execute("SELECT status, COUNT(*) as n FROM books GROUP BY status"):
         summary[row["status"]] = row["n"]
 
-    return jsonify({"success": True, "books": books, "summary": summary})
+    return streamed_success_response("books", books, data={"summary": summary})
 
 
 # ---------------------------------------------------------------------------
@@ -203,11 +205,19 @@ def redownload_book(asin: str):
     region = account_data.get("region", "us")
     library_path = lib["path"]
 
-    # Fetch the full Audible book record (needed by downloader)
+    # Fetch the full Audible book record (needed by downloader), cache first
     try:
-        from auth import fetch_library
-        library = asyncio.run(fetch_library(account_name, region))
-        book_record = next((b for b in library if b["asin"] == asin), None)
+        library = get_cached_library(account_name)
+        book_record = next((b for b in library or () if b["asin"] == asin), None)
+        if book_record is None:
+            # No fresh cache, or the book was bought after it was filled
+            from auth import fetch_library
+            library = run_async(fetch_library(account_name, region))
+            if library:
+                for book in library:
+                    book["account_name"] = account_name
+                write_library_cache(account_name, library)
+                book_record = next((b for b in library if b["asin"] == asin), None)
     except Exception as e:
         logger.error("Could not fetch library for re-download: %s", e)
         return jsonify({"error": f"Failed to fetch library: {e}"}), 500
@@ -226,7 +236,7 @@ def redownload_book(asin: str):
     try:
         from downloader import download_books, count_successful_batch_downloads
 
-        results = asyncio.run(
+        results = run_async(
             download_books(
                 account_name,
                 region,
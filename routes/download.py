@@ -1,25 +1,49 @@
 from flask import Blueprint, request, jsonify, session, current_app, Response, render_template
-import asyncio
-import json
 import os
+import threading
 import time
+import uuid
+import zlib
 from downloader import (
-    AudiobookDownloader,
     DownloadQueueManager,
     count_successful_batch_downloads,
     download_books,
+    get_downloader,
     serialize_batch_download_results,
 )
+from app.models import FINISHED_DOWNLOAD_STATES
 from utils.config_manager import get_config_manager, ConfigurationError
 from utils.errors import AccountNotFoundError, LibraryNotFoundError, ValidationError, success_response, error_response
 from utils.account_manager import get_account_or_404, get_library_config
 from utils.library_cache import get_cached_library, write_library_cache
+from utils.async_runner import run_async, submit_async
+from utils.json_provider import json_bytes_encoder
 
 download_bp = Blueprint('download', __name__)
 
+# Background download batches by job id; the oldest finished jobs are dropped past the limit
+MAX_FINISHED_DOWNLOAD_JOBS = 50
+_download_jobs = {}
+_download_jobs_lock = threading.Lock()
+
+# Formatted progress per ASIN as (item version, info), shared by every stream client
+_progress_cache = {}
+
+# Encoded /api/download/progress body as (queue version, json)
+_progress_response = None
+
+# Progress stream pacing: at most one update per interval (shorter while bytes
+# are transferring so progress bars move smoothly), keepalive comment when idle
+SSE_MIN_INTERVAL_SECONDS = 1.0
+SSE_TRANSFER_INTERVAL_SECONDS = 0.25
+SSE_KEEPALIVE_SECONDS = 15.0
+
 # Get ConfigManager singleton
 config_manager = get_config_manager()
 
+# Shared download queue (singleton), looked up once instead of per request
+queue_manager = DownloadQueueManager()
+
 
 @download_bp.route('/downloads')
 def downloads_page():
@@ -48,19 +72,19 @@ def download_selected_books():
         account_data, region = get_account_or_404(current_account)
         library_config, library_path = get_library_config(library_name)
 
-        # Use cached library; fall back to live fetch only on cache miss
-        library = get_cached_library(current_account)
-        if not library:
+        # Use cached library; fall back to live fetch when it is missing, stale
+        # or lacks a selected book (bought after the cache was filled)
+        asin_set = set(selected_asins)
+        selected_books, remaining = _select_books(get_cached_library(current_account) or (), asin_set)
+        if remaining:
             from auth import fetch_library
-            library = asyncio.run(fetch_library(current_account, region))
+            library = run_async(fetch_library(current_account, region))
             if not library:
                 raise ValidationError('Failed to fetch library for download')
             for book in library:
                 book['account_name'] = current_account
             write_library_cache(current_account, library)
-
-        asin_set = set(selected_asins)
-        selected_books = [book for book in library if book['asin'] in asin_set]
+            selected_books, remaining = _select_books(library, asin_set)
 
         if not selected_books:
             raise ValidationError('Selected books not found in library')
@@ -69,34 +93,91 @@ def download_selected_books():
         session['cleanup_aax'] = cleanup_aax
         session['download_library'] = library_name
 
-        # Start download process asynchronously
-        results = asyncio.run(download_books(
+        # Run the batch on the background loop; progress is reported through the
+        # queue (progress stream) and the outcome through /api/download/job/<job_id>
+        future = submit_async(download_books(
             current_account,
             region,
             selected_books,
             cleanup_aax=cleanup_aax,
             library_path=library_path
         ))
-
-        successful_downloads = count_successful_batch_downloads(results)
+        job_id = uuid.uuid4().hex
+        with _download_jobs_lock:
+            _prune_download_jobs()
+            _download_jobs[job_id] = {
+                'future': future,
+                'account_name': current_account,
+                'library_name': library_name,
+                'total': len(selected_books),
+                'started_at': time.time(),
+            }
 
         return success_response({
-            'message': f'Download completed! {successful_downloads} of {len(selected_books)} books downloaded successfully.',
-            'results': serialize_batch_download_results(results),
-        })
+            'message': f'{len(selected_books)} book(s) added to the download queue.',
+            'job_id': job_id,
+            'total': len(selected_books),
+        }, status_code=202)
 
     except (AccountNotFoundError, LibraryNotFoundError, ValidationError):
         raise
     except Exception as e:
         return error_response(f'Download error: {str(e)}', status_code=500)
 
+def _select_books(library, asin_set):
+    """
+    Return the library's books whose ASIN is in ``asin_set``, in library order,
+    and the set of ASINs not found. Stops walking once every ASIN is found.
+    """
+    remaining = set(asin_set)
+    selected_books = []
+    for book in library:
+        if book['asin'] in asin_set:
+            selected_books.append(book)
+            remaining.discard(book['asin'])
+            if not remaining:
+                break
+    return selected_books, remaining
+
+def _prune_download_jobs():
+    """Forget the oldest finished jobs once more than the limit are kept. Caller holds the lock."""
+    finished = [job_id for job_id, job in _download_jobs.items() if job['future'].done()]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_DOWNLOAD_JOBS)]:
+        del _download_jobs[job_id]
+
+@download_bp.route('/api/download/job/<job_id>')
+def download_job_status(job_id):
+    """API endpoint to check the outcome of a download batch started by /api/download/books"""
+    with _download_jobs_lock:
+        job = _download_jobs.get(job_id)
+    if job is None:
+        return error_response(f"Download job '{job_id}' not found", status_code=404)
+
+    future = job['future']
+    status = {
+        'job_id': job_id,
+        'account_name': job['account_name'],
+        'library_name': job['library_name'],
+        'total': job['total'],
+        'started_at': job['started_at'],
+    }
+    if not future.done():
+        status['state'] = 'running'
+    elif future.exception() is not None:
+        status['state'] = 'failed'
+        status['error'] = str(future.exception())
+    else:
+        results = future.result()
+        status['state'] = 'completed'
+        status['successful'] = count_successful_batch_downloads(results)
+        status['results'] = serialize_batch_download_results(results)
+    return success_response(status)
+
 @download_bp.route('/api/download/clear-completed', methods=['POST'])
 def clear_completed_downloads():
     """Remove all completed and failed downloads from the queue."""
-    queue_manager = DownloadQueueManager()
-    done_states = {'converted', 'completed', 'error'}
     to_clear = [asin for asin, d in queue_manager.get_all_downloads().items()
-                if d.get('state') in done_states]
+                if d.get('state') in FINISHED_DOWNLOAD_STATES]
     for asin in to_clear:
         queue_manager.remove_from_queue(asin)
     return success_response({'cleared': len(to_clear)})
@@ -105,49 +186,38 @@ def clear_completed_downloads():
 @download_bp.route('/api/download/status/<asin>')
 def download_status_asin(asin):
     """API endpoint to check download status for a specific book"""
-    # Use shared queue manager for download status
-    queue_manager = DownloadQueueManager()
-    state = queue_manager.get_download(asin)
-    
-    if state:
-        return jsonify(state)
-    else:
-        return jsonify({})
+    return jsonify(_download_states([asin])[asin])
 
 @download_bp.route('/api/download/progress')
 def download_progress():
     """API endpoint to get progress for all downloads"""
-    # Use shared queue manager for download progress
-    queue_manager = DownloadQueueManager()
-    
-    # Get all download states
-    all_states = queue_manager.get_all_downloads()
-
-    # Format progress data
-    progress_data = {}
-    for asin, state in all_states.items():
-        progress_info = {
-            'state': state.get('state', 'unknown'),
-            'title': state.get('title', 'Unknown'),
-            'timestamp': state.get('timestamp', 0),
-            'progress_percent': state.get('progress_percent', 0),
-            'downloaded_bytes': state.get('downloaded_bytes', 0),
-            'total_bytes': state.get('total_bytes'),
-            'speed': state.get('speed', 0),
-            'eta': state.get('eta', 0),
-            'elapsed': state.get('elapsed', 0),
-            'error': state.get('error'),
-            'error_type': state.get('error_type')
-        }
-        progress_data[asin] = progress_info
-
-    return jsonify(progress_data)
+    global _progress_response
+    # The UI follows the progress stream; this endpoint serves other clients,
+    # re-encoding only after the queue changed
+    version = queue_manager.version
+    cached = _progress_response
+    if cached is None or cached[0] != version:
+        all_states = queue_manager.get_all_downloads()
+        # Reuse the stream's formatted entries; only items that changed are rebuilt
+        progress_data = {asin: _cached_progress(asin, state) for asin, state in all_states.items()}
+        cached = (version, current_app.json.dumps(progress_data))
+        _progress_response = cached
+
+    return Response(cached[1], mimetype='application/json')
 
 @download_bp.route('/api/download/status')
 def download_status():
-    """API endpoint to check overall download status"""
-    # Use shared queue manager for download status
-    queue_manager = DownloadQueueManager()
+    """
+    API endpoint to check overall download status.
+
+    With ``?asins=a,b,c`` it instead returns the queue state of each listed
+    book keyed by ASIN ({} for books not in the queue), so a book list can
+    fetch every status in one request.
+    """
+    asins = request.args.get('asins')
+    if asins is not None:
+        return jsonify(_download_states([asin for asin in asins.split(',') if asin]))
+
     stats = queue_manager.get_statistics()
 
     return jsonify({
@@ -182,8 +252,8 @@ def sync_library():
         account_data, region = get_account_or_404(current_account)
         library_config, library_path = get_library_config(library_name)
 
-        # Create downloader instance and run sync
-        downloader = AudiobookDownloader(current_account, region, library_path=library_path)
+        # Reuse the account's downloader and run sync
+        downloader = get_downloader(current_account, region, library_path)
         stats = downloader.sync_library()
 
         return success_response({
@@ -196,62 +266,169 @@ def sync_library():
     except Exception as e:
         return error_response(f'Sync error: {str(e)}', status_code=500)
 
+def _download_states(asins):
+    """Return the queue state for each ASIN ({} when not queued)."""
+    return {asin: queue_manager.get_download(asin) or {} for asin in asins}
+
+def _format_progress(state):
+    """Shape one queue item for the progress endpoint and stream."""
+    return {
+        'state': state.get('state', 'unknown'),
+        'title': state.get('title', 'Unknown'),
+        'timestamp': state.get('timestamp', 0),
+        'progress_percent': state.get('progress_percent', 0),
+        'downloaded_bytes': state.get('downloaded_bytes', 0),
+        'total_bytes': state.get('total_bytes'),
+        'speed': state.get('speed', 0),
+        'eta': state.get('eta', 0),
+        'elapsed': state.get('elapsed', 0),
+        'error': state.get('error'),
+        'error_type': state.get('error_type'),
+        'downloaded_by_account': state.get('downloaded_by_account')
+    }
+
+def _cached_progress(asin, state):
+    """Return the formatted progress for an item, rebuilding it only after the item changes."""
+    version = queue_manager.get_item_version(asin)
+    cached = _progress_cache.get(asin)
+    if cached is None or cached[0] != version:
+        cached = (version, _format_progress(state))
+        _progress_cache[asin] = cached
+    return cached[1]
+
+def _progress_patch(previous, current):
+    """Return the fields of ``current`` that differ from ``previous`` (all of them for a new item)."""
+    if previous is None:
+        return current
+    return {field: value for field, value in current.items() if previous.get(field) != value}
+
+def _event_id_version(event_id):
+    """Return the queue version in an SSE event id, or None if it is not from this process's queue."""
+    epoch, _, version = (event_id or '').partition('-')
+    if epoch == queue_manager.epoch and version.isdigit():
+        return int(version)
+    return None
+
 @download_bp.route('/api/download/progress-stream')
 def download_progress_stream():
     """Server-Sent Events endpoint for real-time progress updates"""
-    queue_manager = DownloadQueueManager()
+    # Bound here: the generator runs after the request context is gone
+    dumpb = json_bytes_encoder(current_app)
+    # Browsers send Last-Event-ID on automatic reconnects; manual ones pass it as a query arg
+    resume_version = _event_id_version(
+        request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    )
 
     def generate_progress_updates():
         """Generate progress updates as Server-Sent Events"""
-        
+        # The first event carries the full snapshot (or, for a client resuming from
+        # an earlier event, what changed since then); later events only the fields
+        # that changed on ASINs the queue reports as updated since the previous one
+        last_version = None
+        last_stats = None
+        sent = {}
         while True:
             try:
-                # Get all download states from shared manager
+                # Note the version before reading so no change can slip past the wait below
+                version = queue_manager.version
+                
+                # Get download states and statistics from shared manager
                 all_states = queue_manager.get_all_downloads()
                 stats = queue_manager.get_statistics()
                 
-                # Format progress data with all fields
-                progress_data = {}
-                for asin, state in all_states.items():
-                    progress_info = {
-                        'state': state.get('state', 'unknown'),
-                        'title': state.get('title', 'Unknown'),
-                        'timestamp': state.get('timestamp', 0),
-                        'progress_percent': state.get('progress_percent', 0),
-                        'downloaded_bytes': state.get('downloaded_bytes', 0),
-                        'total_bytes': state.get('total_bytes'),
-                        'speed': state.get('speed', 0),
-                        'eta': state.get('eta', 0),
-                        'elapsed': state.get('elapsed', 0),
-                        'error': state.get('error'),
-                        'error_type': state.get('error_type'),
-                        'downloaded_by_account': state.get('downloaded_by_account')
+                resumed_removed = None
+                if last_version is None and resume_version is not None:
+                    resumed_removed = queue_manager.get_items_removed_since(resume_version)
+                
+                if resumed_removed is not None:
+                    sent = {asin: _cached_progress(asin, state) for asin, state in all_states.items()}
+                    changed = queue_manager.get_items_changed_since(resume_version)
+                    update = {
+                        'updates': {asin: sent[asin] for asin in changed if asin in sent},
+                        'removed': [asin for asin in resumed_removed if asin not in all_states],
+                        'stats': stats,
+                        'timestamp': time.time()
                     }
-                    progress_data[asin] = progress_info
+                elif last_version is None:
+                    for asin in [a for a in list(_progress_cache) if a not in all_states]:
+                        _progress_cache.pop(asin, None)
+                    sent = {asin: _cached_progress(asin, state) for asin, state in all_states.items()}
+                    update = {
+                        'downloads': sent,
+                        'stats': stats,
+                        'timestamp': time.time()
+                    }
+                else:
+                    updates = {}
+                    for asin, state in queue_manager.get_items_changed_since(last_version).items():
+                        progress = _cached_progress(asin, state)
+                        patch = _progress_patch(sent.get(asin), progress)
+                        if patch:
+                            updates[asin] = patch
+                        sent[asin] = progress
+                    removed = [asin for asin in sent if asin not in all_states]
+                    for asin in removed:
+                        del sent[asin]
+                    if updates or removed or stats != last_stats:
+                        update = {
+                            'updates': updates,
+                            'removed': removed,
+                            'stats': stats,
+                            'timestamp': time.time()
+                        }
+                    else:
+                        update = None
+                
+                if update is not None:
+                    yield f"id: {queue_manager.epoch}-{version}\ndata: ".encode() + dumpb(update) + b"\n\n"
+                    last_stats = stats
+                last_version = version
+                last_sent = time.time()
+                transferring = any(state.get('state') == 'downloading' for state in all_states.values())
+                interval = SSE_TRANSFER_INTERVAL_SECONDS if transferring else SSE_MIN_INTERVAL_SECONDS
                 
-                # Send combined update with progress and statistics
-                update = {
-                    'downloads': progress_data,
-                    'stats': stats,
-                    'timestamp': time.time()
-                }
+                # Sleep until the queue changes; comment lines keep idle connections open
+                while queue_manager.wait_for_change(version, timeout=SSE_KEEPALIVE_SECONDS) == version:
+                    yield b": keepalive\n\n"
                 
-                yield f"data: {json.dumps(update)}\n\n"
-                    
-                time.sleep(1)  # Send updates every second
+                # Progress ticks arrive per chunk; coalesce them to one update per interval
+                delay = last_sent + interval - time.time()
+                if delay > 0:
+                    time.sleep(delay)
                 
             except Exception as e:
                 # Send error as SSE event
                 error_data = {'error': str(e)}
-                yield f"data: {json.dumps(error_data)}\n\n"
+                yield b"data: " + dumpb(error_data) + b"\n\n"
                 break
     
-    return Response(
-        generate_progress_updates(),
-        mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'Access-Control-Allow-Origin': '*',
-        }
-    )
\ No newline at end of file
+    headers = {
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive',
+        # Stop nginx-style proxies from buffering the stream
+        'X-Accel-Buffering': 'no',
+    }
+    allowed_origin = current_app.config.get('SSE_ALLOWED_ORIGIN')
+    if allowed_origin:
+        headers['Access-Control-Allow-Origin'] = allowed_origin
+    body = generate_progress_updates()
+    if 'gzip' in request.accept_encodings:
+        body = _gzip_event_stream(body)
+        headers['Content-Encoding'] = 'gzip'
+        headers['Vary'] = 'Accept-Encoding'
+
+    return Response(body, mimetype='text/event-stream', headers=headers)
+
+
+def _gzip_event_stream(events):
+    """
+    Gzip an event stream as one continuous member, flushing after every event.
+
+    The sync flush makes each event decodable as soon as it arrives, while the
+    shared compression window lets repeated keys across events compress away.
+    The member is closed with its CRC/size trailer once the events run out.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for event in events:
+        yield compressor.compress(event) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
\ No newline at end of file
@@ -3,14 +3,24 @@ Importer routes for M4B audiobook import functionality.
 Handles scanning, matching, and importing M4B files with Audible metadata.
 """
 
-from flask import Blueprint, request, jsonify, session, current_app
+from flask import Blueprint, request, jsonify, current_app, Response
 import asyncio
 import logging
+import os
+import stat
+import threading
+import time
+import uuid
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List
 import json
 
-from importer import AudiobookImporter, ImportQueueManager
+from importer import ImportQueueManager, get_importer
+from utils.async_runner import run_async, submit_async
+from utils.constants import MAX_CONCURRENT_MATCHES
+from utils.errors import streamed_success_response
+from utils.json_provider import json_bytes_encoder
 
 importer_bp = Blueprint('importer', __name__, url_prefix='/api/importer')
 logger = logging.getLogger(__name__)
@@ -18,11 +28,21 @@ logger = logging.getLogger(__name__)
 # Global queue manager instance
 queue_manager = ImportQueueManager()
 
+# Comment line sent on idle progress streams so proxies keep the connection open
+PROGRESS_STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Background directory scans by scan id; the oldest finished scans are dropped past the limit
+MAX_FINISHED_SCANS = 10
+_scans = {}
+_scans_lock = threading.Lock()
+
 
 @importer_bp.route('/scan', methods=['POST'])
 def scan_source_directory():
     """
-    Scan source directory for M4B files.
+    Start scanning a source directory for M4B files.
+    
+    The scan runs in the background; poll /scan/<scan_id> for the result.
     
     Request body:
         {
@@ -31,13 +51,11 @@ def scan_source_directory():
             "account_name": "account_name"
         }
     
-    Response:
+    Response (202):
         {
             "success": true,
-            "files": [...],
-            "count": 10,
-            "total_size": 1234567890,
-            "errors": []
+            "scan_id": "0f3c...",
+            "status": "scanning"
         }
     """
     try:
@@ -56,47 +74,116 @@ def scan_source_directory():
         if not account_name:
             return jsonify({'error': 'account_name is required'}), 400
         
-        # Validate paths
-        if not Path(source_path).exists():
+        # Validate paths with one stat each; the source stat is reused by the scan
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
             return jsonify({'error': f'Source path does not exist: {source_path}'}), 400
         
-        if not Path(library_path).exists():
+        try:
+            os.stat(library_path)
+        except OSError:
             return jsonify({'error': f'Library path does not exist: {library_path}'}), 400
         
+        if not stat.S_ISDIR(source_stat.st_mode):
+            return jsonify({'error': f'Source path is not a directory: {source_path}'}), 400
+        
         # Initialize importer
         try:
-            importer = AudiobookImporter(account_name, region, library_path)
+            importer = get_importer(account_name, region, library_path)
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
         
-        # Scan directory
-        files = importer.scan_directory(source_path)
-        
-        # Calculate total size
-        total_size = sum(f.get('file_size', 0) for f in files)
-        
-        # Store scan results in session for later use
-        session['import_scan_results'] = {
-            'files': files,
-            'source_path': source_path,
-            'library_path': library_path,
-            'account_name': account_name,
-            'region': region
-        }
+        # Walk and read tags in a worker thread so neither this request thread
+        # nor the shared loop is held for the length of the scan
+        future = submit_async(asyncio.to_thread(
+            importer.scan_directory, source_path, source_stat=source_stat
+        ))
+        scan_id = uuid.uuid4().hex
+        with _scans_lock:
+            _prune_scans()
+            _scans[scan_id] = {
+                'future': future,
+                'source_path': source_path,
+                'started_at': time.time(),
+            }
         
         return jsonify({
             'success': True,
-            'files': files,
-            'count': len(files),
-            'total_size': total_size,
-            'errors': []
-        })
+            'scan_id': scan_id,
+            'status': 'scanning'
+        }), 202
         
     except Exception as e:
-        logger.error(f"Error scanning directory: {e}", exc_info=True)
+        logger.error("Error scanning directory: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to scan directory: {str(e)}'}), 500
 
 
+def _prune_scans():
+    """Forget the oldest finished scans once more than the limit are kept. Caller holds the lock."""
+    finished = [scan_id for scan_id, scan in _scans.items() if scan['future'].done()]
+    for scan_id in finished[:max(0, len(finished) - MAX_FINISHED_SCANS)]:
+        del _scans[scan_id]
+
+
+@importer_bp.route('/scan/<scan_id>', methods=['GET'])
+def get_scan_result(scan_id):
+    """
+    Get the state or result of a scan started by /scan.
+    
+    Response while running (202):
+        {
+            "success": true,
+            "scan_id": "0f3c...",
+            "status": "scanning"
+        }
+    
+    Response when finished:
+        {
+            "success": true,
+            "scan_id": "0f3c...",
+            "status": "complete",
+            "files": [...],
+            "count": 10,
+            "total_size": 1234567890,
+            "errors": []
+        }
+    """
+    with _scans_lock:
+        scan = _scans.get(scan_id)
+    if scan is None:
+        return jsonify({'error': f"Scan '{scan_id}' not found"}), 404
+    
+    future = scan['future']
+    if not future.done():
+        return jsonify({
+            'success': True,
+            'scan_id': scan_id,
+            'status': 'scanning'
+        }), 202
+    
+    error = future.exception()
+    if error is not None:
+        logger.error("Error scanning directory %s: %s", scan['source_path'], error)
+        if isinstance(error, ValueError):
+            return jsonify({'error': str(error)}), 400
+        return jsonify({'error': f'Failed to scan directory: {str(error)}'}), 500
+    
+    files = future.result()
+    
+    # Calculate total size
+    # scan_directory always sets file_size, so sum without per-item .get() calls
+    total_size = sum(map(itemgetter('file_size'), files))
+    
+    return streamed_success_response('files', files, {
+        'scan_id': scan_id,
+        'status': 'complete',
+        'count': len(files),
+        'total_size': total_size,
+        'errors': []
+    })
+
+
 @importer_bp.route('/match', methods=['POST'])
 def match_files():
     """
@@ -146,13 +233,25 @@ def match_files():
         
         # Initialize importer
         try:
-            importer = AudiobookImporter(account_name, region, library_path)
+            importer = get_importer(account_name, region, library_path)
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
         
-        # Match files with Audible (async operation)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Match all files with Audible concurrently on the shared loop; the
+        # semaphore caps requests in flight and the API rate limiter paces them
+        async def _match_all():
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_MATCHES)
+            
+            async def _match_one(file_info):
+                async with semaphore:
+                    return await importer.match_with_audible(file_info)
+            
+            return await asyncio.gather(
+                *(_match_one(file_info) for file_info in files),
+                return_exceptions=True
+            )
+        
+        match_results = run_async(_match_all())
         
         matched_files = []
         stats = {
@@ -163,16 +262,18 @@ def match_files():
             'total': len(files)
         }
         
-        for file_info in files:
+        # One library snapshot for the whole batch instead of a query and a
+        # stat of every library file per matched file
+        library_index = importer.build_library_index()
+        
+        for file_info, match_result in zip(files, match_results):
             try:
-                # Match with Audible
-                match_result = loop.run_until_complete(
-                    importer.match_with_audible(file_info)
-                )
+                if isinstance(match_result, Exception):
+                    raise match_result
                 
                 # Check for duplicates
                 selected_match = match_result.get('selected_match')
-                duplicate_status = importer.check_duplicate(file_info, selected_match)
+                duplicate_status = importer.check_duplicate(file_info, selected_match, index=library_index)
                 
                 # Determine if file should be selected for import
                 selected = False
@@ -197,7 +298,7 @@ def match_files():
                 })
                 
             except Exception as e:
-                logger.error(f"Error matching file {file_info.get('file_path')}: {e}")
+                logger.error("Error matching file %s: %s", file_info.get('file_path'), e)
                 matched_files.append({
                     'file_info': file_info,
                     'match_result': {
@@ -210,25 +311,10 @@ def match_files():
                     'selected': False
                 })
         
-        loop.close()
-        
-        # Store results in session
-        session['import_match_results'] = {
-            'matched_files': matched_files,
-            'stats': stats,
-            'account_name': account_name,
-            'region': region,
-            'library_path': library_path
-        }
-        
-        return jsonify({
-            'success': True,
-            'matched_files': matched_files,
-            'stats': stats
-        })
+        return streamed_success_response('matched_files', matched_files, {'stats': stats})
         
     except Exception as e:
-        logger.error(f"Error matching files: {e}", exc_info=True)
+        logger.error("Error matching files: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to match files: {str(e)}'}), 500
 
 
@@ -260,20 +346,11 @@ def preview_import_path():
         if not library_path:
             return jsonify({'error': 'library_path is required'}), 400
         
-        # Use a temporary importer instance to build the path
-        # We don't need authentication for path building
-        from downloader import AudiobookDownloader
-        
-        # Create a minimal downloader instance for path building
-        downloader = AudiobookDownloader(
-            account_name="temp",
-            region="us",
-            library_path=library_path,
-            downloads_dir="downloads"
-        )
+        # Path building needs no account or downloader state
+        from app.services import PathBuilder
         
         # Build the target path
-        target_path = downloader.path_builder.build_path_from_pattern(
+        target_path = PathBuilder().build_path_from_pattern(
             base_path=library_path,
             title=audible_product.get('title', 'Unknown'),
             authors=audible_product.get('authors', []),
@@ -291,7 +368,7 @@ def preview_import_path():
         })
         
     except Exception as e:
-        logger.error(f"Error generating path preview: {e}", exc_info=True)
+        logger.error("Error generating path preview: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to generate preview: {str(e)}'}), 500
 
 
@@ -333,19 +410,12 @@ def manual_search():
         
         # Initialize importer
         try:
-            importer = AudiobookImporter(account_name, region, library_path)
+            importer = get_importer(account_name, region, library_path)
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
         
         # Search Audible
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        results = loop.run_until_complete(
-            importer.search_audible_catalog(search_query, num_results=10)
-        )
-        
-        loop.close()
+        results = run_async(importer.search_audible_catalog(search_query, num_results=10))
         
         return jsonify({
             'success': True,
@@ -354,7 +424,7 @@ def manual_search():
         })
         
     except Exception as e:
-        logger.error(f"Error performing manual search: {e}", exc_info=True)
+        logger.error("Error performing manual search: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to search: {str(e)}'}), 500
 
 
@@ -401,13 +471,24 @@ def execute_import():
         
         # Initialize importer
         try:
-            importer = AudiobookImporter(account_name, region, library_path)
+            importer = get_importer(account_name, region, library_path)
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
         
+        # Drop repeated submissions of the same file (e.g. a double-clicked
+        # Import) so it is not moved twice; the queue is keyed by file path
+        seen_paths = set()
+        unique_imports = []
+        for import_item in imports:
+            file_path = import_item['file_path']
+            if file_path not in seen_paths:
+                seen_paths.add(file_path)
+                unique_imports.append(import_item)
+        imports = unique_imports
+        
         # Start a new batch with expected count to prevent race conditions
         batch_id = queue_manager.start_new_batch(expected_count=len(imports))
-        logger.info(f"Started new import batch {batch_id} with {len(imports)} files")
+        logger.info("Started new import batch %s with %d files", batch_id, len(imports))
         
         # Add all imports to queue
         for import_item in imports:
@@ -421,21 +502,14 @@ def execute_import():
                 audible_product=audible_product
             )
         
-        # Start import in background thread
-        def run_import():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        # Run the import in the background on the shared loop
+        def _log_import_result(future):
             try:
-                results = loop.run_until_complete(importer.batch_import(imports))
-                logger.info(f"Import completed: {results}")
+                logger.info("Import completed: %s", future.result())
             except Exception as e:
-                logger.error(f"Import failed: {e}", exc_info=True)
-            finally:
-                loop.close()
+                logger.error("Import failed: %s", e, exc_info=True)
         
-        import threading
-        import_thread = threading.Thread(target=run_import, daemon=True)
-        import_thread.start()
+        submit_async(importer.batch_import(imports)).add_done_callback(_log_import_result)
         
         return jsonify({
             'success': True,
@@ -445,7 +519,7 @@ def execute_import():
         })
         
     except Exception as e:
-        logger.error(f"Error executing import: {e}", exc_info=True)
+        logger.error("Error executing import: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to execute import: {str(e)}'}), 500
 
 
@@ -472,19 +546,70 @@ def get_import_progress():
     """
     try:
         stats = queue_manager.get_statistics()
-        imports = queue_manager.get_all_imports()
         
-        return jsonify({
-            'success': True,
-            'statistics': stats,
-            'imports': imports
-        })
+        # The queue version identifies the payload (statistics may mark the
+        # batch complete, so read it afterwards); unchanged polls get a 304
+        etag = f'{queue_manager.epoch}-{queue_manager.version}'
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify({
+                'success': True,
+                'statistics': stats,
+                'imports': queue_manager.get_all_imports()
+            })
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
         
     except Exception as e:
-        logger.error(f"Error getting import progress: {e}", exc_info=True)
+        logger.error("Error getting import progress: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to get progress: {str(e)}'}), 500
 
 
+@importer_bp.route('/progress/stream', methods=['GET'])
+def stream_import_progress():
+    """
+    Server-Sent Events version of /progress.
+    
+    The first event has the same shape as /progress ("statistics" and
+    "imports"). Later events are only sent after the queue changes and carry
+    "statistics", the changed imports under "updates" and the file paths
+    that left the queue under "removed".
+    """
+    # Bound here: the generator runs after the request context is gone
+    dumpb = json_bytes_encoder(current_app)
+    
+    def generate():
+        version = queue_manager.version
+        imports = queue_manager.get_all_imports()
+        stats = queue_manager.get_statistics()
+        sent = set(imports)
+        yield b"data: " + dumpb({'statistics': stats, 'imports': imports}) + b"\n\n"
+        
+        while True:
+            new_version = queue_manager.wait_for_change(version, timeout=PROGRESS_STREAM_KEEPALIVE_SECONDS)
+            if new_version == version:
+                yield b": keepalive\n\n"
+                continue
+            
+            imports = queue_manager.get_all_imports()
+            updates = queue_manager.get_items_changed_since(version)
+            removed = [key for key in sent if key not in imports]
+            new_stats = queue_manager.get_statistics()
+            sent = set(imports)
+            version = new_version
+            if not updates and not removed and new_stats == stats:
+                continue
+            stats = new_stats
+            yield b"data: " + dumpb({'statistics': stats, 'updates': updates, 'removed': removed}) + b"\n\n"
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+
 @importer_bp.route('/clear-queue', methods=['POST'])
 def clear_import_queue():
     """
@@ -513,7 +638,7 @@ def clear_import_queue():
         })
         
     except Exception as e:
-        logger.error(f"Error clearing queue: {e}", exc_info=True)
+        logger.error("Error clearing queue: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to clear queue: {str(e)}'}), 500
 
 
@@ -544,7 +669,7 @@ def get_libraries():
                 'created_at': config.get('created_at')
             })
         
-        logger.info(f"Importer libraries endpoint: Found {len(libraries_array)} libraries")
+        logger.debug("Importer libraries endpoint: Found %d libraries", len(libraries_array))
         
         return jsonify({
             'success': True,
@@ -552,6 +677,6 @@ def get_libraries():
         })
         
     except Exception as e:
-        logger.error(f"Error getting libraries: {e}", exc_info=True)
+        logger.error("Error getting libraries: %s", e, exc_info=True)
         return jsonify({'error': f'Failed to get libraries: {str(e)}'}), 500
 
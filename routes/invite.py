@@ -11,11 +11,10 @@ import secrets
 from pathlib import Path
 from functools import wraps
 from auth import AudibleAuth
-from audible.localization import Locale, search_template
 import audible
 from settings import settings_manager
 from utils.config_manager import get_config_manager, ConfigurationError
-from utils.oauth_flow import start_oauth_login, handle_oauth_callback, check_oauth_status
+from utils.oauth_flow import start_oauth_login, handle_oauth_callback, check_oauth_status, locale_for_region, LoginSessionStore
 
 invite_bp = Blueprint('invite', __name__)
 
@@ -23,7 +22,7 @@ invite_bp = Blueprint('invite', __name__)
 config_manager = get_config_manager()
 
 # Store for active login sessions (shared with auth module concept)
-invite_login_sessions = {}
+invite_login_sessions = LoginSessionStore()
 
 
 def validate_token(f):
@@ -83,8 +82,7 @@ def add_account(token):
         return jsonify({'error': 'Account name already exists. Please choose a different name.'}), 400
 
     # Validate region
-    template = search_template('country_code', region)
-    if not template:
+    if locale_for_region(region) is None:
         return jsonify({'error': f'Unsupported region: {region}'}), 400
 
     # Create account
@@ -106,19 +104,17 @@ def add_account(token):
 @validate_token
 def start_login(token, account_name):
     """Start the Audible login process for invitation"""
-    accounts = config_manager.get_accounts()
+    account_data = config_manager.get_account(account_name)
 
-    if account_name not in accounts:
+    if account_data is None:
         return jsonify({'error': 'Account not found'}), 404
 
-    account_data = accounts[account_name]
     region = account_data['region']
 
     # Get localization data
-    template = search_template('country_code', region)
-    if not template:
+    loc = locale_for_region(region)
+    if loc is None:
         return jsonify({'error': f'Unsupported region: {region}'}), 400
-    loc = Locale(**template)
 
     # Start OAuth login using shared utility
     session_id = start_oauth_login(
@@ -193,7 +189,8 @@ def login_status(token, session_id):
         session_id=session_id,
         sessions_storage=invite_login_sessions,
         success_redirect=success_redirect,
-        token=token
+        token=token,
+        wait=request.args.get('wait', 0, type=float)
     )
 
     return jsonify(response), code
@@ -203,13 +200,11 @@ def login_status(token, session_id):
 @validate_token
 def success_page(token, account_name):
     """Display success page after account is added"""
-    accounts = config_manager.get_accounts()
+    account_data = config_manager.get_account(account_name)
 
-    if account_name not in accounts:
+    if account_data is None:
         return "Account not found", 404
 
-    account_data = accounts[account_name]
-
     return render_template('invite/success.html',
                          account_name=account_name,
                          region=account_data['region'])
@@ -222,33 +217,31 @@ def success_page(token, account_name):
 # ============================================================================
 
 def validate_account_token(f):
-    """Decorator to validate account-specific invitation token"""
+    """
+    Decorator to validate account-specific invitation token.
+
+    Passes the account the token belongs to on to the route handler as
+    ``account_name`` and ``account_data``.
+    """
     @wraps(f)
     def decorated_function(token, *args, **kwargs):
-        accounts = config_manager.get_accounts()
-
-        # Find account with matching pending_invitation_token
-        matching_account = None
-        for account_name, account_data in accounts.items():
-            if account_data.get('pending_invitation_token') == token:
-                matching_account = account_name
-                break
+        match = config_manager.get_account_by_token(token)
+        if match is None:
+            return render_template('invite/invalid_token.html'), 403
 
-        if not matching_account:
+        account_name, account_data = match
+        # Routes that also carry the account name must name the token's account
+        if kwargs.pop('account_name', account_name) != account_name:
             return render_template('invite/invalid_token.html'), 403
 
-        # Pass the account_name to the route handler
-        return f(token, matching_account, *args, **kwargs)
+        return f(token, *args, account_name=account_name, account_data=account_data, **kwargs)
     return decorated_function
 
 
 @invite_bp.route('/invite/account/<token>')
 @validate_account_token
-def account_landing_page(token, account_name):
+def account_landing_page(token, account_name, account_data):
     """Display landing page for single-account invitation"""
-    accounts = config_manager.get_accounts()
-    account_data = accounts[account_name]
-
     # Check if already authenticated
     if account_data.get('authenticated'):
         return render_template('invite/account_already_authenticated.html',
@@ -262,17 +255,14 @@ def account_landing_page(token, account_name):
 
 @invite_bp.route('/invite/account/<token>/auth/login')
 @validate_account_token
-def account_start_login(token, account_name):
+def account_start_login(token, account_name, account_data):
     """Start the Audible login process for single-account invitation"""
-    accounts = config_manager.get_accounts()
-    account_data = accounts[account_name]
     region = account_data['region']
 
     # Get localization data
-    template = search_template('country_code', region)
-    if not template:
+    loc = locale_for_region(region)
+    if loc is None:
         return jsonify({'error': f'Unsupported region: {region}'}), 400
-    loc = Locale(**template)
 
     # Start OAuth login using shared utility
     session_id = start_oauth_login(
@@ -289,7 +279,7 @@ def account_start_login(token, account_name):
 
 @invite_bp.route('/invite/account/<token>/auth/login-page/<session_id>')
 @validate_account_token
-def account_login_page(token, account_name, session_id):
+def account_login_page(token, account_name, account_data, session_id):
     """Display login page with OAuth URL for single-account invitation"""
     if session_id not in invite_login_sessions:
         return "Login session not found", 404
@@ -313,7 +303,7 @@ def account_login_page(token, account_name, session_id):
 
 @invite_bp.route('/invite/account/<token>/auth/callback/<session_id>', methods=['POST'])
 @validate_account_token
-def account_login_callback(token, account_name, session_id):
+def account_login_callback(token, account_name, account_data, session_id):
     """Handle the OAuth callback URL from user for single-account invitation"""
     # Additional validation for account-specific invite
     if session_id in invite_login_sessions:
@@ -339,7 +329,7 @@ def account_login_callback(token, account_name, session_id):
 
 @invite_bp.route('/invite/account/<token>/auth/status/<session_id>')
 @validate_account_token
-def account_login_status(token, account_name, session_id):
+def account_login_status(token, account_name, account_data, session_id):
     """Check login status for single-account invitation"""
     # Additional validation for account-specific invite
     if session_id in invite_login_sessions:
@@ -353,25 +343,24 @@ def account_login_status(token, account_name, session_id):
         session_id=session_id,
         sessions_storage=invite_login_sessions,
         success_redirect=success_redirect,
-        token=token
+        token=token,
+        wait=request.args.get('wait', 0, type=float)
     )
 
-    # If authentication successful, remove pending_invitation_token
-    if response.get('success'):
-        accounts = config_manager.get_accounts()
-        if account_name in accounts:
-            accounts[account_name].pop('pending_invitation_token', None)
-            config_manager.save_accounts(accounts)
-
+    # The token is cleared by the success page, which still needs it
     return jsonify(response), code
 
 
 @invite_bp.route('/invite/account/<token>/success/<account_name>')
 @validate_account_token
-def account_success_page(token, account_name):
+def account_success_page(token, account_name, account_data):
     """Display success page after account authentication for single-account invitation"""
-    accounts = config_manager.get_accounts()
-    account_data = accounts[account_name]
+    # The invitation is used up once the account is authenticated
+    if account_data.get('authenticated'):
+        try:
+            config_manager.update_account(account_name, {'pending_invitation_token': None})
+        except ConfigurationError:
+            pass  # account was deleted meanwhile
 
     return render_template('invite/account_success.html',
                          account_name=account_name,
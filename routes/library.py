@@ -2,14 +2,17 @@
 Library management routes for local audiobook scanning and comparison.
 """
 
-from flask import Blueprint, request, jsonify, session, current_app
+from flask import Blueprint, request, jsonify, session, current_app, Response
+import asyncio
 import os
-import json
 from pathlib import Path
 import logging
+from collections import Counter
 from datetime import datetime
+from typing import Dict, List, Optional
 from library_scanner import LocalLibraryScanner, LibraryComparator
 from library_storage import LibraryStorage
+from utils.async_runner import submit_async
 
 library_bp = Blueprint('library', __name__, url_prefix='/api/library')
 logger = logging.getLogger(__name__)
@@ -17,6 +20,32 @@ logger = logging.getLogger(__name__)
 # Initialize storage
 storage = LibraryStorage()
 
+# Debug logs are streamed to the client in chunks of this size
+DEBUG_LOG_CHUNK_SIZE = 64 * 1024
+
+# Scanners and the comparator keep no per-scan state, so one of each is shared
+_scanners = {}
+comparator = LibraryComparator()
+
+
+def _get_scanner(library_path: str) -> LocalLibraryScanner:
+    """Return the shared scanner for a library path, creating it on first use."""
+    scanner = _scanners.get(library_path)
+    if scanner is None:
+        scanner = _scanners.setdefault(library_path, LocalLibraryScanner(library_path, storage))
+    return scanner
+
+def _warm_comparison(local_books: List[Dict]) -> None:
+    """
+    Prime the comparator's normalization caches for a just-loaded library in
+    the background; a scan is usually followed by /compare.
+    """
+    def _log_failure(future):
+        if future.exception() is not None:
+            logger.warning("Could not warm comparison caches: %s", future.exception())
+    
+    submit_async(asyncio.to_thread(comparator.warm_caches, local_books)).add_done_callback(_log_failure)
+
 @library_bp.route('/scan-local', methods=['POST'])
 def scan_local_library():
     """Scan local audiobook library directory."""
@@ -31,13 +60,14 @@ def scan_local_library():
         return jsonify({'error': f'Library path does not exist: {library_path}'}), 400
     
     try:
-        scanner = LocalLibraryScanner(library_path, storage)
+        scanner = _get_scanner(library_path)
         
         # Check if we have cached data and don't need to rescan
         if not force_rescan:
             cached_library = scanner.load_cached_library()
             if cached_library:
-                logger.info(f"Using cached library data for {library_path}")
+                logger.info("Using cached library data for %s", library_path)
+                _warm_comparison(cached_library['books'])
                 return jsonify({
                     'success': True,
                     'message': f'Loaded {cached_library["book_count"]} books from cached library',
@@ -53,7 +83,8 @@ def scan_local_library():
         # Perform fresh scan
         library_id, local_books = scanner.scan_and_save_library()
         
-        logger.info(f"Scanned and saved {len(local_books)} books from {library_path}")
+        logger.info("Scanned and saved %d books from %s", len(local_books), library_path)
+        _warm_comparison(local_books)
         
         # Get the full library data with stats
         library_data = storage.load_library(library_id)
@@ -71,7 +102,7 @@ def scan_local_library():
         })
         
     except Exception as e:
-        logger.error(f"Error scanning local library: {e}")
+        logger.error("Error scanning local library: %s", e)
         return jsonify({'error': f'Failed to scan library: {str(e)}'}), 500
 
 @library_bp.route('/compare', methods=['POST'])
@@ -104,7 +135,6 @@ def compare_libraries():
     local_books = local_library_data.get('books', [])
     
     try:
-        comparator = LibraryComparator()
         comparison_result = comparator.compare_libraries(audible_library, local_books)
         
         # Save comparison result to persistent storage
@@ -114,9 +144,9 @@ def compare_libraries():
             comparison_result
         )
         
-        logger.info(f"Library comparison saved as {comparison_id}: "
-                   f"{comparison_result['missing_count']} missing, "
-                   f"{comparison_result['available_count']} available locally")
+        logger.info("Library comparison saved as %s: %d missing, %d available locally",
+                    comparison_id, comparison_result['missing_count'],
+                    comparison_result['available_count'])
         
         return jsonify({
             'success': True,
@@ -127,9 +157,36 @@ def compare_libraries():
         })
         
     except Exception as e:
-        logger.error(f"Error comparing libraries: {e}")
+        logger.error("Error comparing libraries: %s", e)
         return jsonify({'error': f'Failed to compare libraries: {str(e)}'}), 500
 
+def _filter_books(books: List[Dict], search_term: str = '', author: Optional[str] = None,
+                  series: Optional[str] = None, language: Optional[str] = None) -> List[Dict]:
+    """
+    Filter books by search term, author, series and language in one pass.
+
+    Filter values are lowercased once, and each book's fields at most once,
+    rather than once per filter for every book.
+    """
+    search_term = search_term.lower()
+    author = author.lower() if author else ''
+    series = series.lower() if series else ''
+    
+    filtered = []
+    for book in books:
+        if language and book.get('language') != language:
+            continue
+        if search_term or author:
+            authors = book.get('authors', '').lower()
+            if author and author not in authors:
+                continue
+            if search_term and search_term not in authors and search_term not in book.get('title', '').lower():
+                continue
+        if series and series not in (book.get('series') or '').lower():
+            continue
+        filtered.append(book)
+    return filtered
+
 @library_bp.route('/missing', methods=['GET'])
 def get_missing_books():
     """Get books that are missing from local library."""
@@ -149,28 +206,12 @@ def get_missing_books():
     missing_books = comparison.get('missing_from_local', [])
     
     # Apply filters
-    search_term = request.args.get('search', '').lower()
-    language = request.args.get('language')
-    author = request.args.get('author')
-    
-    if search_term:
-        missing_books = [
-            book for book in missing_books
-            if search_term in book.get('title', '').lower() or 
-               search_term in book.get('authors', '').lower()
-        ]
-    
-    if language:
-        missing_books = [
-            book for book in missing_books
-            if book.get('language') == language
-        ]
-    
-    if author:
-        missing_books = [
-            book for book in missing_books
-            if author.lower() in book.get('authors', '').lower()
-        ]
+    missing_books = _filter_books(
+        missing_books,
+        search_term=request.args.get('search', ''),
+        author=request.args.get('author'),
+        language=request.args.get('language')
+    )
     
     return jsonify({
         'success': True,
@@ -189,42 +230,17 @@ def get_local_books():
         return jsonify({'error': 'No local library found. Please scan your local library first.'}), 400
     
     # Apply filters
-    search_term = request.args.get('search', '').lower()
-    author = request.args.get('author')
-    series = request.args.get('series')
     language = request.args.get('language')
+    filtered_books = _filter_books(
+        local_books,
+        search_term=request.args.get('search', ''),
+        author=request.args.get('author'),
+        series=request.args.get('series'),
+        language=language if language != 'all' else None
+    )
     
-    filtered_books = local_books
-    
-    if search_term:
-        filtered_books = [
-            book for book in filtered_books
-            if search_term in book.get('title', '').lower() or 
-               search_term in book.get('authors', '').lower()
-        ]
-    
-    if author:
-        filtered_books = [
-            book for book in filtered_books
-            if author.lower() in book.get('authors', '').lower()
-        ]
-    
-    if series:
-        filtered_books = [
-            book for book in filtered_books
-            if book.get('series') and series.lower() in book.get('series', '').lower()
-        ]
-    
-    if language and language != 'all':
-        filtered_books = [
-            book for book in filtered_books
-            if book.get('language') == language
-        ]
-    
-    # Get unique values for filters
-    all_authors = sorted(set(book.get('authors', '') for book in local_books if book.get('authors')))
-    all_series = sorted(set(book.get('series', '') for book in local_books if book.get('series')))
-    all_languages = sorted(set(book.get('language', 'unknown') for book in local_books))
+    # Unique values for filters, computed when the library was loaded
+    facets = local_library_data.get('facets') or LibraryStorage.build_facets(local_books)
     
     return jsonify({
         'success': True,
@@ -232,11 +248,7 @@ def get_local_books():
         'total_books': len(local_books),
         'filtered_count': len(filtered_books),
         'library_path': local_library_data.get('path'),
-        'filters': {
-            'authors': all_authors,
-            'series': all_series,
-            'languages': all_languages
-        }
+        'filters': facets
     })
 
 @library_bp.route('/stats', methods=['GET'])
@@ -247,17 +259,32 @@ def get_library_stats():
     local_books = local_library_data.get('books', [])
     comparison = session.get('library_comparison', {})
     
+    # Local totals are computed when the library is loaded; only older
+    # library data without them is walked here
+    local_stats = local_library_data.get('stats', {})
+    if 'language_counts' in local_stats:
+        total_size_gb = local_stats.get('total_size_gb', 0)
+        language_counts = local_stats['language_counts']
+    else:
+        total_size = 0
+        language_counts = Counter()
+        for book in local_books:
+            total_size += book.get('file_size', 0)
+            language_counts[book.get('language', 'unknown')] += 1
+        total_size_gb = total_size / (1024**3)
+        language_counts = dict(language_counts)
+    
     # Calculate statistics
     stats = {
         'audible': {
             'total_books': len(audible_library),
-            'total_hours': sum(book.get('length_mins', 0) for book in audible_library) / 60 if audible_library else 0
+            'total_hours': 0
         },
         'local': {
             'total_books': len(local_books),
-            'total_size_gb': sum(book.get('file_size', 0) for book in local_books) / (1024**3) if local_books else 0,
+            'total_size_gb': total_size_gb,
             'library_path': local_library_data.get('path'),
-            'languages': {}
+            'languages': language_counts
         },
         'comparison': {
             'missing_count': comparison.get('missing_count', 0),
@@ -267,26 +294,23 @@ def get_library_stats():
         }
     }
     
-    # Language breakdown for local library
-    if local_books:
-        language_counts = {}
-        for book in local_books:
-            lang = book.get('language', 'unknown')
-            language_counts[lang] = language_counts.get(lang, 0) + 1
-        stats['local']['languages'] = language_counts
-    
-    # Author breakdown
+    # Listening hours and author breakdown in one pass over the Audible library
     if audible_library:
-        audible_authors = {}
+        total_mins = 0
+        audible_authors = Counter()
         for book in audible_library:
-            author = book.get('authors', 'Unknown')
-            audible_authors[author] = audible_authors.get(author, 0) + 1
-        stats['audible']['top_authors'] = sorted(audible_authors.items(), key=lambda x: x[1], reverse=True)[:10]
+            total_mins += book.get('length_mins', 0)
+            audible_authors[book.get('authors', 'Unknown')] += 1
+        stats['audible']['total_hours'] = total_mins / 60
+        stats['audible']['top_authors'] = audible_authors.most_common(10)
     
-    return jsonify({
+    # Clients polling unchanged stats get a 304 instead of the body
+    response = jsonify({
         'success': True,
         'stats': stats
     })
+    response.add_etag()
+    return response.make_conditional(request)
 
 @library_bp.route('/set-path', methods=['POST'])
 def set_library_path():
@@ -326,7 +350,7 @@ def list_libraries():
             'summary': summary
         })
     except Exception as e:
-        logger.error(f"Error listing libraries: {e}")
+        logger.error("Error listing libraries: %s", e)
         return jsonify({'error': f'Failed to list libraries: {str(e)}'}), 500
 
 @library_bp.route('/library/<library_id>', methods=['GET'])
@@ -342,7 +366,7 @@ def get_library_details(library_id):
             'library': library_data
         })
     except Exception as e:
-        logger.error(f"Error getting library details: {e}")
+        logger.error("Error getting library details: %s", e)
         return jsonify({'error': f'Failed to get library details: {str(e)}'}), 500
 
 @library_bp.route('/library/<library_id>', methods=['DELETE'])
@@ -358,7 +382,7 @@ def delete_library(library_id):
         else:
             return jsonify({'error': 'Library not found'}), 404
     except Exception as e:
-        logger.error(f"Error deleting library: {e}")
+        logger.error("Error deleting library: %s", e)
         return jsonify({'error': f'Failed to delete library: {str(e)}'}), 500
 
 @library_bp.route('/comparisons', methods=['GET'])
@@ -371,7 +395,7 @@ def list_comparisons():
             'comparisons': comparisons
         })
     except Exception as e:
-        logger.error(f"Error listing comparisons: {e}")
+        logger.error("Error listing comparisons: %s", e)
         return jsonify({'error': f'Failed to list comparisons: {str(e)}'}), 500
 
 @library_bp.route('/debug-match', methods=['POST'])
@@ -387,8 +411,6 @@ def debug_match():
         return jsonify({'error': 'audible_title, local_title, and author are required'}), 400
     
     try:
-        comparator = LibraryComparator()
-        
         # Test normalization
         norm_audible = comparator._normalize_for_matching(audible_title)
         norm_local = comparator._normalize_for_matching(local_title)
@@ -428,7 +450,7 @@ def debug_match():
         })
         
     except Exception as e:
-        logger.error(f"Error in debug match: {e}")
+        logger.error("Error in debug match: %s", e)
         return jsonify({'error': f'Failed to debug match: {str(e)}'}), 500
 
 @library_bp.route('/debug-log/<path:filename>', methods=['GET'])
@@ -436,48 +458,64 @@ def get_debug_log(filename):
     """Get debug log file contents."""
     try:
         # Security check - only allow files in library_data directory
-        if not filename.startswith('matching_debug_') or not filename.endswith('.json'):
+        if (not filename.startswith('matching_debug_') or not filename.endswith('.json')
+                or Path(filename).name != filename):
             return jsonify({'error': 'Invalid debug file'}), 400
         
         file_path = Path('library_data') / filename
         
-        if not file_path.exists():
+        try:
+            debug_file = open(file_path, 'rb')
+        except FileNotFoundError:
             return jsonify({'error': 'Debug file not found'}), 404
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            debug_data = json.load(f)
+        # The log is JSON the matcher wrote, so splice its bytes into the
+        # response as they are instead of parsing and re-encoding them
+        head = f'{{"success":true,"filename":{current_app.json.dumps(filename)},"debug_data":'.encode('utf-8')
         
-        return jsonify({
-            'success': True,
-            'debug_data': debug_data,
-            'filename': filename
-        })
+        def generate():
+            with debug_file:
+                yield head
+                while chunk := debug_file.read(DEBUG_LOG_CHUNK_SIZE):
+                    yield chunk
+                yield b'}'
+        
+        return Response(generate(), mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Error reading debug log: {e}")
+        logger.error("Error reading debug log: %s", e)
         return jsonify({'error': f'Failed to read debug log: {str(e)}'}), 500
 
 @library_bp.route('/list-debug-logs', methods=['GET'])
 def list_debug_logs():
     """List all available debug log files."""
     try:
-        debug_dir = Path('library_data')
-        debug_files = []
+        entries = []
         
-        if debug_dir.exists():
-            for file_path in debug_dir.glob('matching_debug_*.json'):
-                try:
-                    stat = file_path.stat()
-                    debug_files.append({
-                        'filename': file_path.name,
-                        'created': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'size_kb': round(stat.st_size / 1024, 2)
-                    })
-                except Exception as e:
-                    logger.warning(f"Could not read stats for {file_path}: {e}")
+        try:
+            with os.scandir('library_data') as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.startswith('matching_debug_') and name.endswith('.json')):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, name, stat.st_size))
+                    except OSError as e:
+                        logger.warning("Could not read stats for %s: %s", entry.path, e)
+        except FileNotFoundError:
+            pass
         
-        # Sort by creation time (newest first)
-        debug_files.sort(key=lambda x: x['created'], reverse=True)
+        # Sort by creation time (newest first) on the raw timestamps, then format
+        entries.sort(reverse=True)
+        debug_files = [
+            {
+                'filename': name,
+                'created': datetime.fromtimestamp(mtime).isoformat(),
+                'size_kb': round(size / 1024, 2)
+            }
+            for mtime, name, size in entries
+        ]
         
         return jsonify({
             'success': True,
@@ -485,5 +523,5 @@ def list_debug_logs():
         })
         
     except Exception as e:
-        logger.error(f"Error listing debug logs: {e}")
+        logger.error("Error listing debug logs: %s", e)
         return jsonify({'error': f'Failed to list debug logs: {str(e)}'}), 500
\ No newline at end of file
@@ -89,22 +89,21 @@ class SettingsManager:
 
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from settings.json or create with defaults."""
-        if SETTINGS_FILE.exists():
-            try:
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    # Ensure naming_pattern exists
-                    if 'naming_pattern' not in settings:
-                        settings['naming_pattern'] = DEFAULT_NAMING_PATTERN
-                    return settings
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading settings: {e}. Using defaults.")
-                return self._get_default_settings()
-        else:
+        try:
+            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+                # Ensure naming_pattern exists
+                if 'naming_pattern' not in settings:
+                    settings['naming_pattern'] = DEFAULT_NAMING_PATTERN
+                return settings
+        except FileNotFoundError:
             # Create default settings file
             default_settings = self._get_default_settings()
             self._save_settings(default_settings)
             return default_settings
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading settings: {e}. Using defaults.")
+            return self._get_default_settings()
 
     def _get_default_settings(self) -> Dict[str, Any]:
         """Get default settings structure."""
@@ -5,15 +5,19 @@
 let _eventSource = null;
 let _reconnectTimeout = null;
 let _disconnectedSince = null;
+let _lastEventId = '';
 
 // ── SSE Connection ──
 
 function connectSSE() {
     if (_eventSource) { _eventSource.close(); _eventSource = null; }
 
-    _eventSource = new EventSource('/api/download/progress-stream');
+    // Resume from the last event so the server only sends what changed meanwhile
+    const query = _lastEventId ? '?last_event_id=' + encodeURIComponent(_lastEventId) : '';
+    _eventSource = new EventSource('/api/download/progress-stream' + query);
 
     _eventSource.onmessage = function (event) {
+        if (event.lastEventId) _lastEventId = event.lastEventId;
         try { AppState.updateDownloads(JSON.parse(event.data)); } catch (e) {}
         _disconnectedSince = null;
         if (_reconnectTimeout) { clearTimeout(_reconnectTimeout); _reconnectTimeout = null; }
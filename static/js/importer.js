@@ -6,6 +6,10 @@
 let _scannedFiles = [];
 let _matchedFiles = [];
 let _progressInterval = null;
+let _progressSource = null;
+let _importsState = {};
+
+const SCAN_POLL_INTERVAL_MS = 500;
 
 // ── Step Navigation ──
 
@@ -44,7 +48,7 @@ async function scanDirectory() {
     const restore = setButtonLoading(btn, 'Scanning…');
 
     try {
-        const result = await apiCall('/api/importer/scan', {
+        const started = await apiCall('/api/importer/scan', {
             method: 'POST',
             body: JSON.stringify({
                 source_path: sourcePath,
@@ -52,6 +56,7 @@ async function scanDirectory() {
                 account_name: accountName
             })
         });
+        const result = await _waitForScan(started.scan_id);
 
         _scannedFiles = result.files || [];
         _renderScanResults(_scannedFiles, result.count, result.total_size);
@@ -64,6 +69,15 @@ async function scanDirectory() {
     }
 }
 
+// The scan runs server-side in the background; poll until it finishes
+async function _waitForScan(scanId) {
+    for (;;) {
+        const result = await apiCall(`/api/importer/scan/${encodeURIComponent(scanId)}`);
+        if (result.status !== 'scanning') return result;
+        await new Promise(resolve => setTimeout(resolve, SCAN_POLL_INTERVAL_MS));
+    }
+}
+
 function _renderScanResults(files, count, totalSize) {
     const tbody = document.getElementById('scannedFilesTable');
     if (!tbody) return;
@@ -243,6 +257,29 @@ async function executeImport() {
 
 function _startImportProgressPolling() {
     if (_progressInterval) clearInterval(_progressInterval);
+    if (_progressSource) { _progressSource.close(); _progressSource = null; }
+
+    // Prefer pushed updates; fall back to polling if the stream fails
+    if (window.EventSource) {
+        _progressSource = new EventSource('/api/importer/progress/stream');
+        _progressSource.onmessage = function (event) {
+            const data = JSON.parse(event.data);
+            if (data.imports) {
+                _importsState = data.imports;
+            } else {
+                _importsState = { ..._importsState, ...(data.updates || {}) };
+                (data.removed || []).forEach(key => { delete _importsState[key]; });
+            }
+            _renderImportProgress(data.statistics || {}, _importsState);
+        };
+        _progressSource.onerror = function () {
+            _progressSource.close();
+            _progressSource = null;
+            _progressInterval = setInterval(_pollImportProgress, 1500);
+        };
+        return;
+    }
+
     _progressInterval = setInterval(_pollImportProgress, 1500);
     _pollImportProgress();
 }
@@ -250,38 +287,40 @@ function _startImportProgressPolling() {
 async function _pollImportProgress() {
     try {
         const result = await apiCall('/api/importer/progress');
-        const stats = result.statistics || {};
-        const imports = result.imports || {};
-
-        const activeEl     = document.getElementById('importStatActive');
-        const completedEl  = document.getElementById('importStatCompleted');
-        const failedEl2    = document.getElementById('importStatFailed');
-        if (activeEl)    activeEl.textContent    = stats.active    || 0;
-        if (completedEl) completedEl.textContent = stats.completed || 0;
-        if (failedEl2)   failedEl2.textContent   = stats.failed    || 0;
-
-        const total = stats.total_imports || 0;
-        const done  = (stats.completed || 0) + (stats.failed || 0);
-        const pct   = total > 0 ? Math.round((done / total) * 100) : 0;
-
-        const bar = document.getElementById('importOverallBar');
-        if (bar) {
-            bar.style.width = pct + '%';
-            bar.textContent = `${pct}%`;
-        }
-
-        _renderImportItems(imports);
-
-        if (stats.batch_complete) {
-            clearInterval(_progressInterval);
-            _progressInterval = null;
-            document.getElementById('importCompleteMsg')?.removeAttribute('hidden');
-        }
+        _renderImportProgress(result.statistics || {}, result.imports || {});
     } catch (err) {
         console.error('Import progress poll failed:', err);
     }
 }
 
+function _renderImportProgress(stats, imports) {
+    const activeEl     = document.getElementById('importStatActive');
+    const completedEl  = document.getElementById('importStatCompleted');
+    const failedEl2    = document.getElementById('importStatFailed');
+    if (activeEl)    activeEl.textContent    = stats.active    || 0;
+    if (completedEl) completedEl.textContent = stats.completed || 0;
+    if (failedEl2)   failedEl2.textContent   = stats.failed    || 0;
+
+    const total = stats.total_imports || 0;
+    const done  = (stats.completed || 0) + (stats.failed || 0);
+    const pct   = total > 0 ? Math.round((done / total) * 100) : 0;
+
+    const bar = document.getElementById('importOverallBar');
+    if (bar) {
+        bar.style.width = pct + '%';
+        bar.textContent = `${pct}%`;
+    }
+
+    _renderImportItems(imports);
+
+    if (stats.batch_complete) {
+        clearInterval(_progressInterval);
+        _progressInterval = null;
+        if (_progressSource) { _progressSource.close(); _progressSource = null; }
+        document.getElementById('importCompleteMsg')?.removeAttribute('hidden');
+    }
+}
+
 function _renderImportItems(imports) {
     const container = document.getElementById('importProgressList');
     if (!container) return;
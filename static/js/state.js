@@ -83,7 +83,18 @@ window.AppState = (function () {
     }
 
     function updateDownloads(data) {
-        _state.downloads = data.downloads || {};
+        if (data.downloads) {
+            // Full snapshot sent as the first event of each stream
+            _state.downloads = data.downloads;
+        } else {
+            // Delta: changed fields per ASIN, plus ASINs that left the queue
+            const downloads = { ..._state.downloads };
+            Object.entries(data.updates || {}).forEach(([asin, patch]) => {
+                downloads[asin] = { ...(downloads[asin] || {}), ...patch };
+            });
+            (data.removed || []).forEach(asin => { delete downloads[asin]; });
+            _state.downloads = downloads;
+        }
         _state.downloadStats = data.stats || {};
         _emit('appstate:downloadschange', {
             downloads: _state.downloads,
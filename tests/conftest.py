@@ -0,0 +1,46 @@
+"""
+Shared fixtures: a fresh SQLite database per test.
+"""
+
+import time
+
+import pytest
+
+import utils.db as db_module
+from utils.db import get_db, init_db, migrate
+
+
+def _close_connection():
+    conn = getattr(db_module._local, "conn", None)
+    if conn is not None:
+        conn.close()
+        del db_module._local.conn
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point utils.db at an empty, migrated database under ``tmp_path``."""
+    _close_connection()
+    monkeypatch.setattr(db_module, "_db_path", None)
+    init_db(tmp_path / "audible.db")
+    migrate()
+    conn = get_db()
+    conn.execute(
+        "INSERT INTO accounts (name, region) VALUES (?, ?)", ("tester", "us")
+    )
+    conn.commit()
+    yield conn
+    _close_connection()
+
+
+@pytest.fixture
+def library_dir(db, tmp_path):
+    """Register an empty library directory named ``main`` and return its path."""
+    path = tmp_path / "library"
+    path.mkdir()
+    db.execute(
+        "INSERT INTO libraries (name, path, created_at) VALUES (?, ?, ?)",
+        ("main", str(path), time.time()),
+    )
+    db.commit()
+    return path
@@ -0,0 +1,113 @@
+"""
+Tests for queue change tracking and resuming the download progress stream.
+"""
+
+import gzip
+import json
+from collections import deque
+
+import pytest
+from flask import Flask
+
+from downloader import DownloadQueueManager
+
+
+@pytest.fixture
+def queue(db, monkeypatch):
+    """A fresh DownloadQueueManager bound to the test database."""
+    monkeypatch.setattr(DownloadQueueManager, "_instance", None)
+    monkeypatch.setattr(DownloadQueueManager, "_stats_cache", None)
+    return DownloadQueueManager()
+
+
+def test_version_and_changed_items(queue):
+    start = queue.version
+    queue.add_download_to_queue("A", "Book A")
+    queue.add_download_to_queue("B", "Book B")
+    after_add = queue.version
+    queue.update_download("A", {"state": "downloading"})
+
+    assert after_add == start + 2
+    assert queue.version == after_add + 1
+    assert set(queue.get_items_changed_since(start)) == {"A", "B"}
+    assert set(queue.get_items_changed_since(after_add)) == {"A"}
+    assert queue.get_items_changed_since(queue.version) == {}
+
+
+def test_removals_are_logged_by_version(queue):
+    queue.add_download_to_queue("A", "Book A")
+    queue.add_download_to_queue("B", "Book B")
+    before = queue.version
+    queue.remove_from_queue("A")
+
+    assert queue.version == before + 1
+    assert queue.get_items_removed_since(before) == ["A"]
+    assert queue.get_items_removed_since(queue.version) == []
+    assert "A" not in queue.get_items_changed_since(0)
+    # A version the queue has not reached yet cannot be resumed from
+    assert queue.get_items_removed_since(queue.version + 1) is None
+
+
+def test_removal_history_overflow_requires_snapshot(queue, monkeypatch):
+    monkeypatch.setattr(queue, "_removed_items", deque(maxlen=2))
+    start = queue.version
+    for asin in ("A", "B", "C"):
+        queue.add_download_to_queue(asin, asin)
+    for asin in ("A", "B", "C"):
+        queue.remove_from_queue(asin)
+
+    assert queue.get_items_removed_since(start) is None
+    assert queue.get_items_removed_since(queue.version - 2) == ["B", "C"]
+
+
+def _first_event(queue, monkeypatch, last_event_id=None):
+    import routes.download as download_routes
+
+    monkeypatch.setattr(download_routes, "queue_manager", queue)
+    monkeypatch.setattr(download_routes, "_progress_cache", {})
+    app = Flask(__name__)
+    headers = {"Last-Event-ID": last_event_id} if last_event_id else {}
+    with app.test_request_context("/api/download/progress-stream", headers=headers):
+        response = download_routes.download_progress_stream()
+        events = iter(response.response)
+        event = next(events)
+        events.close()
+
+    event_id, data = event.decode().split("\n")[:2]
+    assert event_id == f"id: {queue.epoch}-{queue.version}"
+    return json.loads(data[len("data: "):])
+
+
+def test_progress_stream_resumes_from_last_event_id(queue, monkeypatch):
+    queue.add_download_to_queue("A", "Book A")
+    queue.add_download_to_queue("B", "Book B")
+    seen = f"{queue.epoch}-{queue.version}"
+    queue.update_download("A", {"state": "downloading", "progress_percent": 40})
+    queue.remove_from_queue("B")
+    queue.add_download_to_queue("C", "Book C")
+
+    event = _first_event(queue, monkeypatch, seen)
+
+    assert "downloads" not in event
+    assert set(event["updates"]) == {"A", "C"}
+    assert event["updates"]["A"]["progress_percent"] == 40
+    assert event["removed"] == ["B"]
+
+
+def test_progress_stream_sends_snapshot_for_unknown_event_id(queue, monkeypatch):
+    queue.add_download_to_queue("A", "Book A")
+
+    for last_event_id in (None, "otherepoch-1", f"{queue.epoch}-{queue.version + 5}"):
+        event = _first_event(queue, monkeypatch, last_event_id)
+        assert set(event["downloads"]) == {"A"}
+        assert "updates" not in event
+
+
+def test_gzip_event_stream_is_a_complete_gzip_member():
+    import routes.download as download_routes
+
+    events = [b"data: one\n\n", b"data: two\n\n"]
+    chunks = list(download_routes._gzip_event_stream(iter(events)))
+
+    assert len(chunks) == len(events) + 1
+    assert gzip.decompress(b"".join(chunks)) == b"".join(events)
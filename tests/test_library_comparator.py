@@ -0,0 +1,72 @@
+"""
+Tests for LibraryComparator.compare_libraries and its author-word index.
+"""
+
+from library_scanner import LibraryComparator
+from utils.fuzzy_matching import normalize_for_matching, word_set
+
+
+AUDIBLE = [
+    {"asin": "A1", "title": "Project Hail Mary", "authors": "Andy Weir"},
+    {"asin": "A2", "title": "The Way of Kings", "authors": "Brandon Sanderson"},
+    {"asin": "A3", "title": "Dune Messiah", "authors": "Frank Herbert"},
+    {"asin": "A4", "title": "The Hobbit", "authors": "J. R. R. Tolkien"},
+]
+
+LOCAL = [
+    {"title": "Project Hail Mary", "authors": "Andy Weir"},
+    {"title": "Way of Kings", "authors": "Brandon Sanderson"},
+    {"title": "Dune", "authors": "Frank Herbert"},
+    {"title": "The Hobbit", "authors": "Somebody Else"},
+    {"title": "Extra Book", "authors": "Nobody Known"},
+]
+
+
+def test_compare_libraries_splits_available_missing_and_local_only():
+    result = LibraryComparator().compare_libraries(AUDIBLE, LOCAL)
+
+    assert [b["asin"] for b in result["available_locally"]] == ["A1", "A2"]
+    assert [b["asin"] for b in result["missing_from_local"]] == ["A3", "A4"]
+    assert [b["title"] for b in result["local_only"]] == ["Dune", "The Hobbit", "Extra Book"]
+    assert result["available_count"] == 2
+    assert result["missing_count"] == 2
+    assert result["local_only_count"] == 3
+    assert result["total_audible"] == 4
+    assert result["total_local"] == 5
+
+
+def test_compare_libraries_one_local_book_settles_every_audible_match():
+    audible = [
+        {"asin": "B1", "title": "The Way of Kings", "authors": "Brandon Sanderson"},
+        {"asin": "B2", "title": "Way of Kings", "authors": "Brandon Sanderson"},
+    ]
+    local = [{"title": "Way of Kings", "authors": "Brandon Sanderson"}]
+
+    result = LibraryComparator().compare_libraries(audible, local)
+
+    assert result["available_count"] == 2
+    assert result["local_only"] == []
+
+
+def test_author_candidates_match_brute_force_jaccard():
+    comparator = LibraryComparator()
+    books = [
+        {"title": "One", "authors": "Brandon Sanderson"},
+        {"title": "Two", "authors": "Brandon Sanderson, Janci Patterson"},
+        {"title": "Three", "authors": "Sanderson Brandon"},
+        {"title": "Four", "authors": "Frank Herbert"},
+        {"title": "Five", "authors": ""},
+    ]
+    index = comparator._build_match_index(books)
+
+    for author in ("Brandon Sanderson", "Frank Herbert", "Brian Herbert", "Nobody"):
+        query = word_set(normalize_for_matching(author))
+        expected = []
+        for i, book in enumerate(books):
+            words = word_set(normalize_for_matching(book["authors"]))
+            union = query | words
+            similarity = len(query & words) / len(union) if union else 0
+            if similarity >= 0.7:
+                expected.append((i, similarity))
+
+        assert comparator._author_candidates(normalize_for_matching(author), index) == expected
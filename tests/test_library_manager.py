@@ -0,0 +1,54 @@
+"""
+Tests for LibraryManager's shared duplicate index.
+"""
+
+import app.services.library_manager as library_manager
+from app.services.library_manager import LibraryManager
+
+
+def _add(manager, library_dir, asin, title):
+    path = library_dir / f"{asin}.m4b"
+    path.write_bytes(b"")
+    manager.add_to_library(asin, title, str(path), library_name="main")
+    return path
+
+
+def test_duplicate_index_is_shared_until_downloaded_books_change(db, library_dir):
+    manager = LibraryManager(library_dir, "tester")
+    _add(manager, library_dir, "A1", "Project Hail Mary")
+
+    index = manager.get_duplicate_index(str(library_dir))
+    assert LibraryManager(library_dir, "tester").get_duplicate_index(str(library_dir)) is index
+    assert [entry[0] for entry in index["titles"]] == ["A1"]
+
+    _add(manager, library_dir, "A2", "The Way of Kings")
+    added = manager.get_duplicate_index(str(library_dir))
+    assert added is not index
+    assert set(added["asins"]) == {"A1", "A2"}
+    assert [entry[0] for entry in added["titles"]] == ["A1", "A2"]
+
+    manager.remove_from_library("A1")
+    removed = manager.get_duplicate_index(str(library_dir))
+    assert removed is not added
+    assert set(removed["asins"]) == {"A2"}
+
+
+def test_duplicate_index_is_rebuilt_after_it_expires(db, library_dir, monkeypatch):
+    manager = LibraryManager(library_dir, "tester")
+    _add(manager, library_dir, "A1", "Project Hail Mary")
+    index = manager.get_duplicate_index(str(library_dir))
+
+    monkeypatch.setattr(library_manager, "DUPLICATE_INDEX_TTL_SECONDS", 0)
+    assert manager.get_duplicate_index(str(library_dir)) is not index
+
+
+def test_check_fuzzy_duplicate_uses_title_words(db, library_dir):
+    manager = LibraryManager(library_dir, "tester")
+    path = _add(manager, library_dir, "A1", "The Way of Kings")
+    _add(manager, library_dir, "A2", "Project Hail Mary")
+
+    match = manager.check_fuzzy_duplicate("Way of Kings", "Brandon Sanderson", str(library_dir))
+    assert match is not None
+    assert match[:2] == ("A1", str(path))
+
+    assert manager.check_fuzzy_duplicate("Dune", "Frank Herbert", str(library_dir)) is None
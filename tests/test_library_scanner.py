@@ -0,0 +1,50 @@
+"""
+Tests for LocalLibraryScanner's reuse of scan_cache rows on rescan.
+"""
+
+import struct
+
+from mutagen.mp4 import MP4
+
+from app.services.library_manager import LibraryManager
+from library_scanner import LocalLibraryScanner
+from library_storage import LibraryStorage
+
+
+def _box(kind, payload):
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _write_m4b(path, title):
+    """Write a minimal tagged MP4 container (a movie header and no tracks)."""
+    mvhd = _box(
+        b"mvhd",
+        bytes(4) + struct.pack(">IIII", 0, 0, 1000, 5000)
+        + b"\x00\x01\x00\x00\x01\x00" + bytes(70) + struct.pack(">I", 2),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_box(b"ftyp", b"M4B \x00\x00\x00\x00M4B isom") + _box(b"moov", mvhd))
+    audio = MP4(str(path))
+    audio.add_tags()
+    audio["\xa9nam"] = [title]
+    audio.save()
+
+
+def test_rescan_after_sync_keeps_scanner_metadata(db, library_dir, tmp_path):
+    book_path = library_dir / "Some Author" / "1994 - Parsed Title" / "book_german.m4b"
+    _write_m4b(book_path, "Raw Tag")
+    scanner = LocalLibraryScanner(str(library_dir), storage=LibraryStorage(str(tmp_path / "library_data")))
+
+    _, books = scanner.scan_and_save_library()
+    assert [(b["title"], b["language"]) for b in books] == [("Parsed Title", "de")]
+
+    # The sync overwrites the row with raw tag values
+    LibraryManager(library_dir, "tester").scan_library("main")
+    row = db.execute("SELECT title, language FROM scan_cache").fetchone()
+    assert (row["title"], row["language"]) == ("Raw Tag", None)
+
+    _, books = scanner.scan_and_save_library()
+    assert [(b["title"], b["language"]) for b in books] == [("Parsed Title", "de")]
+    row = db.execute("SELECT title, language, mtime_ns FROM scan_cache").fetchone()
+    assert (row["title"], row["language"]) == ("Parsed Title", "de")
+    assert row["mtime_ns"] == book_path.stat().st_mtime_ns
@@ -0,0 +1,92 @@
+"""
+Tests for LibraryStorage scan_cache persistence and the built library dict cache.
+"""
+
+from library_storage import LibraryStorage
+
+
+def _book(library_dir, name, title, **fields):
+    return {
+        "file_path": str(library_dir / name),
+        "title": title,
+        "authors": "Some Author",
+        "file_size": 1000,
+        "mtime_ns": 1,
+        **fields,
+    }
+
+
+def _rows(db):
+    return {
+        row["file_path"]: dict(row)
+        for row in db.execute("SELECT * FROM scan_cache WHERE library_name='main'")
+    }
+
+
+def test_delta_save_deletes_stale_rows_and_rewrites_only_changed(db, library_dir, tmp_path):
+    storage = LibraryStorage(str(tmp_path / "library_data"))
+    kept = _book(library_dir, "kept.m4b", "Kept")
+    edited = _book(library_dir, "edited.m4b", "Before")
+    gone = _book(library_dir, "gone.m4b", "Gone")
+    storage.save_library(str(library_dir), [kept, edited, gone])
+    first_scan = _rows(db)[kept["file_path"]]["last_scanned"]
+
+    # Unchanged books are passed in ``books`` only; their rows must not be rewritten
+    kept_in_scan = dict(kept, title="Not written")
+    edited_now = dict(edited, title="After")
+    added = _book(library_dir, "added.m4b", "Added")
+    storage.save_library(
+        str(library_dir),
+        [kept_in_scan, edited_now, added],
+        changed_books=[edited_now, added],
+    )
+
+    rows = _rows(db)
+    assert set(rows) == {kept["file_path"], edited["file_path"], added["file_path"]}
+    assert rows[kept["file_path"]]["title"] == "Kept"
+    assert rows[kept["file_path"]]["last_scanned"] > first_scan
+    assert rows[edited["file_path"]]["title"] == "After"
+    assert rows[added["file_path"]]["title"] == "Added"
+
+
+def test_full_save_replaces_all_rows(db, library_dir, tmp_path):
+    storage = LibraryStorage(str(tmp_path / "library_data"))
+    storage.save_library(str(library_dir), [_book(library_dir, "a.m4b", "A"), _book(library_dir, "b.m4b", "B")])
+    storage.save_library(str(library_dir), [_book(library_dir, "b.m4b", "B2")])
+
+    rows = _rows(db)
+    assert list(rows) == [str(library_dir / "b.m4b")]
+    assert rows[str(library_dir / "b.m4b")]["title"] == "B2"
+
+
+def test_library_dict_is_reused_until_scan_rows_change(db, library_dir, tmp_path):
+    storage = LibraryStorage(str(tmp_path / "library_data"))
+    storage.save_library(str(library_dir), [_book(library_dir, "a.m4b", "A", language="english")])
+
+    library = storage.load_library_by_path(str(library_dir))
+    assert storage.load_library_by_path(str(library_dir)) is library
+    assert LibraryStorage(str(tmp_path / "library_data")).load_library_by_path(str(library_dir)) is library
+    assert library["book_count"] == 1
+    assert library["stats"]["language_counts"] == {"english": 1}
+
+    added = _book(library_dir, "b.m4b", "B", language="german")
+    storage.save_library(
+        str(library_dir),
+        [_book(library_dir, "a.m4b", "A", language="english"), added],
+        changed_books=[added],
+    )
+    rebuilt = storage.load_library_by_path(str(library_dir))
+    assert rebuilt is not library
+    assert rebuilt["book_count"] == 2
+    assert rebuilt["stats"]["language_counts"] == {"english": 1, "german": 1}
+
+
+def test_library_dict_is_rebuilt_after_rows_are_deleted(db, library_dir, tmp_path):
+    storage = LibraryStorage(str(tmp_path / "library_data"))
+    storage.save_library(str(library_dir), [_book(library_dir, "a.m4b", "A")])
+    library = storage.load_library_by_path(str(library_dir))
+
+    assert storage.delete_library(library["id"])
+    emptied = storage.load_library_by_path(str(library_dir))
+    assert emptied is not library
+    assert emptied["books"] == []
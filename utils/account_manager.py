@@ -1,10 +1,14 @@
 """
 Shared utilities for account and library lookups backed by SQLite (via ConfigManager).
 """
-from typing import Dict, Any, Tuple
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
 from utils.errors import AccountNotFoundError, LibraryNotFoundError, ValidationError
 import audible
 
+# Parsed auth files keyed by path, invalidated when the file's mtime changes
+_AUTH_CACHE: Dict[str, Tuple[int, audible.Authenticator]] = {}
+
 
 def get_account_or_404(account_name: str) -> Tuple[Dict[str, Any], str]:
     """
@@ -21,13 +25,11 @@ def get_account_or_404(account_name: str) -> Tuple[Dict[str, Any], str]:
     """
     from utils.config_manager import get_config_manager
     
-    config_manager = get_config_manager()
-    accounts = config_manager.get_accounts()
+    account_data = get_config_manager().get_account(account_name)
     
-    if account_name not in accounts:
+    if account_data is None:
         raise AccountNotFoundError(account_name)
     
-    account_data = accounts[account_name]
     region = account_data.get('region', 'us')
     
     return account_data, region
@@ -49,13 +51,11 @@ def get_library_config(library_name: str) -> Tuple[Dict[str, Any], str]:
     """
     from utils.config_manager import get_config_manager
     
-    config_manager = get_config_manager()
-    libraries = config_manager.get_libraries()
+    library_config = get_config_manager().get_library(library_name)
     
-    if library_name not in libraries:
+    if library_config is None:
         raise LibraryNotFoundError(library_name)
     
-    library_config = libraries[library_name]
     library_path = library_config.get('path')
     
     if not library_path:
@@ -68,6 +68,57 @@ def get_library_config(library_name: str) -> Tuple[Dict[str, Any], str]:
     return library_config, library_path
 
 
+def get_cached_authenticator(auth_file: Path) -> audible.Authenticator:
+    """
+    Load an Authenticator from file, reusing the parsed copy while the file is unchanged.
+    
+    Args:
+        auth_file: Path to the account's auth.json
+    
+    Returns:
+        Authenticator instance
+    
+    Raises:
+        OSError: If the file can't be stat'ed
+        Exception: Whatever audible raises for an unreadable auth file
+    """
+    return _load_cached_authenticator(auth_file, auth_file.stat().st_mtime_ns)
+
+
+def find_cached_authenticator(auth_file: Path) -> Optional[audible.Authenticator]:
+    """
+    Like get_cached_authenticator, but return None when the file doesn't exist.
+    
+    A single stat() both checks for the file and validates the cache, instead
+    of an exists() call followed by get_cached_authenticator's own stat().
+    
+    Args:
+        auth_file: Path to the account's auth.json
+    
+    Returns:
+        Authenticator instance, or None if the account has no auth file
+    
+    Raises:
+        Exception: Whatever audible raises for an unreadable auth file
+    """
+    try:
+        mtime_ns = auth_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_cached_authenticator(auth_file, mtime_ns)
+
+
+def _load_cached_authenticator(auth_file: Path, mtime_ns: int) -> audible.Authenticator:
+    key = str(auth_file)
+    cached = _AUTH_CACHE.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    
+    auth = audible.Authenticator.from_file(auth_file)
+    _AUTH_CACHE[key] = (mtime_ns, auth)
+    return auth
+
+
 def load_authenticator(account_name: str, region: str) -> audible.Authenticator:
     """
     Load Audible authenticator from file for an account.
@@ -85,19 +136,17 @@ def load_authenticator(account_name: str, region: str) -> audible.Authenticator:
     from utils.constants import get_auth_file_path
     from utils.errors import AuthenticationError
     
-    auth_file = get_auth_file_path(account_name)
-    
-    if not auth_file.exists():
-        raise AuthenticationError(
-            f"Account '{account_name}' is not authenticated",
-            details={'account_name': account_name}
-        )
-    
     try:
-        auth = audible.Authenticator.from_file(auth_file)
-        return auth
+        auth = find_cached_authenticator(get_auth_file_path(account_name))
     except Exception as e:
         raise AuthenticationError(
             f"Failed to load authentication for account '{account_name}': {str(e)}",
             details={'account_name': account_name, 'error': str(e)}
         )
+    
+    if auth is None:
+        raise AuthenticationError(
+            f"Account '{account_name}' is not authenticated",
+            details={'account_name': account_name}
+        )
+    return auth
@@ -0,0 +1,92 @@
+"""
+Shared background event loop for running coroutines from synchronous code.
+
+Flask views used to call asyncio.run() per request, which builds and tears
+down a fresh event loop every time. run_async() submits the coroutine to one
+long-lived loop running in a daemon thread instead.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+# In-flight coalesced calls by key; only touched from the shared loop's thread
+_inflight: Dict[Hashable, asyncio.Future] = {}
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background loop, starting its thread on first use.
+
+    Returns:
+        The running background event loop
+    """
+    global _loop
+    if _loop is None:
+        with _lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='async-runner', daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def submit_async(coro: Coroutine) -> Future:
+    """
+    Schedule a coroutine on the shared loop without waiting for it.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        concurrent.futures.Future resolving to the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared loop and block until it completes.
+
+    Must not be called from a coroutine already running on the shared loop.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait for the result (None waits indefinitely)
+
+    Returns:
+        The coroutine's return value; exceptions raised by it propagate
+    """
+    return submit_async(coro).result(timeout)
+
+
+async def coalesce(key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Share one in-flight call among concurrent callers using the same key.
+
+    The first caller starts factory(); callers arriving before it finishes
+    await the same task instead of starting their own. Must run on the
+    shared loop (i.e. inside a coroutine passed to run_async/submit_async).
+
+    Args:
+        key: Identifies calls that may share a result
+        factory: Zero-argument callable returning the awaitable to run
+
+    Returns:
+        The shared call's result; its exception propagates to every caller
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Future) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(_forget)
+    # Shield so one caller timing out or being cancelled does not cancel the others
+    return await asyncio.shield(task)
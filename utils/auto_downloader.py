@@ -3,10 +3,11 @@ Auto-downloader: polls an Audible account's library and downloads new purchases.
 Runs in APScheduler background threads — no Flask request context available here,
 so we accept the Flask app instance and use app_context() explicitly.
 """
-import asyncio
 import logging
 from datetime import datetime, timezone
 
+from utils.async_runner import run_async
+
 logger = logging.getLogger(__name__)
 
 # Book fields that can be used in routing rules
@@ -48,7 +49,7 @@ def run_auto_download(account_name: str, region: str, rules: list, default_libra
 
     with app.app_context():
         try:
-            library = asyncio.run(fetch_library(account_name, region))
+            library = run_async(fetch_library(account_name, region))
         except Exception as exc:
             logger.error("Auto-download: failed to fetch library for '%s': %s", account_name, exc)
             _update_last_run(config_manager, account_name, f"Error fetching library: {exc}")
@@ -59,6 +60,12 @@ def run_auto_download(account_name: str, region: str, rules: list, default_libra
             _update_last_run(config_manager, account_name, "Library empty or unavailable")
             return
 
+        # Refresh the shared library cache so the UI and download submissions reuse this fetch
+        from utils.library_cache import write_library_cache
+        for book in library:
+            book['account_name'] = account_name
+        write_library_cache(account_name, library)
+
         # Determine which ASINs are already downloaded (authoritative source: books table)
         from utils.db import get_db
         from app.models import BookStatus
@@ -119,7 +126,7 @@ def run_auto_download(account_name: str, region: str, rules: list, default_libra
                 len(books), lib_name
             )
             try:
-                asyncio.run(download_books(account_name, region, books, library_path=lib_path))
+                run_async(download_books(account_name, region, books, library_path=lib_path))
                 download_counts.append(f"{lib_name}: {len(books)}")
             except Exception as exc:
                 logger.error(
@@ -10,11 +10,12 @@ are still managed by SettingsManager — this class does not touch them.
 Auth files (config/auth/*/auth.json) are also untouched.
 """
 
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from utils.db import get_db, transaction
+from utils.db import get_db, get_db_path, transaction
 from utils.constants import CONFIG_DIR, AUTH_DIR
 
 
@@ -35,6 +36,16 @@ class ConfigManager:
 
     def __init__(self):
         self._ensure_directories()
+        # Accounts and libraries are read on most requests but written
+        # rarely, and every write goes through this class, so keep them in
+        # memory and drop the copy on write. Keyed by database path so
+        # init_db() to a new file never serves rows from the old one.
+        self._cache_lock = threading.Lock()
+        self._cache_generations: Dict[str, int] = {"accounts": 0, "libraries": 0}
+        self._caches: Dict[str, tuple] = {}
+        # (accounts dict it was built from, token -> account name); rebuilt
+        # whenever the cached accounts dict is replaced
+        self._token_index: Optional[Tuple[Dict[str, Any], Dict[str, str]]] = None
 
     def _ensure_directories(self) -> None:
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -50,14 +61,7 @@ class ConfigManager:
             Dictionary of account data keyed by account name, each entry
             matching the old JSON shape (including nested ``auto_download``).
         """
-        db = get_db()
-        accounts: Dict[str, Any] = {}
-
-        for row in db.execute("SELECT * FROM accounts ORDER BY name"):
-            name = row["name"]
-            accounts[name] = self._row_to_account(row, db)
-
-        return accounts
+        return {name: _copy_account(account) for name, account in self._cached_accounts().items()}
 
     def save_accounts(self, accounts: Dict[str, Any]) -> None:
         """
@@ -75,6 +79,7 @@ class ConfigManager:
 
             for name, data in accounts.items():
                 self._upsert_account(conn, name, data)
+        self._invalidate("accounts")
 
     def get_account(self, account_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -83,11 +88,31 @@ class ConfigManager:
         Returns:
             Account data dictionary or None if not found.
         """
-        db = get_db()
-        row = db.execute("SELECT * FROM accounts WHERE name=?", (account_name,)).fetchone()
-        if row is None:
+        account = self._cached_accounts().get(account_name)
+        return _copy_account(account) if account is not None else None
+
+    def get_account_by_token(self, token: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Find the account whose pending invitation token is ``token``.
+
+        Returns:
+            Tuple of (account name, account data), or None if no account
+            has that token.
+        """
+        accounts = self._cached_accounts()
+        index = self._token_index
+        if index is None or index[0] is not accounts:
+            index = (accounts, {
+                account["pending_invitation_token"]: name
+                for name, account in accounts.items()
+                if account.get("pending_invitation_token")
+            })
+            self._token_index = index
+
+        account_name = index[1].get(token)
+        if account_name is None:
             return None
-        return self._row_to_account(row, db)
+        return account_name, _copy_account(accounts[account_name])
 
     def update_account(self, account_name: str, updates: Dict[str, Any]) -> None:
         """
@@ -109,6 +134,7 @@ class ConfigManager:
 
         with transaction() as conn:
             self._upsert_account(conn, account_name, merged)
+        self._invalidate("accounts")
 
     def delete_account(self, account_name: str) -> None:
         """
@@ -123,6 +149,7 @@ class ConfigManager:
             raise ConfigurationError(f"Account '{account_name}' not found")
         with transaction() as conn:
             conn.execute("DELETE FROM accounts WHERE name=?", (account_name,))
+        self._invalidate("accounts")
 
     # ========== Libraries Management ==========
 
@@ -133,11 +160,7 @@ class ConfigManager:
         Returns:
             Dictionary of library configurations keyed by library name.
         """
-        db = get_db()
-        return {
-            row["name"]: {"path": row["path"], "created_at": row["created_at"]}
-            for row in db.execute("SELECT * FROM libraries ORDER BY name")
-        }
+        return {name: dict(library) for name, library in self._cached_libraries().items()}
 
     def save_libraries(self, libraries: Dict[str, Any]) -> None:
         """
@@ -158,6 +181,7 @@ class ConfigManager:
                     """,
                     (name, data.get("path", ""), data.get("created_at", time.time())),
                 )
+        self._invalidate("libraries")
 
     def get_library(self, library_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -166,11 +190,8 @@ class ConfigManager:
         Returns:
             Library configuration dictionary or None if not found.
         """
-        db = get_db()
-        row = db.execute("SELECT * FROM libraries WHERE name=?", (library_name,)).fetchone()
-        if row is None:
-            return None
-        return {"path": row["path"], "created_at": row["created_at"]}
+        library = self._cached_libraries().get(library_name)
+        return dict(library) if library is not None else None
 
     def update_library(self, library_name: str, updates: Dict[str, Any]) -> None:
         """
@@ -188,6 +209,7 @@ class ConfigManager:
                 "UPDATE libraries SET path=?, created_at=? WHERE name=?",
                 (merged.get("path", ""), merged.get("created_at", time.time()), library_name),
             )
+        self._invalidate("libraries")
 
     def delete_library(self, library_name: str) -> None:
         """
@@ -202,6 +224,7 @@ class ConfigManager:
             raise ConfigurationError(f"Library '{library_name}' not found")
         with transaction() as conn:
             conn.execute("DELETE FROM libraries WHERE name=?", (library_name,))
+        self._invalidate("libraries")
 
     # ========== Settings Management ==========
     # Settings (naming_pattern, invitation_token) remain in settings.json.
@@ -210,12 +233,11 @@ class ConfigManager:
     def get_settings(self) -> Dict[str, Any]:
         import json
         settings_file = CONFIG_DIR / "settings.json"
-        if not settings_file.exists():
-            return {}
         try:
             with open(settings_file, "r", encoding="utf-8") as fh:
                 return json.load(fh)
         except (json.JSONDecodeError, IOError):
+            # Includes FileNotFoundError, so no separate exists() check
             return {}
 
     def save_settings(self, settings: Dict[str, Any]) -> None:
@@ -273,6 +295,51 @@ class ConfigManager:
 
     # ========== Private helpers ==========
 
+    def _cached_accounts(self) -> Dict[str, Any]:
+        """Return the shared accounts dict, loading it from the database if stale."""
+        return self._cached("accounts", self._load_accounts)
+
+    def _cached_libraries(self) -> Dict[str, Any]:
+        """Return the shared libraries dict, loading it from the database if stale."""
+        return self._cached("libraries", self._load_libraries)
+
+    def _cached(self, kind: str, load) -> Dict[str, Any]:
+        """Return the in-memory copy of ``kind``, calling ``load()`` if it is stale."""
+        db_path = get_db_path()
+        with self._cache_lock:
+            cached = self._caches.get(kind)
+            generation = self._cache_generations[kind]
+        if cached is not None and cached[0] == db_path:
+            return cached[1]
+
+        value = load()
+
+        with self._cache_lock:
+            # A write that landed while we were reading makes this copy stale
+            if generation == self._cache_generations[kind]:
+                self._caches[kind] = (db_path, value)
+        return value
+
+    def _invalidate(self, kind: str) -> None:
+        """Drop the in-memory copy of ``kind`` after a write."""
+        with self._cache_lock:
+            self._cache_generations[kind] += 1
+            self._caches.pop(kind, None)
+
+    def _load_accounts(self) -> Dict[str, Any]:
+        db = get_db()
+        return {
+            row["name"]: self._row_to_account(row, db)
+            for row in db.execute("SELECT * FROM accounts ORDER BY name")
+        }
+
+    def _load_libraries(self) -> Dict[str, Any]:
+        db = get_db()
+        return {
+            row["name"]: {"path": row["path"], "created_at": row["created_at"]}
+            for row in db.execute("SELECT * FROM libraries ORDER BY name")
+        }
+
     def _row_to_account(self, row: Any, db: Any) -> Dict[str, Any]:
         """Convert a DB row + rules query into the old JSON-shaped dict."""
         name = row["name"]
@@ -351,6 +418,18 @@ class ConfigManager:
             )
 
 
+def _copy_account(account: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an account deep enough that callers can mutate it freely."""
+    copied = dict(account)
+    auto_dl = account.get("auto_download")
+    if auto_dl is not None:
+        copied["auto_download"] = {
+            **auto_dl,
+            "rules": [dict(rule) for rule in auto_dl.get("rules") or []],
+        }
+    return copied
+
+
 # Global singleton instance
 _config_manager: Optional[ConfigManager] = None
 
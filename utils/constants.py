@@ -53,8 +53,17 @@ def get_account_auth_dir(account_name: str) -> Path:
 # Download configuration constants
 MAX_CONCURRENT_DOWNLOADS = 3  # Limit concurrent downloads to prevent API throttling
 DOWNLOAD_TIMEOUT_SECONDS = 300  # 5 minutes timeout for download operations
+AUDIBLE_API_MAX_RATE = 8  # Audible API calls per second, across all accounts
+MAX_CONCURRENT_MATCHES = 8  # Import files matched against the catalog at once
+CATALOG_SEARCH_CACHE_SIZE = 512  # Catalog search results kept in memory
+CATALOG_SEARCH_CACHE_TTL_SECONDS = 3600  # Re-query the catalog after an hour
 CLEANUP_THRESHOLD_HOURS = 24  # Remove temporary files older than 24 hours
 
+# Shared HTTP connection pool for audio file downloads
+HTTP_MAX_CONNECTIONS = 20  # Upper bound on open connections across all downloads
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10  # Idle connections kept for reuse
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60  # Close idle connections after this long
+
 # FFmpeg conversion constants
 FFMPEG_AUDIO_CODEC = "copy"  # Copy audio stream without re-encoding
 FFMPEG_OUTPUT_FORMAT = "ipod"  # M4B container format
@@ -8,6 +8,8 @@ a one-time migration from existing JSON config files.
 Schema version history:
   1 — initial schema (accounts, libraries, books, download_queue,
                        download_batches, auto_download_rules, scan_cache)
+  2 — library_cache table
+  3 — scan_cache.mtime_ns / sequence / isbn for incremental rescans
 """
 
 import json
@@ -25,7 +27,7 @@ logger = logging.getLogger(__name__)
 _db_path: Optional[Path] = None
 _local = threading.local()
 
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 3
 
 _SCHEMA_DDL = """
 PRAGMA journal_mode=WAL;
@@ -127,6 +129,9 @@ CREATE TABLE IF NOT EXISTS scan_cache (
     language     TEXT,
     file_size    INTEGER,
     duration_sec REAL,
+    mtime_ns     INTEGER,
+    sequence     TEXT,
+    isbn         TEXT,
     last_scanned REAL NOT NULL
 );
 CREATE INDEX IF NOT EXISTS idx_scan_library ON scan_cache(library_name);
@@ -152,6 +157,11 @@ def init_db(db_path: Path) -> None:
     _db_path = db_path
 
 
+def get_db_path() -> Optional[Path]:
+    """Return the database path set by init_db(), or None before it is called."""
+    return _db_path
+
+
 def get_db() -> sqlite3.Connection:
     """
     Return the thread-local SQLite connection, creating it if needed.
@@ -244,6 +254,12 @@ def migrate() -> None:
                 );
             """)
 
+        if current_version < 3:
+            # v2 → v3: file mtime + fields needed to reuse scan_cache rows on rescan
+            _add_column_if_missing(conn, "scan_cache", "mtime_ns", "INTEGER")
+            _add_column_if_missing(conn, "scan_cache", "sequence", "TEXT")
+            _add_column_if_missing(conn, "scan_cache", "isbn", "TEXT")
+
         # user_version cannot be set inside a normal transaction via parameter binding
         conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         logger.info("Database migration complete (version %d)", SCHEMA_VERSION)
@@ -253,6 +269,13 @@ def migrate() -> None:
         raise
 
 
+def _add_column_if_missing(conn: sqlite3.Connection, table: str, column: str, decl: str) -> None:
+    """ALTER TABLE ... ADD COLUMN unless the column already exists (fresh DDL)."""
+    existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in existing:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
 def _load_json(path: Path) -> dict:
     """Load a JSON file, returning {} if missing or corrupt."""
     if not path.exists():
@@ -2,8 +2,8 @@
 Custom exception classes and error handling utilities.
 Provides standardized error responses for the application.
 """
-from typing import Optional, Dict, Any
-from flask import jsonify
+from typing import Optional, Dict, Any, List
+from flask import Response, current_app, jsonify
 
 
 class AppError(Exception):
@@ -156,6 +156,42 @@ def success_response(data: Optional[Dict] = None, message: Optional[str] = None,
     return jsonify(response), status_code
 
 
+def streamed_success_response(list_key: str, items: List, data: Optional[Dict] = None,
+                              message: Optional[str] = None, status_code: int = 200):
+    """
+    Create a success response whose list field is serialized one item at a time.
+    
+    The body is the same JSON document success_response would produce, but it is
+    streamed so large lists (e.g. a whole Audible library) are never held in
+    memory as a single string.
+    
+    Args:
+        list_key: Key of the list field in the response
+        items: List to stream
+        data: Other response data
+        message: Optional success message
+        status_code: HTTP status code
+    
+    Returns:
+        Tuple of (streaming response, status_code)
+    """
+    head = {"success": True}
+    if message:
+        head['message'] = message
+    if data:
+        head.update(data)
+    head.pop(list_key, None)
+    dumps = current_app.json.dumps
+    
+    def generate():
+        yield '{' + ''.join(f'{dumps(k)}:{dumps(v)},' for k, v in head.items()) + f'{dumps(list_key)}:['
+        for i, item in enumerate(items):
+            yield dumps(item) if i == 0 else ',' + dumps(item)
+        yield ']}'
+    
+    return Response(generate(), mimetype='application/json'), status_code
+
+
 def register_error_handlers(app):
     """
     Register Flask error handlers for custom exceptions.
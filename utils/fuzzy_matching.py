@@ -4,8 +4,61 @@ Used by downloader, library scanner, and importer modules.
 """
 import unicodedata
 import re
+from functools import lru_cache
 
+_SEP_RE = re.compile(r'[:\-_,.;!?()[\]{}"\']')
+_STRIP_TOKENS_RE = re.compile(r'\b(?:band|teil|buch|volume|vol|part|pt)\b')
+_WS_RE = re.compile(r'\s+')
+_DIGITS_RE = re.compile(r'\d+')
 
+# Titles and authors repeat heavily across a comparison run
+NORMALIZE_CACHE_SIZE = 65536
+
+# Highest calculate_similarity() score two texts can reach without sharing a
+# word (substring bonus + full number bonus). Above this threshold, only texts
+# with a common word need to be compared.
+DISJOINT_WORDS_MAX_SIMILARITY = 0.5
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def strip_diacritics(text: str) -> str:
+    """
+    Decompose text to NFD and drop combining marks (e.g. "Café" -> "Cafe").
+
+    Args:
+        text: Text to clean
+
+    Returns:
+        Text without diacritics
+    """
+    # ASCII has no decompositions or combining marks, which covers most titles
+    if text.isascii():
+        return text
+    if not unicodedata.is_normalized('NFD', text):
+        text = unicodedata.normalize('NFD', text)
+    return ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def word_set(text: str) -> frozenset:
+    """
+    Split normalized text into its set of words.
+
+    Args:
+        text: Normalized text
+
+    Returns:
+        Frozen set of whitespace-separated words
+    """
+    return frozenset(text.split())
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _number_set(text: str) -> frozenset:
+    return frozenset(_DIGITS_RE.findall(text))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_for_matching(text: str) -> str:
     """
     Normalize text for fuzzy matching (used for duplicate detection).
@@ -23,19 +76,16 @@ def normalize_for_matching(text: str) -> str:
     text = text.lower()
 
     # Remove diacritics
-    text = unicodedata.normalize('NFD', text)
-    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+    text = strip_diacritics(text)
 
     # Replace common separators and punctuation with spaces
-    text = re.sub(r'[:\-_,.;!?()[\]{}"\']', ' ', text)
+    text = _SEP_RE.sub(' ', text)
 
-    # Remove common volume/part indicators
-    replacements = ['band', 'teil', 'buch', 'volume', 'vol', 'part', 'pt']
-    for word in replacements:
-        text = re.sub(r'\b' + word + r'\b', '', text)
+    # Remove common volume/part indicators (band, teil, buch, volume, vol, part, pt)
+    text = _STRIP_TOKENS_RE.sub('', text)
 
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
 
     return text
 
@@ -59,15 +109,15 @@ def calculate_similarity(text1: str, text2: str) -> float:
         return 1.0
 
     # Word-based similarity
-    words1 = set(text1.split())
-    words2 = set(text2.split())
+    words1 = word_set(text1)
+    words2 = word_set(text2)
 
     if not words1 or not words2:
         return 0.0
 
     # Calculate Jaccard similarity
-    intersection = len(words1.intersection(words2))
-    union = len(words1.union(words2))
+    intersection = len(words1 & words2)
+    union = len(words1) + len(words2) - intersection
     jaccard = intersection / union if union > 0 else 0.0
 
     # Bonus for substring containment
@@ -76,12 +126,12 @@ def calculate_similarity(text1: str, text2: str) -> float:
         substring_bonus = 0.2
 
     # Check for number/volume matching
-    numbers1 = set(re.findall(r'\d+', text1))
-    numbers2 = set(re.findall(r'\d+', text2))
+    numbers1 = _number_set(text1)
+    numbers2 = _number_set(text2)
 
     number_bonus = 0.0
     if numbers1 and numbers2:
-        number_match = len(numbers1.intersection(numbers2)) / max(len(numbers1), len(numbers2))
+        number_match = len(numbers1 & numbers2) / max(len(numbers1), len(numbers2))
         number_bonus = number_match * 0.3
 
     final_score = min(1.0, jaccard + substring_bonus + number_bonus)
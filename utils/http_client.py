@@ -0,0 +1,47 @@
+"""
+Shared httpx client for audio file downloads.
+
+Each download used to open its own httpx.AsyncClient, paying DNS and TLS
+setup for every book. get_download_client() hands out one pooled client per
+event loop (in practice the shared async_runner loop), so keep-alive
+connections to the CDN are reused across books and batches.
+"""
+import asyncio
+import weakref
+
+import httpx
+
+from utils.constants import (
+    DOWNLOAD_TIMEOUT_SECONDS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+# httpx clients are bound to the loop they were first used on
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_download_client() -> httpx.AsyncClient:
+    """
+    Return the pooled download client for the running event loop.
+
+    Must be called from a coroutine. The client stays open for the life of
+    the loop; callers must not close it.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=float(DOWNLOAD_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        _clients[loop] = client
+    return client
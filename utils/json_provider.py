@@ -0,0 +1,76 @@
+"""
+orjson-backed JSON provider for Flask.
+
+jsonify(), request.get_json() and current_app.json use orjson instead of
+the stdlib json module. If orjson cannot be imported the app keeps Flask's
+default provider.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider that encodes and decodes with orjson."""
+
+    # Dates and dataclasses fall through to Flask's default() so they
+    # serialize exactly as they do with the stdlib provider. Keys are sorted
+    # like DefaultJSONProvider.sort_keys; non-ASCII text is emitted as UTF-8
+    # rather than \u escapes, which decodes to the same JSON.
+    option = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_SORT_KEYS
+        if orjson else 0
+    )
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = self.option
+        if not kwargs.get('sort_keys', self.sort_keys):
+            option &= ~orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def dumpb(self, obj) -> bytes:
+        """Encode straight to UTF-8 bytes, skipping the str round trip."""
+        option = self.option
+        if not self.sort_keys:
+            option &= ~orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def json_bytes_encoder(app):
+    """
+    Return a callable encoding objects to JSON bytes with the app's provider.
+
+    Uses OrjsonProvider.dumpb when installed; otherwise encodes the provider's
+    str output.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Callable taking an object and returning UTF-8 JSON bytes
+    """
+    dumpb = getattr(app.json, 'dumpb', None)
+    if dumpb is not None:
+        return dumpb
+    dumps = app.json.dumps
+    return lambda obj: dumps(obj).encode('utf-8')
+
+
+def init_json_provider(app) -> None:
+    """
+    Install OrjsonProvider on the app if orjson is available.
+
+    Args:
+        app: Flask application instance
+    """
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
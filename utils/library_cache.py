@@ -5,19 +5,42 @@ from utils.db import get_db
 
 CACHE_TTL_SECONDS = 6 * 3600
 
+# Parsed book lists keyed by account, valid while the row's fetched_at matches
+_parsed: dict[str, tuple[float, list]] = {}
+
 
 def get_cached_library(account_name: str) -> list | None:
-    """Return cached book list if fresh, else None. Never raises."""
+    """
+    Return cached book list if fresh, else None. Never raises.
+
+    The parsed list is kept in memory and shared between callers until the
+    row is rewritten, so callers must not modify it.
+    """
     try:
-        row = get_db().execute(
-            "SELECT books_json, fetched_at FROM library_cache WHERE account_name = ?",
+        db = get_db()
+        row = db.execute(
+            "SELECT fetched_at FROM library_cache WHERE account_name = ?",
             (account_name,)
         ).fetchone()
         if row is None:
             return None
-        if time.time() - row['fetched_at'] > CACHE_TTL_SECONDS:
+        fetched_at = row['fetched_at']
+        if time.time() - fetched_at > CACHE_TTL_SECONDS:
+            return None
+
+        parsed = _parsed.get(account_name)
+        if parsed and parsed[0] == fetched_at:
+            return parsed[1]
+
+        row = db.execute(
+            "SELECT books_json FROM library_cache WHERE account_name = ? AND fetched_at = ?",
+            (account_name, fetched_at)
+        ).fetchone()
+        if row is None:
             return None
-        return json.loads(row['books_json'])
+        books = json.loads(row['books_json'])
+        _parsed[account_name] = (fetched_at, books)
+        return books
     except Exception:
         return None
 
@@ -26,6 +49,7 @@ def write_library_cache(account_name: str, books: list) -> None:
     """Upsert books list into cache. Silently swallows errors."""
     try:
         conn = get_db()
+        fetched_at = time.time()
         conn.execute(
             """
             INSERT INTO library_cache (account_name, fetched_at, books_json)
@@ -34,15 +58,17 @@ def write_library_cache(account_name: str, books: list) -> None:
                 fetched_at = excluded.fetched_at,
                 books_json = excluded.books_json
             """,
-            (account_name, time.time(), json.dumps(books))
+            (account_name, fetched_at, json.dumps(books))
         )
         conn.commit()
+        _parsed[account_name] = (fetched_at, books)
     except Exception:
         pass
 
 
 def invalidate_cache(account_name: str) -> None:
     """Delete cache entry for account, silently if missing."""
+    _parsed.pop(account_name, None)
     try:
         conn = get_db()
         conn.execute("DELETE FROM library_cache WHERE account_name = ?", (account_name,))
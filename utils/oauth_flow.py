@@ -5,15 +5,96 @@ Handles the common OAuth authentication flow pattern used across
 regular auth and invitation routes.
 """
 
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import lru_cache
 from pathlib import Path
-from threading import Event, Thread
-from typing import Dict, Any, Callable, Optional, Tuple
+from threading import Event, RLock, Thread
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple
 import audible
-from audible.localization import Locale
+from audible.localization import Locale, search_template
 from utils.constants import get_account_auth_dir
 from utils.config_manager import get_config_manager
 
 
+# Upper bound for how long a status check may hold the request waiting for the login to finish
+MAX_STATUS_WAIT_SECONDS = 25
+
+
+@lru_cache(maxsize=32)
+def locale_for_region(region: str) -> Optional[Locale]:
+    """
+    Build the Audible locale for a country code, memoized per region.
+
+    Args:
+        region: Audible region code (e.g., 'us', 'uk', 'de')
+
+    Returns:
+        Locale for the region, or None if the region is unsupported
+    """
+    template = search_template('country_code', region)
+    return Locale(**template) if template else None
+
+
+class LoginSessionStore(MutableMapping):
+    """
+    Thread-safe dict of OAuth sessions that forgets entries after a TTL.
+
+    Abandoned logins are never popped by check_oauth_status, so a plain dict
+    grows for the life of the process. Entries here expire ``ttl`` seconds
+    after they were last stored, and the oldest are evicted past ``maxsize``.
+    """
+
+    def __init__(self, ttl: float = 900, maxsize: int = 1024):
+        """
+        Args:
+            ttl: Seconds an entry is kept (well above the 5 minute login timeout)
+            maxsize: Maximum number of live entries
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # Insertion order is expiry order, since every entry gets the same TTL
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = RLock()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._data:
+            key, (expires_at, _) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            self._expire()
+            return self._data[key][1]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._expire()
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._expire()
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._data)
+
+
 class OAuthSession:
     """Manages an OAuth login session with Audible."""
 
@@ -42,6 +123,7 @@ class OAuthSession:
         self.additional_data = additional_data or {}
 
         self.login_event = Event()
+        self.login_done = Event()
         self.login_result = {}
 
     def web_login_callback(self, oauth_url: str) -> str:
@@ -61,6 +143,7 @@ class OAuthSession:
         session_data = {
             'oauth_url': oauth_url,
             'event': self.login_event,
+            'done': self.login_done,
             'result': self.login_result,
             'account_name': self.account_name,
             **self.additional_data
@@ -99,6 +182,8 @@ class OAuthSession:
         except Exception as e:
             self.login_result['error'] = str(e)
             self.login_result['success'] = False
+        finally:
+            self.login_done.set()
 
     def start(self):
         """
@@ -134,9 +219,7 @@ def start_oauth_login(
         session_id: Unique session ID for tracking the login process
 
     Example:
-        >>> from audible.localization import Locale, search_template
-        >>> template = search_template('country_code', 'us')
-        >>> locale = Locale(**template)
+        >>> locale = locale_for_region('us')
         >>> session_id = start_oauth_login(
         ...     'my_account',
         ...     locale,
@@ -145,8 +228,8 @@ def start_oauth_login(
         ...     additional_data={'token': 'abc123'}
         ... )
     """
-    # Create unique session ID
-    session_id = f"{session_id_prefix}{account_name}_{len(sessions_storage)}"
+    # Create unique session ID (a counter would repeat once sessions expire)
+    session_id = f"{session_id_prefix}{account_name}_{secrets.token_hex(4)}"
 
     # Create and start OAuth session
     oauth_session = OAuthSession(
@@ -214,18 +297,22 @@ def check_oauth_status(
     session_id: str,
     sessions_storage: Dict[str, Any],
     success_redirect: str,
-    token: Optional[str] = None
+    token: Optional[str] = None,
+    wait: float = 0
 ) -> Tuple[Dict[str, Any], int]:
     """
     Check OAuth login status and return appropriate response.
 
-    Shared handler for both regular auth and invitation flows.
+    Shared handler for both regular auth and invitation flows. With ``wait``
+    the check long-polls: it blocks until the login finishes or the wait
+    runs out, so clients learn the outcome immediately without polling.
 
     Args:
         session_id: The OAuth session ID
         sessions_storage: Storage dict containing session data
         success_redirect: URL to redirect to on successful authentication
         token: Optional invitation token for validation (invitation flow only)
+        wait: Seconds to wait for a pending login (capped at MAX_STATUS_WAIT_SECONDS)
 
     Returns:
         Tuple of (response_dict, status_code)
@@ -248,20 +335,27 @@ def check_oauth_status(
     if token is not None and session_data.get('token') != token:
         return {'error': 'Invalid token'}, 403
 
+    # Most polls land while the user is still logging in
+    done = session_data['done']
+    if not done.is_set():
+        wait = min(max(wait, 0), MAX_STATUS_WAIT_SECONDS)
+        if not (wait and done.wait(wait)):
+            return {'status': 'pending'}, 200
+
     result = session_data['result']
 
     # Check if login completed
     if 'success' in result:
         # Clean up session
-        del sessions_storage[session_id]
+        sessions_storage.pop(session_id, None)
         account_name = session_data['account_name']
 
         if result['success']:
-            # Mark account as authenticated in config
+            # Mark account as authenticated in config (skip the write if it already is)
             config_manager = get_config_manager()
-            accounts = config_manager.get_accounts()
-            accounts[account_name]['authenticated'] = True
-            config_manager.save_accounts(accounts)
+            account = config_manager.get_account(account_name)
+            if account is not None and not account.get('authenticated'):
+                config_manager.update_account(account_name, {'authenticated': True})
 
             return {
                 'success': True,
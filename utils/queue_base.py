@@ -10,13 +10,19 @@ The legacy ``queue_file`` parameter is accepted but ignored — it is kept
 so existing call sites that pass it do not need to be updated.
 """
 
+import threading
 import time
+import uuid
 from abc import ABC, abstractmethod
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from utils.db import get_db, transaction
 
+# Removals remembered so reconnecting watchers can catch up without a full snapshot
+REMOVED_ITEMS_HISTORY = 256
+
 
 class BaseQueueManager(ABC):
     """
@@ -45,6 +51,21 @@ class BaseQueueManager(ABC):
         self._initialized = True
         self._queue: Dict = {}
 
+        # Bumped on every mutation so watchers (SSE streams) can block until
+        # something changes instead of polling
+        self._version = 0
+        self._changed = threading.Condition()
+        # Version at which each item last changed, so watchers can fetch
+        # just the items touched since their last look
+        self._item_versions: Dict[str, int] = {}
+        # Versions restart with the process; the epoch tells watchers whether
+        # a version they saw earlier still refers to this queue
+        self._epoch = uuid.uuid4().hex[:8]
+        self._removed_items: deque = deque(maxlen=REMOVED_ITEMS_HISTORY)
+        self._removed_floor = 0
+        # (version, items) from the last get_all_items() call
+        self._items_snapshot: Optional[tuple] = None
+
         # Populate in-memory cache from DB
         self._load_queue()
 
@@ -161,13 +182,76 @@ class BaseQueueManager(ABC):
                 ),
             )
 
+    def _notify_change(self, item_id: Optional[str] = None) -> None:
+        """Bump the change counter, record which item changed and wake any waiting watchers."""
+        with self._changed:
+            self._version += 1
+            if item_id is not None:
+                self._item_versions[item_id] = self._version
+            self._changed.notify_all()
+
     # ------------------------------------------------------------------
     # Public API (identical signatures to the old JSON-based version)
     # ------------------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Counter that increases whenever the queue changes."""
+        return self._version
+
+    @property
+    def epoch(self) -> str:
+        """Identifier of this process's version sequence."""
+        return self._epoch
+
+    def wait_for_change(self, since_version: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until the queue changes after ``since_version`` or ``timeout`` elapses.
+
+        Returns the current version; equal to ``since_version`` on timeout.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != since_version, timeout)
+            return self._version
+
     def get_all_items(self) -> Dict:
-        """Return all queue items (excluding batch metadata)."""
-        return {k: v for k, v in self._queue.items() if not k.startswith("_")}
+        """
+        Return all queue items (excluding batch metadata).
+
+        The dict is shared by every caller until the queue next changes, so
+        treat it as read-only.
+        """
+        version = self._version
+        snapshot = self._items_snapshot
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot[1]
+        items = {k: v for k, v in self._queue.items() if not k.startswith("_")}
+        self._items_snapshot = (version, items)
+        return items
+
+    def get_items_changed_since(self, since_version: int) -> Dict:
+        """Return the items updated or added after ``since_version``."""
+        with self._changed:
+            changed = [k for k, v in self._item_versions.items() if v > since_version]
+        queue = self._queue
+        return {k: queue[k] for k in changed if k in queue}
+
+    def get_items_removed_since(self, since_version: int) -> Optional[List[str]]:
+        """
+        Return the ids of items removed after ``since_version``.
+
+        Returns None when the removal history no longer reaches back that far
+        (or the version is from the future), in which case callers need a full
+        snapshot instead.
+        """
+        with self._changed:
+            if since_version < self._removed_floor or since_version > self._version:
+                return None
+            return [item_id for version, item_id in self._removed_items if version > since_version]
+
+    def get_item_version(self, item_id: str) -> int:
+        """Return the version at which an item last changed (0 if unchanged since load)."""
+        return self._item_versions.get(item_id, 0)
 
     def get_item(self, item_id: str) -> Optional[Dict]:
         """Return a specific item, or None if not found."""
@@ -181,6 +265,7 @@ class BaseQueueManager(ABC):
         self._queue[item_id].update(updates)
         self._queue[item_id]["last_updated"] = time.time()
         self._save_item(item_id)
+        self._notify_change(item_id)
 
     def add_to_queue(self, item_id: str, title: str, initial_state: str, **metadata) -> None:
         """Add a new item to the queue, starting a new batch if needed."""
@@ -206,6 +291,7 @@ class BaseQueueManager(ABC):
             **metadata,
         }
         self._save_item(item_id)
+        self._notify_change(item_id)
 
     def remove_from_queue(self, item_id: str) -> None:
         """Remove an item from the queue."""
@@ -213,6 +299,8 @@ class BaseQueueManager(ABC):
             del self._queue[item_id]
             with transaction() as conn:
                 conn.execute("DELETE FROM download_queue WHERE asin=?", (item_id,))
+            self._forget_item_versions([item_id])
+            self._notify_change()
 
     def get_batch_info(self) -> Dict:
         """Return current batch metadata."""
@@ -223,6 +311,7 @@ class BaseQueueManager(ABC):
         if "_batch_info" in self._queue:
             self._queue["_batch_info"]["batch_complete"] = True
             self._save_batch()
+            self._notify_change()
 
     def clear_old_items(self, older_than_hours: int = 24) -> int:
         """Remove items from completed batches that are older than the threshold."""
@@ -245,6 +334,8 @@ class BaseQueueManager(ABC):
             with transaction() as conn:
                 for item_id in to_remove:
                     conn.execute("DELETE FROM download_queue WHERE asin=?", (item_id,))
+            self._forget_item_versions(to_remove)
+            self._notify_change()
 
         return len(to_remove)
 
@@ -252,6 +343,17 @@ class BaseQueueManager(ABC):
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _forget_item_versions(self, item_ids) -> None:
+        """Drop change tracking for removed items and log their removal."""
+        with self._changed:
+            # Called just before _notify_change(), so the removal lands in the next version
+            removed_version = self._version + 1
+            for item_id in item_ids:
+                self._item_versions.pop(item_id, None)
+                if len(self._removed_items) == self._removed_items.maxlen:
+                    self._removed_floor = self._removed_items[0][0]
+                self._removed_items.append((removed_version, item_id))
+
     @staticmethod
     def _row_to_item(row) -> Dict:
         """Convert a sqlite3.Row from download_queue to a dict."""
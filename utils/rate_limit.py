@@ -0,0 +1,47 @@
+"""
+Client-side rate limiting for Audible API calls.
+
+Batch downloads issue a license request and a metadata lookup per book.
+Bursting those gets throttled by Audible, and the retries end up slower
+than a steady rate. audible_api_limiter spaces calls out instead.
+"""
+import asyncio
+import threading
+import time
+
+from utils.constants import AUDIBLE_API_MAX_RATE
+
+
+class AsyncRateLimiter:
+    """
+    Async context manager admitting at most ``max_rate`` entries per ``period``.
+
+    Entries are spaced evenly: each caller reserves the next free slot and
+    sleeps until it. Reservations are guarded by a thread lock rather than an
+    asyncio primitive, so one limiter can be shared by coroutines on any loop.
+    """
+
+    def __init__(self, max_rate: float, period: float = 1.0):
+        """
+        Args:
+            max_rate: Entries allowed per period
+            period: Length of the period in seconds
+        """
+        self._interval = period / max_rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+# Shared by every outbound Audible API call
+audible_api_limiter = AsyncRateLimiter(AUDIBLE_API_MAX_RATE)